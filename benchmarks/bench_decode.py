@@ -0,0 +1,152 @@
+"""Benchmark: dict-then-validate vs. validate_json on upstream payloads.
+
+Compares the previous ``response.json()`` + per-item ``model_validate``
+path against the cached ``TypeAdapter.validate_json`` path HingeClient
+now uses, on synthetic but representative payloads:
+
+* a 50-subject ``POST /rec/v2`` feed (old path also validated each
+  subject individually before validating the whole response), and
+* a 20-profile ``GET /user/v2/public`` batch with inline photos/answers.
+
+Run with ``uv run python benchmarks/bench_decode.py [--number N]``.
+"""
+
+import argparse
+import json
+import timeit
+import uuid
+
+from hinge.client import _json_as
+from hinge.models import (
+    RecommendationsResponse,
+    RecommendationSubject,
+    UserProfileV2,
+)
+
+
+def _feed_payload(subjects: int) -> bytes:
+    """A rec/v2 response with ``subjects`` spread over two feeds."""
+    half = subjects // 2
+    feeds = [
+        {
+            "origin": origin,
+            "subjects": [
+                {
+                    "subjectId": uuid.uuid4().hex,
+                    "ratingToken": uuid.uuid4().hex * 4,
+                    "enhancements": {"secondChance": {"secondChanceSource": 1}},
+                }
+                for _ in range(n)
+            ],
+        }
+        for origin, n in (("compatibles", half), ("discover", subjects - half))
+    ]
+    return json.dumps({"feeds": feeds}).encode()
+
+
+def _profile_v2_payload(profiles: int) -> bytes:
+    """A /user/v2/public batch with six photos and three answers each."""
+    users = [
+        {
+            "identityId": uuid.uuid4().hex,
+            "profile": {
+                "age": 29,
+                "firstName": "Alex",
+                "genderId": 1,
+                "height": 172,
+                "location": {
+                    "name": "Zürich",
+                    "latitude": 47.37,
+                    "longitude": 8.54,
+                    "countryShort": "CH",
+                },
+                "selfieVerified": True,
+                "jobTitle": "Engineer",
+                "hometown": "Bern",
+                "educations": ["ETH"],
+                "datingIntention": 2,
+                "drinking": 1,
+                "smoking": 0,
+                "religions": [3],
+                "languagesSpoken": [1, 2],
+                "photos": [
+                    {
+                        "cdnId": uuid.uuid4().hex,
+                        "contentId": uuid.uuid4().hex,
+                        "url": f"https://cdn.example/{i}.jpg",
+                        "width": 1080,
+                        "height": 1350,
+                        "boundingBox": {
+                            "topLeft": {"x": 0.1, "y": 0.1},
+                            "bottomRight": {"x": 0.9, "y": 0.9},
+                        },
+                    }
+                    for i in range(6)
+                ],
+                "answers": [
+                    {
+                        "contentId": uuid.uuid4().hex,
+                        "position": i,
+                        "questionId": uuid.uuid4().hex,
+                        "response": "A reasonably long prompt answer " * 3,
+                        "transcriptionMetadata": {},
+                    }
+                    for i in range(3)
+                ],
+            },
+        }
+        for _ in range(profiles)
+    ]
+    return json.dumps(users).encode()
+
+
+def _old_feed(raw: bytes) -> RecommendationsResponse:
+    data = json.loads(raw)
+    for feed in data["feeds"]:
+        for subject in feed["subjects"]:
+            subject["origin"] = feed["origin"]
+            RecommendationSubject.model_validate(subject)
+    return RecommendationsResponse.model_validate(data)
+
+
+def _old_profiles(raw: bytes) -> list[UserProfileV2]:
+    return [UserProfileV2.model_validate(u) for u in json.loads(raw)]
+
+
+def _bench(name: str, old, new, raw: bytes, number: int) -> None:  # noqa: ANN001
+    assert old(raw) == new(raw), f"{name}: paths disagree"
+    t_old = min(timeit.repeat(lambda: old(raw), number=number, repeat=5))
+    t_new = min(timeit.repeat(lambda: new(raw), number=number, repeat=5))
+    per_old = t_old / number * 1e6
+    per_new = t_new / number * 1e6
+    print(
+        f"{name:<28} {len(raw) / 1024:7.1f} KiB  "
+        f"old {per_old:8.1f} µs  new {per_new:8.1f} µs  "
+        f"speedup {per_old / per_new:4.2f}x",
+    )
+
+
+def main() -> None:
+    """Run both benchmarks and print per-call timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    _bench(
+        "rec/v2 feed (50 subjects)",
+        _old_feed,
+        _json_as(RecommendationsResponse),
+        _feed_payload(50),
+        args.number,
+    )
+    _bench(
+        "user/v2/public (20 profiles)",
+        _old_profiles,
+        _json_as(list[UserProfileV2]),
+        _profile_v2_payload(20),
+        args.number,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,8 +11,11 @@ from hinge.infrastructure.db.tables import (  # noqa: F401
     chat_message,
     decision,
     profile,
+    profile_content,
+    rating_token,
     scan_run,
     session,
+    sync_state,
 )
 from hinge.infrastructure.db.metadata import metadata
 
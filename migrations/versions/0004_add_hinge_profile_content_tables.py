@@ -0,0 +1,117 @@
+"""add hinge profile content tables
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: str | Sequence[str] | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _subject_fk() -> sa.ForeignKeyConstraint:
+    return sa.ForeignKeyConstraint(
+        ["subject_id"],
+        ["hinge_profiles.subject_id"],
+        ondelete="CASCADE",
+    )
+
+
+def upgrade() -> None:
+    """Add child tables for profile photos, prompts, polls, videos, date ideas.
+
+    These fields were excluded from the ``HingeProfile`` mapping, so every
+    profile loaded from the DB arrived empty and had to be re-hydrated from
+    the API. Each table is keyed by ``(subject_id, sort_order)`` except the
+    single video prompt, which is keyed by ``subject_id`` alone.
+    """
+    op.create_table(
+        "hinge_profile_photos",
+        sa.Column("subject_id", sa.String(), nullable=False),
+        sa.Column("sort_order", sa.Integer(), nullable=False),
+        sa.Column("content_id", sa.String(), nullable=False),
+        sa.Column("cdn_id", sa.String(), nullable=False),
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("width", sa.Integer(), nullable=True),
+        sa.Column("height", sa.Integer(), nullable=True),
+        sa.Column("p_hash", sa.String(), nullable=True),
+        sa.Column("selfie_verified", sa.Boolean(), nullable=False),
+        sa.Column("video_url", sa.String(), nullable=True),
+        sa.Column("videos", sa.Text(), nullable=False),
+        sa.Column("caption", sa.String(), nullable=True),
+        sa.Column("location", sa.String(), nullable=True),
+        sa.Column("prompt_id", sa.String(), nullable=True),
+        _subject_fk(),
+        sa.PrimaryKeyConstraint("subject_id", "sort_order"),
+    )
+    op.create_table(
+        "hinge_profile_prompts",
+        sa.Column("subject_id", sa.String(), nullable=False),
+        sa.Column("sort_order", sa.Integer(), nullable=False),
+        sa.Column("question_id", sa.String(), nullable=False),
+        sa.Column("question_text", sa.String(), nullable=False),
+        sa.Column("response", sa.String(), nullable=True),
+        sa.Column("content_type", sa.String(), nullable=False),
+        sa.Column("content_id", sa.String(), nullable=True),
+        sa.Column("position", sa.Integer(), nullable=True),
+        sa.Column("audio_url", sa.String(), nullable=True),
+        sa.Column("waveform", sa.String(), nullable=True),
+        sa.Column("transcription", sa.String(), nullable=True),
+        sa.Column("video_url", sa.String(), nullable=True),
+        sa.Column("thumbnail_url", sa.String(), nullable=True),
+        _subject_fk(),
+        sa.PrimaryKeyConstraint("subject_id", "sort_order"),
+    )
+    op.create_table(
+        "hinge_profile_polls",
+        sa.Column("subject_id", sa.String(), nullable=False),
+        sa.Column("sort_order", sa.Integer(), nullable=False),
+        sa.Column("content_id", sa.String(), nullable=False),
+        sa.Column("question_id", sa.String(), nullable=False),
+        sa.Column("question_text", sa.String(), nullable=False),
+        sa.Column("options", sa.Text(), nullable=False),
+        sa.Column("selected_option_index", sa.Integer(), nullable=True),
+        _subject_fk(),
+        sa.PrimaryKeyConstraint("subject_id", "sort_order"),
+    )
+    op.create_table(
+        "hinge_profile_video_prompts",
+        sa.Column("subject_id", sa.String(), nullable=False),
+        sa.Column("content_id", sa.String(), nullable=False),
+        sa.Column("question_id", sa.String(), nullable=True),
+        sa.Column("question_text", sa.String(), nullable=False),
+        sa.Column("video_url", sa.String(), nullable=True),
+        sa.Column("thumbnail_url", sa.String(), nullable=True),
+        sa.Column("cdn_id", sa.String(), nullable=True),
+        _subject_fk(),
+        sa.PrimaryKeyConstraint("subject_id"),
+    )
+    op.create_table(
+        "hinge_profile_date_ideas",
+        sa.Column("subject_id", sa.String(), nullable=False),
+        sa.Column("sort_order", sa.Integer(), nullable=False),
+        sa.Column("content_id", sa.String(), nullable=False),
+        sa.Column("question_id", sa.String(), nullable=True),
+        sa.Column("question_text", sa.String(), nullable=False),
+        sa.Column("options", sa.Text(), nullable=False),
+        _subject_fk(),
+        sa.PrimaryKeyConstraint("subject_id", "sort_order"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the profile content tables."""
+    op.drop_table("hinge_profile_date_ideas")
+    op.drop_table("hinge_profile_video_prompts")
+    op.drop_table("hinge_profile_polls")
+    op.drop_table("hinge_profile_prompts")
+    op.drop_table("hinge_profile_photos")
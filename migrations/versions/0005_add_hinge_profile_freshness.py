@@ -0,0 +1,36 @@
+"""add hinge profile freshness timestamps
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:01.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: str | Sequence[str] | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add content/demographics refresh timestamps to hinge_profiles.
+
+    Existing rows stay NULL, which the hydration TTL policy treats as
+    stale — they are refreshed once on the next page view.
+    """
+    with op.batch_alter_table("hinge_profiles") as batch:
+        batch.add_column(sa.Column("content_refreshed_at", sa.DateTime()))
+        batch.add_column(sa.Column("demographics_refreshed_at", sa.DateTime()))
+
+
+def downgrade() -> None:
+    """Drop the refresh timestamps."""
+    with op.batch_alter_table("hinge_profiles") as batch:
+        batch.drop_column("demographics_refreshed_at")
+        batch.drop_column("content_refreshed_at")
@@ -0,0 +1,60 @@
+"""add hinge rating tokens table
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 00:00:02.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: str | Sequence[str] | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the subject_id → rating_token store.
+
+    Replaces the per-session ``recommendations_<session>.json`` file and
+    the in-memory standouts token map. Tokens already persisted on
+    ``hinge_profiles`` are copied over so likes/skips keep working for
+    profiles fetched before the upgrade.
+    """
+    op.create_table(
+        "hinge_rating_tokens",
+        sa.Column("subject_id", sa.String(), nullable=False),
+        sa.Column("rating_token", sa.String(), nullable=False),
+        sa.Column(
+            "origin",
+            sa.String(),
+            nullable=False,
+            server_default="discover",
+        ),
+        sa.Column("expires_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("subject_id"),
+    )
+    # Older migrations never added these columns to hinge_profiles (they
+    # only exist on databases created from metadata), so backfill only
+    # when they are present.
+    inspector = sa.inspect(op.get_bind())
+    columns = {c["name"] for c in inspector.get_columns("hinge_profiles")}
+    if {"rating_token", "origin"} <= columns:
+        op.execute(
+            "INSERT INTO hinge_rating_tokens (subject_id, rating_token, origin, "
+            "updated_at) "
+            "SELECT subject_id, rating_token, COALESCE(origin, 'discover'), "
+            "CURRENT_TIMESTAMP FROM hinge_profiles "
+            "WHERE rating_token IS NOT NULL AND rating_token != ''",
+        )
+
+
+def downgrade() -> None:
+    """Drop the rating token store."""
+    op.drop_table("hinge_rating_tokens")
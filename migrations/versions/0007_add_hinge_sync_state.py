@@ -0,0 +1,34 @@
+"""add hinge sync state table
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 00:00:03.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: str | Sequence[str] | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the key/value store for incremental sync resume tokens."""
+    op.create_table(
+        "hinge_sync_state",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("value", sa.String(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the sync state store."""
+    op.drop_table("hinge_sync_state")
@@ -2,11 +2,11 @@
 
 import asyncio
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy import desc, select
 
 from hinge.core.logging_config import logger as log
-from hinge.api.deps import get_hinge_container, require_hinge_auth
+from hinge.api.deps import get_hinge_container, mark_stale, require_hinge_auth
 from hinge.api.schemas import HingeDashboardResponse
 from hinge.application.services.rejection_scan import (
     exhaust_feed,
@@ -21,12 +21,14 @@ router = APIRouter(prefix="/analytics", tags=["hinge-analytics"])
 
 @router.get("/dashboard", response_model=HingeDashboardResponse)
 async def get_dashboard(
+    response: Response,
     container: HingeContainer = Depends(get_hinge_container),
 ) -> HingeDashboardResponse:
     """Dashboard metrics (total seen, liked, skipped, match rate).
 
     ``total_likes`` is the aggregate of ALL outgoing engagement actions
-    (plain likes + notes + superlikes/roses).
+    (plain likes + notes + superlikes/roses). While Hinge is degraded
+    live limits are skipped and the response carries ``X-Upstream-Stale``.
     """
     with container.uow as uow:
         total_profiles = uow.profiles.count()
@@ -42,15 +44,18 @@ async def get_dashboard(
     total_likes = plain_likes + total_notes + total_superlikes
     match_rate = (total_matches / total_likes * 100) if total_likes > 0 else 0.0
 
-    # Try to get live limits
+    # Try to get live limits (skipped outright while Hinge is degraded)
     likes_remaining = None
     superlikes_remaining = None
-    try:
-        limit = await container.hinge_api.get_like_limit()
-        likes_remaining = limit.likes_left
-        superlikes_remaining = limit.superlikes_left
-    except Exception:
-        pass
+    if container._client.upstream_degraded():
+        mark_stale(response)
+    else:
+        try:
+            limit = await container.hinge_api.get_like_limit()
+            likes_remaining = limit.likes_left
+            superlikes_remaining = limit.superlikes_left
+        except Exception:
+            pass
 
     log.info(
         "dashboard_loaded",
@@ -152,7 +157,12 @@ async def get_rejection_scan_status(
 
     Includes live progress during active scans and recent run history.
     """
-    base = {"interval_hours": DEFAULT_INTERVAL_HOURS}
+    base = {
+        "interval_hours": DEFAULT_INTERVAL_HOURS,
+        "rate_governor": container._client.governor.snapshot(),
+        "circuit_breakers": container._client.breaker_snapshots(),
+        "classifying": scan_state.classifying,
+    }
     recent = _get_recent_runs(container)
 
     if scan_state.running and scan_state.current_run is not None:
@@ -8,6 +8,7 @@ from pydantic import BaseModel
 
 from hinge.core.logging_config import logger as log
 from hinge.api.deps import get_hinge_container
+from hinge.api.recommendations import reset_account_states
 from hinge.application.services.sendbird_ws import SendbirdWsBridge
 from hinge.bootstrap import HingeContainer
 from hinge.client import HingeClient
@@ -166,6 +167,7 @@ async def connect(
     if body.phone_number != client.phone_number:
         log.info("auth_session_switch", phone=body.phone_number)
         client.switch_session(body.phone_number)
+        reset_account_states()
 
     log.info("auth_connect_start", phone=client.phone_number)
     try:
@@ -320,6 +322,7 @@ async def switch_session(
 ) -> dict:
     """Switch active session to a different phone number."""
     container._client.switch_session(body.phone_number)
+    reset_account_states()
     client = container._client
     connected = bool(
         client.hinge_token,
@@ -8,18 +8,22 @@ persistent Sendbird WebSocket bridge.
 
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel, ConfigDict
 
 from hinge.core.logging_config import logger as log
-from hinge.api.deps import require_hinge_auth
+from hinge.api.deps import mark_stale, require_hinge_auth
+from hinge.application.services.chat_backfill_service import (
+    BackfillResult,
+    ChatBackfillService,
+)
 from hinge.application.services.chat_sync_service import ChatSyncService, SyncResult
 from hinge.bootstrap import HingeContainer
+from hinge.client import HingeClient
 from hinge.domain.models.chat_channel import HingeChatChannel
 
 router = APIRouter(prefix="/chat", tags=["hinge-chat"])
 
-
 # ---------------------------------------------------------------------------
 # Schemas
 # ---------------------------------------------------------------------------
@@ -108,6 +112,22 @@ class ChannelSyncStatus(BaseModel):
     last_result: SyncResultOut | None
 
 
+class BackfillResultOut(BaseModel):
+    """Result of a chat history backfill run."""
+
+    channels_completed: int
+    channels_pending: int
+    messages_upserted: int
+    duration_ms: int
+
+
+class BackfillStatus(BaseModel):
+    """Status of the background chat history backfill."""
+
+    last_run_at: datetime | None
+    last_result: BackfillResultOut | None
+
+
 class SendMessageRequest(BaseModel):
     """Request body for sending a message."""
 
@@ -172,6 +192,23 @@ def _require_chat_sync(container: HingeContainer) -> ChatSyncService:
     return chat_sync
 
 
+def _require_chat_backfill(container: HingeContainer) -> ChatBackfillService:
+    """Raise 503 if the chat backfill service is not wired."""
+    chat_backfill = getattr(container, "chat_backfill", None)
+    if chat_backfill is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Chat backfill service not running",
+        )
+    return chat_backfill
+
+
+def _flag_stale(container: HingeContainer, response: Response) -> None:
+    """Mark a DB-mirror response stale while Sendbird is degraded."""
+    if container._client.upstream_degraded(HingeClient.SENDBIRD_REST_HOST):
+        mark_stale(response)
+
+
 def _to_sync_result(result: SyncResult | None) -> SyncResultOut | None:
     if result is None:
         return None
@@ -183,6 +220,17 @@ def _to_sync_result(result: SyncResult | None) -> SyncResultOut | None:
     )
 
 
+def _to_backfill_result(result: BackfillResult | None) -> BackfillResultOut | None:
+    if result is None:
+        return None
+    return BackfillResultOut(
+        channels_completed=result.channels_completed,
+        channels_pending=result.channels_pending,
+        messages_upserted=result.messages_upserted,
+        duration_ms=result.duration_ms,
+    )
+
+
 def _build_channel_out(
     channel: HingeChatChannel,
     container: HingeContainer,
@@ -238,6 +286,33 @@ async def trigger_sync(
     return _to_sync_result(result)  # type: ignore[return-value]
 
 
+@router.get("/backfill", response_model=BackfillStatus)
+async def get_backfill_status(
+    container: HingeContainer = Depends(require_hinge_auth),
+) -> BackfillStatus:
+    """Return the state of the chat history backfill."""
+    chat_backfill = _require_chat_backfill(container)
+    return BackfillStatus(
+        last_run_at=chat_backfill.last_run_at,
+        last_result=_to_backfill_result(chat_backfill.last_result),
+    )
+
+
+@router.post("/backfill", response_model=BackfillResultOut)
+async def trigger_backfill(
+    container: HingeContainer = Depends(require_hinge_auth),
+) -> BackfillResultOut:
+    """Run the chat history backfill inline and return the result.
+
+    Resumes from stored checkpoints, so this only pages channels whose
+    history is not fully mirrored yet.
+    """
+    _require_sendbird(container)
+    chat_backfill = _require_chat_backfill(container)
+    result = await chat_backfill.run()
+    return _to_backfill_result(result)  # type: ignore[return-value]
+
+
 # ---------------------------------------------------------------------------
 # Conversations (DB-backed)
 # ---------------------------------------------------------------------------
@@ -245,10 +320,12 @@ async def trigger_sync(
 
 @router.get("/conversations", response_model=list[ChannelOut])
 async def get_conversations(
+    response: Response,
     include_orphans: bool = Query(default=True),
     container: HingeContainer = Depends(require_hinge_auth),
 ) -> list[ChannelOut]:
     """List mirrored chat channels, newest activity first."""
+    _flag_stale(container, response)
     with container.uow as uow:
         channels = uow.chat.get_channels(include_orphans=include_orphans)
     return [_build_channel_out(c, container) for c in channels]
@@ -305,11 +382,13 @@ async def get_channel(
 @router.get("/{channel_url}/messages", response_model=list[MessageOut])
 async def get_messages(
     channel_url: str,
+    response: Response,
     limit: int = Query(default=100, ge=1, le=500),
     before: datetime | None = Query(default=None),
     container: HingeContainer = Depends(require_hinge_auth),
 ) -> list[MessageOut]:
     """Fetch mirrored message history for a channel, newest first."""
+    _flag_stale(container, response)
     with container.uow as uow:
         messages = uow.chat.get_messages(
             channel_url,
@@ -2,13 +2,19 @@
 
 from datetime import datetime, timezone
 
+from fastapi import Depends, Response
+
 from hinge.core.logging_config import logger as log
 from hinge.bootstrap import HingeContainer
 from hinge.client import HingeClient
+from hinge.core.deadline import Deadline
 from hinge.error import HingeSessionExpiredError
 
 _container: HingeContainer | None = None
 
+# Set on responses served from the DB mirror while an upstream is degraded.
+STALE_HEADER = "X-Upstream-Stale"
+
 
 def set_hinge_container(container: HingeContainer) -> None:
     """Set the global Hinge container (called at startup)."""
@@ -23,6 +29,11 @@ def get_hinge_container() -> HingeContainer:
     return _container
 
 
+def mark_stale(response: Response) -> None:
+    """Flag ``response`` as served from the DB mirror without upstream."""
+    response.headers[STALE_HEADER] = "true"
+
+
 def _is_authenticated(client: HingeClient) -> bool:
     return (
         client.auth_state == HingeClient.AUTH_AUTHENTICATED
@@ -47,10 +58,17 @@ async def require_hinge_auth() -> HingeContainer:
 
     if not _is_authenticated(client):
         # Reload session from disk — file may have been updated externally
-        client._load_or_create_session()
+        client.reload_session()
         if _is_authenticated(client):
             log.info("session_reloaded_from_disk")
         else:
             raise HingeSessionExpiredError
 
     return container
+
+
+async def request_deadline(
+    container: HingeContainer = Depends(require_hinge_auth),
+) -> Deadline:
+    """Start the per-request budget for upstream batch calls."""
+    return Deadline(container.route_deadline)
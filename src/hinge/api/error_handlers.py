@@ -5,7 +5,11 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from hinge.core.logging_config import logger as log
-from hinge.error import HingeAuthError, HingeSessionExpiredError
+from hinge.error import (
+    HingeAuthError,
+    HingeSessionExpiredError,
+    HingeUpstreamUnavailableError,
+)
 
 
 def register_hinge_error_handlers(app: FastAPI) -> None:
@@ -44,6 +48,21 @@ def register_hinge_error_handlers(app: FastAPI) -> None:
             },
         )
 
+    @app.exception_handler(HingeUpstreamUnavailableError)
+    async def _hinge_upstream_unavailable(
+        _request: Request,
+        exc: HingeUpstreamUnavailableError,
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+            content={
+                "success": False,
+                "error": str(exc),
+                "upstream_host": exc.host,
+            },
+        )
+
     @app.exception_handler(httpx.HTTPStatusError)
     async def _httpx_status_error(
         request: Request,
@@ -0,0 +1,61 @@
+"""Concurrent fan-out helpers for routes that issue independent upstream calls.
+
+Routes wrap non-critical calls (standouts badges, own location, like
+limits) in ``optional`` and ``asyncio.gather`` them with whatever they
+actually need, so latency is bounded by the slowest call rather than the
+sum, and a slow or failing extra degrades to its default instead of
+failing the response.
+"""
+
+import asyncio
+from collections.abc import Awaitable
+
+from hinge.bootstrap import HingeContainer
+from hinge.core.logging_config import logger as log
+
+# Per-call ceiling for optional upstream fetches (seconds).
+DEFAULT_OPTIONAL_TIMEOUT = 5.0
+
+
+async def optional[T](
+    aw: Awaitable[T],
+    *,
+    default: T,
+    name: str,
+    timeout: float = DEFAULT_OPTIONAL_TIMEOUT,
+) -> T:
+    """Await ``aw`` with a timeout, returning ``default`` on failure.
+
+    Timeouts and errors are logged under ``name`` and swallowed so the
+    caller can render a partial result.
+    """
+    try:
+        return await asyncio.wait_for(aw, timeout)
+    except TimeoutError:
+        log.warning("fanout_call_timed_out", call=name, timeout=timeout)
+    except Exception:  # noqa: BLE001 — optional call, degrade to default
+        log.warning("fanout_call_failed", call=name, exc_info=True)
+    return default
+
+
+async def user_location(
+    container: HingeContainer,
+) -> tuple[float | None, float | None]:
+    """Return the account's own ``(lat, lon)`` for distance computation."""
+    self_profile = await container._client.get_self_profile()
+    loc = self_profile.profile.location
+    return loc.latitude, loc.longitude
+
+
+async def optional_user_location(
+    container: HingeContainer,
+    *,
+    timeout: float = DEFAULT_OPTIONAL_TIMEOUT,
+) -> tuple[float | None, float | None]:
+    """``user_location`` wrapped in ``optional`` — ``(None, None)`` on failure."""
+    return await optional(
+        user_location(container),
+        default=(None, None),
+        name="self_location",
+        timeout=timeout,
+    )
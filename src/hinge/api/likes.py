@@ -1,10 +1,13 @@
 """Hinge incoming likes + standouts endpoints."""
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from hinge.core.logging_config import logger as log
-from hinge.api.deps import require_hinge_auth
+from hinge.api.deps import request_deadline, require_hinge_auth
+from hinge.api.fanout import optional_user_location
 from hinge.api.recommendations import _profile_to_encounter
 from hinge.api.schemas import (
     HiddenLikeOut,
@@ -19,8 +22,10 @@ from hinge.api.schemas import (
     StandoutHighlight,
 )
 from hinge.bootstrap import HingeContainer
+from hinge.core.deadline import Deadline
 from hinge.domain.models.decision import HingeDecision
 from hinge.domain.models.profile import HingeProfile
+from hinge.domain.models.rating_token import HingeRatingToken
 from hinge.models import LikeImpression
 
 router = APIRouter(prefix="/likes", tags=["hinge-likes"])
@@ -73,8 +78,13 @@ def _build_like_impression(
 async def get_incoming_likes(
     sort: str | None = Query(default=None),
     container: HingeContainer = Depends(require_hinge_auth),
+    deadline: Deadline = Depends(request_deadline),
 ) -> HingeLikesYouResponse:
-    """Get profiles who liked you with sort options and hidden likes."""
+    """Get profiles who liked you with sort options and hidden likes.
+
+    Profiles whose batch misses the request deadline are returned
+    without hydrated data rather than holding up the whole list.
+    """
     api_sort = _SORT_KEY_MAP.get(sort, sort) if sort else None
     data = await container._client.get_likes_received(sort=api_sort)
 
@@ -83,6 +93,7 @@ async def get_incoming_likes(
     profiles_map = (
         await container.hinge_api.get_profiles_quick(
             subject_ids,
+            deadline=deadline,
         )
         if subject_ids
         else {}
@@ -158,9 +169,13 @@ async def get_standouts(
 
     paid_ids = {s.subject_id for s in response.paid}
 
-    # Hydrate standout subjects into full profiles
+    # Hydrate standout subjects into full profiles; own location (for
+    # distance) is fetched alongside and is allowed to fail.
     subject_ids = [s.subject_id for s in all_subjects]
-    profiles_map = await container.hinge_api.get_profiles_quick(subject_ids)
+    profiles_map, (user_lat, user_lon) = await asyncio.gather(
+        container.hinge_api.get_profiles_quick(subject_ids),
+        optional_user_location(container),
+    )
 
     # Cross-reference: check which standouts are also in discover feed
     with container.uow as uow:
@@ -177,17 +192,6 @@ async def get_standouts(
                 prompt_id=s.content.photo.prompt_id,
             )
 
-    # Get user's own location for distance
-    user_lat: float | None = None
-    user_lon: float | None = None
-    try:
-        self_profile = await container._client.get_self_profile()
-        loc = self_profile.profile.location
-        user_lat = loc.latitude
-        user_lon = loc.longitude
-    except Exception:
-        pass
-
     standouts: list[HingeStandoutEncounterOut] = []
     for sid in subject_ids:
         profile = profiles_map.get(sid)
@@ -210,8 +214,20 @@ async def get_standouts(
             ),
         )
 
-    # Cache rating tokens for skip endpoint
-    container._client._standout_tokens = token_map
+    # Store rating tokens for the skip endpoint
+    with container.uow as uow:
+        uow.tokens.upsert_many(
+            [
+                HingeRatingToken(
+                    sid,
+                    token,
+                    "standouts",
+                    expires_at=response.expiration,
+                )
+                for sid, token in token_map.items()
+            ],
+        )
+        uow.commit()
 
     log.info("standouts_loaded", count=len(standouts))
     return HingeStandoutsResponse(
@@ -234,11 +250,12 @@ async def skip_standout(
     container: HingeContainer = Depends(require_hinge_auth),
 ) -> HingeLikeResponse:
     """Skip a standout profile via the standard rating endpoint."""
-    # Look up rating_token: body > cached from GET /standouts
+    # Look up rating_token: body > token store (filled by GET /standouts)
     token = body.rating_token if body and body.rating_token else None
     if not token:
-        cached = getattr(container._client, "_standout_tokens", {})
-        token = cached.get(subject_id)
+        with container.uow as uow:
+            stored = uow.tokens.get(subject_id)
+        token = stored.rating_token if stored else None
     if not token:
         raise HTTPException(
             status_code=400,
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 
 from hinge.core.logging_config import logger as log
 from hinge.api.deps import require_hinge_auth
+from hinge.api.fanout import optional_user_location
 from hinge.api.recommendations import _profile_to_encounter
 from hinge.api.schemas import (
     AnswerUpdateItem,
@@ -356,8 +357,10 @@ async def get_profile(
     container: HingeContainer = Depends(require_hinge_auth),
 ) -> HingeEncounterOut:
     """Fetch fresh profile + content from Hinge (single v2 call) and update DB."""
-    profiles_map = await container.hinge_api.get_profiles_quick(
-        [subject_id],
+    # Own location (for distance) is independent — fetch it alongside.
+    profiles_map, (user_lat, user_lon) = await asyncio.gather(
+        container.hinge_api.get_profiles_quick([subject_id]),
+        optional_user_location(container),
     )
     profile = profiles_map.get(subject_id)
 
@@ -376,21 +379,11 @@ async def get_profile(
             existing.times_seen += 1
             uow.commit()
 
-    # Look up rating token from client state
-    rec_info = container._client.recommendations.get(subject_id)
-    rating_token = rec_info.rating_token if rec_info else ""
-    origin = rec_info.origin if rec_info else (profile.source or "discover")
-
-    # Get user's own location for distance
-    user_lat: float | None = None
-    user_lon: float | None = None
-    try:
-        self_profile = await container._client.get_self_profile()
-        loc = self_profile.profile.location
-        user_lat = loc.latitude
-        user_lon = loc.longitude
-    except Exception:
-        pass
+    # Look up rating token from the token store
+    with container.uow as uow:
+        token = uow.tokens.get(subject_id)
+    rating_token = token.rating_token if token else ""
+    origin = token.origin if token else (profile.source or "discover")
 
     log.info("profile_fetched", subject_id=subject_id[:12])
     return _profile_to_encounter(
@@ -2,12 +2,14 @@
 
 import asyncio
 import math
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
 from hinge.core.logging_config import logger as log
-from hinge.api.deps import require_hinge_auth
+from hinge.api.deps import mark_stale, request_deadline, require_hinge_auth
+from hinge.api.fanout import optional, optional_user_location
 from hinge.api.schemas import (
     ContentItemOut,
     DateIdeaOut,
@@ -21,10 +23,13 @@ from hinge.api.schemas import (
     VideoDetailOut,
     VideoPromptOut,
 )
+from hinge.api.websocket import broadcast
 from hinge.bootstrap import HingeContainer
+from hinge.core.deadline import Deadline
 from hinge.domain import enums
 from hinge.domain.models.decision import HingeDecision
 from hinge.domain.models.profile import HingeProfile
+from hinge.error import HingeUpstreamUnavailableError
 from hinge.infrastructure.hinge.adapter import _copy_demographics
 
 router = APIRouter(prefix="/recommendations", tags=["hinge-recommendations"])
@@ -295,6 +300,7 @@ async def _fetch_and_persist(container: HingeContainer) -> int:
     new_count = 0
     updated_count = 0
     skipped_decided = 0
+    hydrated: list[HingeProfile] = []
     with container.uow as uow:
         decided = uow.decisions.decided_subject_ids(subject_ids)
         for rec in recs:
@@ -309,6 +315,7 @@ async def _fetch_and_persist(container: HingeContainer) -> int:
             profile.origin = rec.origin
             profile.is_second_chance = rec.is_second_chance
             profile.second_chance_source = rec.second_chance_source
+            hydrated.append(profile)
             existing = uow.profiles.get(rec.subject_id)
             if existing:
                 existing.last_seen_at = datetime.now(timezone.utc)
@@ -318,10 +325,13 @@ async def _fetch_and_persist(container: HingeContainer) -> int:
                 existing.is_second_chance = rec.is_second_chance
                 existing.second_chance_source = rec.second_chance_source
                 _copy_demographics(existing, profile)
+                existing.demographics_refreshed_at = profile.demographics_refreshed_at
+                existing.content_refreshed_at = profile.content_refreshed_at
                 updated_count += 1
             else:
                 uow.profiles.add(profile)
                 new_count += 1
+        uow.profiles.save_content(hydrated)
         uow.commit()
 
     log.info(
@@ -334,88 +344,135 @@ async def _fetch_and_persist(container: HingeContainer) -> int:
     return len(recs)
 
 
-@router.get("/", response_model=HingeRecommendationsResponse)
-async def get_recommendations(  # noqa: C901 — top-level route orchestrates several flows
-    refresh: bool = Query(default=False),
-    container: HingeContainer = Depends(require_hinge_auth),
-) -> HingeRecommendationsResponse:
-    """Return all undecided Hinge profiles from DB.
+@dataclass
+class _RenderContext:
+    """Upstream-derived inputs for rendering encounters (besides profiles)."""
 
-    Pass ``?refresh=true`` to fetch a fresh batch from Hinge upstream
-    first, hydrate, persist, then return the full undecided queue.
-    """
-    total_fetched = 0
+    standout_ids: set[str] = field(default_factory=set)
+    user_lat: float | None = None
+    user_lon: float | None = None
+    likes_left: int | None = None
+    superlikes_left: int | None = None
 
-    # Prompts are loaded lazily on first profile-render path by the adapter.
 
-    if refresh:
-        total_fetched = await _fetch_and_persist(container)
+@dataclass
+class _AccountState:
+    """Stale-while-revalidate state for one Hinge account."""
 
-    # Load ALL undecided profiles from DB and hydrate content from API
+    # Last context fetched from upstream — lets stale renders show
+    # standout badges, distances and limits without waiting on Hinge.
+    context: _RenderContext = field(default_factory=_RenderContext)
+    revalidation: asyncio.Task[None] | None = None
+
+
+_account_states: dict[str, _AccountState] = {}
+
+
+def _account_key(container: HingeContainer) -> str:
+    """Identify the account the client is currently authenticated as."""
+    client = container._client
+    return client.identity_id or client.phone_number or ""
+
+
+def _account_state(container: HingeContainer) -> _AccountState:
+    return _account_states.setdefault(_account_key(container), _AccountState())
+
+
+def reset_account_states() -> None:
+    """Forget every account's render context and cancel revalidations.
+
+    Called when the client switches session, so nothing computed for
+    the previous account is served or broadcast afterwards.
+    """
+    for state in _account_states.values():
+        if state.revalidation is not None:
+            state.revalidation.cancel()
+    _account_states.clear()
+
+
+def _load_undecided(container: HingeContainer) -> list[HingeProfile]:
+    """Load ALL undecided profiles with their stored content from DB."""
     with container.uow as uow:
         all_profiles = uow.profiles.get_undecided()
+        uow.profiles.load_content(all_profiles)
+    return all_profiles
 
-    if all_profiles:
-        try:
-            await container.hinge_api.refresh_demographics(all_profiles)
-        except Exception:
-            log.warning(
-                "demographics_refresh_failed",
-                count=len(all_profiles),
-                exc_info=True,
-            )
-        try:
-            await container.hinge_api.hydrate_profiles(all_profiles)
-        except Exception:
-            log.warning(
-                "hydrate_failed",
-                count=len(all_profiles),
-                exc_info=True,
-            )
 
-    # Build rating_token lookup from client state
-    rec_state = container._client.recommendations
-
-    # Cross-reference with standouts (ETag-cached, cheap)
-    standout_ids: set[str] = set()
+async def _revalidate_profiles(
+    container: HingeContainer,
+    all_profiles: list[HingeProfile],
+    deadline: Deadline | None = None,
+) -> None:
+    """Re-fetch profiles past their freshness TTL and persist what changed.
+
+    Other upstream errors leave the stored profiles as they are, but
+    ``HingeUpstreamUnavailableError`` propagates so the caller can serve
+    the queue flagged stale.
+    """
+    if not all_profiles:
+        return
+    content_stamps = {p.subject_id: p.content_refreshed_at for p in all_profiles}
     try:
-        standouts_resp = await container._client.get_standouts_v3()
-        if standouts_resp:
-            standout_ids = {s.subject_id for s in standouts_resp.standouts}
+        refreshed = await container.hinge_api.refresh_and_hydrate(
+            all_profiles,
+            deadline=deadline,
+        )
+    except HingeUpstreamUnavailableError:
+        raise
     except Exception:
-        pass  # non-critical
+        log.warning(
+            "hydrate_failed",
+            count=len(all_profiles),
+            exc_info=True,
+        )
+        return
+    if not refreshed:
+        return
+    new_content = [
+        p
+        for p in refreshed
+        if p.content_refreshed_at != content_stamps.get(p.subject_id)
+    ]
+    with container.uow as uow:
+        for p in refreshed:
+            uow.profiles.add(p)
+        uow.profiles.save_content(new_content)
+        uow.commit()
 
-    # Get user's own location for distance computation
-    user_lat: float | None = None
-    user_lon: float | None = None
-    try:
-        self_profile = await container._client.get_self_profile()
-        loc = self_profile.profile.location
-        user_lat = loc.latitude
-        user_lon = loc.longitude
-    except Exception:
-        pass  # non-critical
 
-    # Write-through: sync in-memory tokens to DB for skip/like
-    tokens_to_sync: list[tuple[str, str, str]] = []
-    for p in all_profiles:
-        rec_info = rec_state.get(p.subject_id)
-        if (
-            rec_info
-            and rec_info.rating_token
-            and p.rating_token != rec_info.rating_token
-        ):
-            tokens_to_sync.append(
-                (p.subject_id, rec_info.rating_token, rec_info.origin or "discover"),
-            )
-    if tokens_to_sync:
-        with container.uow as uow:
-            for sid, token, orig in tokens_to_sync:
-                prof = uow.profiles.get(sid)
-                if prof:
-                    prof.rating_token = token
-                    prof.origin = orig
-            uow.commit()
+async def _fetch_render_context(container: HingeContainer) -> _RenderContext:
+    """Fetch standouts, own location and like limits; remember the result.
+
+    The three calls are independent, so they run concurrently and each
+    degrades to its default on timeout or error.
+    """
+    account = _account_key(container)
+    standouts_resp, (user_lat, user_lon), limit = await asyncio.gather(
+        # Cross-reference with standouts (ETag-cached, cheap)
+        optional(container._client.get_standouts_v3(), default=None, name="standouts"),
+        optional_user_location(container),
+        optional(container.hinge_api.get_like_limit(), default=None, name="like_limit"),
+    )
+
+    ctx = _RenderContext(user_lat=user_lat, user_lon=user_lon)
+    if standouts_resp:
+        ctx.standout_ids = {s.subject_id for s in standouts_resp.standouts}
+    if limit is not None:
+        ctx.likes_left = limit.likes_left
+        ctx.superlikes_left = limit.superlikes_left
+
+    _account_states.setdefault(account, _AccountState()).context = ctx
+    return ctx
+
+
+async def _render_encounters(
+    container: HingeContainer,
+    all_profiles: list[HingeProfile],
+    ctx: _RenderContext,
+) -> list[HingeEncounterOut]:
+    """Score and render each profile with its current rating token."""
+    with container.uow as uow:
+        tokens = uow.tokens.get_many([p.subject_id for p in all_profiles])
 
     # Score each profile
     encounters: list[HingeEncounterOut] = []
@@ -426,10 +483,10 @@ async def get_recommendations(  # noqa: C901 — top-level route orchestrates se
             log.warning("score_failed", subject_id=p.subject_id[:12])
             score_val, reasoning = 0.0, ""
 
-        # Use fresh rating_token if available, else DB token
-        rec_info = rec_state.get(p.subject_id)
-        rating_token = rec_info.rating_token if rec_info else (p.rating_token or "")
-        origin = rec_info.origin if rec_info else (p.origin or p.source or "discover")
+        # Prefer the token store (latest issued), else the profile snapshot
+        token = tokens.get(p.subject_id)
+        rating_token = token.rating_token if token else (p.rating_token or "")
+        origin = token.origin if token else (p.origin or p.source or "discover")
 
         encounters.append(
             _profile_to_encounter(
@@ -438,22 +495,152 @@ async def get_recommendations(  # noqa: C901 — top-level route orchestrates se
                 origin,
                 score=round(score_val, 1),
                 reasoning=reasoning,
-                is_standout=p.subject_id in standout_ids,
+                is_standout=p.subject_id in ctx.standout_ids,
                 is_second_chance=p.is_second_chance,
                 second_chance_source=p.second_chance_source,
-                user_lat=user_lat,
-                user_lon=user_lon,
+                user_lat=ctx.user_lat,
+                user_lon=ctx.user_lon,
             ),
         )
+    return encounters
 
-    # Get limits
+
+async def _revalidate_and_push(
+    container: HingeContainer,
+    served: list[HingeEncounterOut],
+) -> None:
+    """Run the full upstream path, then push encounters that changed.
+
+    Emits one ``recommendations_updated`` event on the WebSocket fan-out
+    with the re-rendered encounters that differ from what was served,
+    the subject_ids that dropped out of the queue, and fresh limits.
+    Nothing is pushed if the client switched account in the meantime.
+    """
+    account = _account_key(container)
     try:
-        limit = await container.hinge_api.get_like_limit()
-        likes_left = limit.likes_left
-        superlikes_left = limit.superlikes_left
+        all_profiles = _load_undecided(container)
+        await _revalidate_profiles(container, all_profiles)
+        ctx = await _fetch_render_context(container)
+        fresh = await _render_encounters(container, all_profiles, ctx)
     except Exception:
-        likes_left = None
-        superlikes_left = None
+        log.warning("recommendations_revalidate_failed", exc_info=True)
+        return
+
+    if _account_key(container) != account:
+        log.info("recommendations_revalidate_dropped", reason="account_switched")
+        return
+
+    before = {e.subject_id: e for e in served}
+    changed = [e for e in fresh if before.get(e.subject_id) != e]
+    removed = sorted(before.keys() - {e.subject_id for e in fresh})
+    log.info(
+        "recommendations_revalidated",
+        changed=len(changed),
+        removed=len(removed),
+    )
+    await broadcast(
+        "recommendations_updated",
+        {
+            "encounters": [e.model_dump(mode="json") for e in changed],
+            "removed": removed,
+            "likes_left": ctx.likes_left,
+            "superlikes_left": ctx.superlikes_left,
+        },
+    )
+
+
+@router.get("/", response_model=HingeRecommendationsResponse)
+async def get_recommendations(
+    response: Response,
+    refresh: bool = Query(default=False),
+    stale_ok: bool = Query(default=False),
+    container: HingeContainer = Depends(require_hinge_auth),
+    deadline: Deadline = Depends(request_deadline),
+) -> HingeRecommendationsResponse:
+    """Return all undecided Hinge profiles from DB.
+
+    Pass ``?refresh=true`` to fetch a fresh batch from Hinge upstream
+    first, hydrate, persist, then return the full undecided queue.
+
+    Pass ``?stale_ok=true`` (ignored with ``refresh``) for
+    stale-while-revalidate: the queue is rendered straight from DB with
+    the last known standouts/location/limits, and revalidation runs in
+    the background, pushing a ``recommendations_updated`` event over
+    ``/ws/chat`` with whatever changed.
+
+    While the Hinge circuit breaker is open the queue is always served
+    from DB, flagged with ``X-Upstream-Stale``, without touching upstream. Revalidation
+    is bounded by the request deadline; profiles whose batch did not
+    land in time are rendered as stored.
+    """
+    # Prompts are loaded lazily on first profile-render path by the adapter.
+
+    if container._client.upstream_degraded():
+        mark_stale(response)
+        return await _serve_from_db(container, revalidate=False)
+
+    if stale_ok and not refresh:
+        return await _serve_from_db(container, revalidate=True)
+
+    try:
+        return await _load_live(container, refresh=refresh, deadline=deadline)
+    except HingeUpstreamUnavailableError:
+        # Breaker tripped mid-request — fall back to the DB mirror.
+        mark_stale(response)
+        return await _serve_from_db(container, revalidate=False)
+
+
+async def _serve_from_db(
+    container: HingeContainer,
+    *,
+    revalidate: bool,
+) -> HingeRecommendationsResponse:
+    """Render the undecided queue from DB with the last known context.
+
+    With ``revalidate`` a background refresh is scheduled
+    (stale-while-revalidate); without it Hinge is degraded and nothing
+    will be refreshed, so the caller flags the response stale.
+    """
+    state = _account_state(container)
+    all_profiles = _load_undecided(container)
+    encounters = await _render_encounters(container, all_profiles, state.context)
+    if revalidate and (state.revalidation is None or state.revalidation.done()):
+        state.revalidation = asyncio.create_task(
+            _revalidate_and_push(container, encounters),
+        )
+    log.info(
+        "hinge_recommendations_served_stale",
+        count=len(encounters),
+        degraded=not revalidate,
+    )
+    return HingeRecommendationsResponse(
+        encounters=encounters,
+        total_fetched=0,
+        total_undecided=len(encounters),
+        filtered_already_decided=0,
+        likes_left=state.context.likes_left,
+        superlikes_left=state.context.superlikes_left,
+        feed_exhausted=container._client.feed_exhausted,
+        revalidating=revalidate,
+    )
+
+
+async def _load_live(
+    container: HingeContainer,
+    *,
+    refresh: bool,
+    deadline: Deadline,
+) -> HingeRecommendationsResponse:
+    """Revalidate against upstream (optionally fetching a new batch) and render."""
+    total_fetched = 0
+    if refresh:
+        total_fetched = await _fetch_and_persist(container)
+
+    # The adapter only re-fetches profiles past their freshness TTL.
+    all_profiles = _load_undecided(container)
+    await _revalidate_profiles(container, all_profiles, deadline)
+    ctx = await _fetch_render_context(container)
+    encounters = await _render_encounters(container, all_profiles, ctx)
 
     feed_exhausted = container._client.feed_exhausted
 
@@ -481,8 +668,8 @@ async def get_recommendations(  # noqa: C901 — top-level route orchestrates se
         total_fetched=total_fetched,
         total_undecided=len(encounters),
         filtered_already_decided=0,
-        likes_left=likes_left,
-        superlikes_left=superlikes_left,
+        likes_left=ctx.likes_left,
+        superlikes_left=ctx.superlikes_left,
         feed_exhausted=feed_exhausted,
     )
 
@@ -491,30 +678,15 @@ def _resolve_token(
     container: HingeContainer,
     subject_id: str,
 ) -> tuple[str, str]:
-    """Resolve rating_token and origin from all available sources.
+    """Look up the rating_token and origin for a subject in the token store.
 
-    Lookup order: in-memory recommendations → standout tokens → DB profile.
     Returns (rating_token, origin). Token is empty string if not found.
     """
-    rec = container._client.recommendations.get(subject_id)
-    if rec:
-        return rec.rating_token, rec.origin or "discover"
-
-    standout_tokens: dict[str, str] = getattr(
-        container._client,
-        "_standout_tokens",
-        {},
-    )
-    if subject_id in standout_tokens:
-        return standout_tokens[subject_id], "standouts"
-
-    # Final fallback: DB profile (survives server restarts)
     with container.uow as uow:
-        profile = uow.profiles.get(subject_id)
-        if profile and profile.rating_token:
-            return profile.rating_token, profile.origin or "discover"
-
-    return "", "discover"
+        token = uow.tokens.get(subject_id)
+    if token is None:
+        return "", "discover"
+    return token.rating_token, token.origin or "discover"
 
 
 @router.post("/{subject_id}/skip", response_model=HingeLikeResponse)
@@ -175,6 +175,8 @@ class HingeRecommendationsResponse(BaseModel):
     likes_left: int | None = None
     superlikes_left: int | None = None
     feed_exhausted: bool = False
+    # True when served from DB while a background revalidation runs
+    revalidating: bool = False
 
 
 class HingeLikeRequest(BaseModel):
@@ -0,0 +1,188 @@
+"""Hinge chat backfill service — mirrors each channel's full message history.
+
+The periodic sync (``ChatSyncService``) only ever reads forward from a
+channel's newest stored message. This job walks the other way: it
+pages backwards with ``message_ts`` from the oldest stored message until
+Sendbird runs out, writing each page and a per-channel checkpoint in
+one transaction so a restart resumes where it stopped.
+
+Sendbird calls bypass the Hinge governor, so the job paces itself:
+each channel waits ``page_delay`` seconds between pages, and at most
+``concurrency`` channels page at once.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from hinge.core.logging_config import logger as log
+from hinge.infrastructure.db.unit_of_work import HingeSqlAlchemyUnitOfWork
+from hinge.infrastructure.hinge.adapter import MESSAGE_PAGE_SIZE, HingeApiAdapter
+
+_DEFAULT_CONCURRENCY = 2
+_DEFAULT_INTERVAL_SECONDS = 600.0
+_DEFAULT_PAGE_DELAY_SECONDS = 1.0
+# Checkpoint value once a channel's history is fully mirrored.
+_DONE = "done"
+
+
+def _checkpoint_key(channel_url: str) -> str:
+    """hinge_sync_state key holding one channel's backfill position."""
+    return f"chat_backfill:{channel_url}"
+
+
+@dataclass
+class BackfillResult:
+    """Summary of a backfill run."""
+
+    channels_completed: int
+    channels_pending: int
+    messages_upserted: int
+    duration_ms: int
+
+
+class ChatBackfillService:
+    """Page every channel's history back to its first message, resumably."""
+
+    def __init__(
+        self,
+        api: HingeApiAdapter,
+        uow_factory: sessionmaker[Session],
+        *,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        interval: float = _DEFAULT_INTERVAL_SECONDS,
+        page_delay: float = _DEFAULT_PAGE_DELAY_SECONDS,
+    ) -> None:
+        """Wire the service to its API adapter and SQLAlchemy session factory."""
+        self._api = api
+        self._uow_factory = uow_factory
+        self._concurrency = max(1, concurrency)
+        self._interval = interval
+        self._page_delay = max(0.0, page_delay)
+        self.last_run_at: datetime | None = None
+        self.last_result: BackfillResult | None = None
+
+    def _uow(self) -> HingeSqlAlchemyUnitOfWork:
+        return HingeSqlAlchemyUnitOfWork(self._uow_factory)
+
+    def _start_anchor(self, channel_url: str) -> int | None:
+        """Millisecond timestamp to page back from, or None if already done.
+
+        Resumes from the checkpoint; a channel never backfilled starts
+        at its oldest stored message (or now, if nothing is stored).
+        """
+        with self._uow() as uow:
+            checkpoint = uow.sync_state.get(_checkpoint_key(channel_url))
+            if checkpoint == _DONE:
+                return None
+            if checkpoint is not None:
+                return int(checkpoint)
+            oldest = uow.chat.oldest_message_at(channel_url)
+        if oldest is None:
+            return int(time.time() * 1000)
+        if oldest.tzinfo is None:
+            oldest = oldest.replace(tzinfo=UTC)
+        return int(oldest.timestamp() * 1000)
+
+    async def backfill_channel(self, channel_url: str) -> int:
+        """Page one channel back to its first message. Returns messages written.
+
+        Each page is bulk-upserted together with the new checkpoint; a
+        page shorter than ``MESSAGE_PAGE_SIZE`` (or one that no longer
+        moves the anchor back) marks the channel done. Consecutive pages
+        are spaced ``page_delay`` seconds apart.
+        """
+        anchor = self._start_anchor(channel_url)
+        written = 0
+        first = True
+        while anchor is not None:
+            if not first:
+                await asyncio.sleep(self._page_delay)
+            first = False
+            page = await self._api.fetch_channel_messages(
+                channel_url,
+                before_ts=anchor,
+            )
+            oldest = min(
+                (int(m.created_at.timestamp() * 1000) for m in page),
+                default=anchor,
+            )
+            done = len(page) < MESSAGE_PAGE_SIZE or oldest >= anchor
+            with self._uow() as uow:
+                written += uow.chat.upsert_messages(page)
+                uow.sync_state.set(
+                    _checkpoint_key(channel_url),
+                    _DONE if done else str(oldest),
+                )
+                uow.commit()
+            anchor = None if done else oldest
+        return written
+
+    async def run(self) -> BackfillResult:
+        """Backfill every channel not yet done (bounded parallelism).
+
+        At most ``concurrency`` channels page at once, each throttled by
+        ``page_delay``, which caps the job at ``concurrency / page_delay``
+        Sendbird requests per second.
+        """
+        start = time.monotonic()
+        with self._uow() as uow:
+            urls = [c.channel_url for c in uow.chat.get_channels(include_orphans=True)]
+            checkpoints = uow.sync_state.get_many([_checkpoint_key(u) for u in urls])
+        pending = [u for u in urls if checkpoints.get(_checkpoint_key(u)) != _DONE]
+        sem = asyncio.Semaphore(self._concurrency)
+
+        async def _one(channel_url: str) -> int:
+            async with sem:
+                return await self.backfill_channel(channel_url)
+
+        counts: list[int | BaseException] = await asyncio.gather(
+            *(_one(url) for url in pending),
+            return_exceptions=True,
+        )
+        completed = 0
+        total_messages = 0
+        for url, c in zip(pending, counts, strict=True):
+            if isinstance(c, BaseException):
+                log.warning("chat_backfill_channel_failed", channel=url, exc_info=c)
+                continue
+            completed += 1
+            total_messages += c
+
+        duration_ms = int((time.monotonic() - start) * 1000)
+        result = BackfillResult(
+            channels_completed=completed,
+            channels_pending=len(pending) - completed,
+            messages_upserted=total_messages,
+            duration_ms=duration_ms,
+        )
+        self.last_run_at = datetime.now(UTC)
+        self.last_result = result
+        log.info(
+            "chat_backfill_done",
+            completed=completed,
+            pending=result.channels_pending,
+            messages=total_messages,
+            ms=duration_ms,
+        )
+        return result
+
+    async def _loop(self) -> None:
+        """Background loop — re-runs the backfill every ``interval`` seconds.
+
+        Channels already done cost one checkpoint lookup, so later runs
+        only touch channels that appeared since (or failed last time).
+        """
+        log.info("chat_backfill_loop_started", interval=self._interval)
+        while True:
+            try:
+                await self.run()
+            except asyncio.CancelledError:
+                log.info("chat_backfill_loop_cancelled")
+                return
+            except Exception:
+                log.warning("chat_backfill_loop_error", exc_info=True)
+            await asyncio.sleep(self._interval)
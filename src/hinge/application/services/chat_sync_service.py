@@ -5,17 +5,54 @@ import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
+from httpx import HTTPStatusError
 from sqlalchemy.orm import Session, sessionmaker
 
 from hinge.core.logging_config import logger as log
-from hinge.domain.models.chat_channel import HingeChatChannel
+from hinge.domain.models.chat_channel import (
+    HingeChatChannel,
+    HingeChatChannelChanges,
+)
+from hinge.domain.models.chat_message import (
+    HingeChatMessage,
+    HingeChatMessageChanges,
+)
 from hinge.infrastructure.db.unit_of_work import HingeSqlAlchemyUnitOfWork
-from hinge.infrastructure.hinge.adapter import HingeApiAdapter
+from hinge.infrastructure.hinge.adapter import MESSAGE_PAGE_SIZE, HingeApiAdapter
+from hinge.transport.governor import background_lane
 
 _PROFILE_BATCH_SIZE = 10
 
 _SYNC_INTERVAL_SECONDS = 60
 _MESSAGE_SYNC_CONCURRENCY = 5
+# Forward pages fetched per channel per sync before deferring the rest
+# to the next run (a channel that far behind is a backfill, not a sync).
+_MAX_CATCHUP_PAGES = 20
+# hinge_sync_state key holding the Sendbird channel changelog resume token.
+_CHANNEL_CHANGELOG_KEY = "sendbird_channel_changelog_token"
+
+
+def _message_changelog_key(channel_url: str) -> str:
+    """hinge_sync_state key for one channel's message changelog token."""
+    return f"sendbird_message_changelog:{channel_url}"
+
+
+def _to_ms(dt: datetime) -> int:
+    """Sendbird millisecond timestamp for ``dt`` (naive values are UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return int(dt.timestamp() * 1000)
+
+
+def _message_state(c: HingeChatChannel) -> tuple[int | None, int | None, int]:
+    """The channel fields that move when its messages do."""
+    last_at = _to_ms(c.last_message_at) if c.last_message_at else None
+    return c.last_message_id, last_at, c.unread_count
+
+
+def _row_state(c: HingeChatChannel) -> tuple[object, ...]:
+    """The channel fields whose change warrants rewriting the stored row."""
+    return (*_message_state(c), c.is_connection_active, c.subject_id)
 
 
 @dataclass
@@ -45,11 +82,60 @@ class ChatSyncService:
     def _uow(self) -> HingeSqlAlchemyUnitOfWork:
         return HingeSqlAlchemyUnitOfWork(self._uow_factory)
 
+    async def _fetch_channel_delta(
+        self,
+    ) -> tuple[list[HingeChatChannel], set[str] | None, str | None]:
+        """Channels changed since the stored changelog token.
+
+        Returns (channels, orphans, next token). ``orphans`` is None after
+        a full listing, meaning "anything stored but not listed". With no
+        token stored (or one Sendbird rejects as expired) every channel is
+        listed, then the changelog is read from just before the listing
+        started so nothing that moved mid-listing is lost.
+        """
+        with self._uow() as uow:
+            token = uow.sync_state.get(_CHANNEL_CHANGELOG_KEY)
+        if token is not None:
+            try:
+                changes = await self._api.fetch_chat_changes(token=token)
+            except HTTPStatusError as exc:
+                if exc.response.status_code != 400:
+                    raise
+                log.info("chat_changelog_token_rejected")
+            else:
+                return changes.updated, self._orphans(changes), changes.token
+
+        started_ms = int(time.time() * 1000)
+        channels = await self._api.fetch_chat_state()
+        changes = await self._api.fetch_chat_changes(change_ts=started_ms)
+        by_url = {c.channel_url: c for c in channels}
+        by_url.update((c.channel_url, c) for c in changes.updated)
+        for url in changes.deleted:
+            by_url.pop(url, None)
+        log.info("chat_channels_listed", count=len(by_url))
+        return list(by_url.values()), None, changes.token
+
+    def _orphans(self, changes: HingeChatChannelChanges) -> set[str]:
+        """Deleted channels plus stored ones whose connection has gone."""
+        updated = {c.channel_url for c in changes.updated}
+        with self._uow() as uow:
+            unmatched = {
+                c.channel_url
+                for c in uow.chat.get_channels(include_orphans=False)
+                if c.channel_url not in updated
+                and c.subject_id not in changes.connection_ids
+            }
+        return changes.deleted | unmatched
+
     async def sync_channels(self) -> SyncResult:
-        """Fetch + upsert all channels, marking missing ones as orphan."""
+        """Fetch + upsert changed channels, marking gone ones as orphan."""
         start = time.monotonic()
-        channels = await self._api.fetch_chat_state()
-        upserted, orphaned = self._persist_channels(channels)
+        channels, orphans, token = await self._fetch_channel_delta()
+        upserted, orphaned, _ = self._persist_channels(
+            channels,
+            orphans=orphans,
+            token=token,
+        )
         duration_ms = int((time.monotonic() - start) * 1000)
         result = SyncResult(
             channels_upserted=upserted,
@@ -64,27 +150,133 @@ class ChatSyncService:
     def _persist_channels(
         self,
         channels: list[HingeChatChannel],
-    ) -> tuple[int, int]:
-        """Upsert channels; mark stored channels absent from the fetch as orphan."""
+        *,
+        orphans: set[str] | None = None,
+        token: str | None = None,
+    ) -> tuple[int, int, set[str]]:
+        """Write changed channels and mark ``orphans`` inactive.
+
+        Channels are compared against their stored rows: new or changed
+        ones are upserted in one batch, unchanged ones only get
+        ``last_synced_at`` bumped. ``orphans=None`` treats ``channels`` as
+        the complete listing. ``token`` is stored in the same transaction,
+        so the changelog never advances past unsaved channels. Returns
+        (upserted, orphaned, urls whose messages moved and need fetching).
+        """
         fresh_urls = {c.channel_url for c in channels}
         orphaned = 0
         with self._uow() as uow:
-            existing = {c.channel_url for c in uow.chat.get_channels()}
-            missing = existing - fresh_urls
+            stored = {
+                c.channel_url: c
+                for c in uow.chat.get_channels(include_orphans=True)
+            }
+            missing = stored.keys() - fresh_urls if orphans is None else orphans
             if missing:
                 orphaned = uow.chat.mark_channels_orphan(missing)
+            changed: list[HingeChatChannel] = []
+            moved: set[str] = set()
             for channel in channels:
-                uow.chat.upsert_channel(channel)
+                prev = stored.get(channel.channel_url)
+                if prev is None or _row_state(prev) != _row_state(channel):
+                    changed.append(channel)
+                if prev is None or _message_state(prev) != _message_state(channel):
+                    moved.add(channel.channel_url)
+            upserted = uow.chat.upsert_channels(changed)
+            uow.chat.touch_channels(
+                fresh_urls - {c.channel_url for c in changed},
+                datetime.now(UTC),
+            )
+            if token:
+                uow.sync_state.set(_CHANNEL_CHANGELOG_KEY, token)
             uow.commit()
-        return len(channels), orphaned
+        return upserted, orphaned, moved
+
+    async def _fetch_new_messages(
+        self,
+        channel_url: str,
+        cursor: tuple[datetime, int] | None,
+    ) -> list[HingeChatMessage]:
+        """Fetch messages newer than ``cursor``, paging forward until caught up.
+
+        Without a cursor (nothing stored yet) this is the newest page.
+        Forward pages include the message at the anchor timestamp, so
+        anything at or below the cursor's ``message_id`` is dropped.
+        """
+        if cursor is None:
+            return await self._api.fetch_channel_messages(channel_url)
+        since_dt, last_id = cursor
+        since_ms = _to_ms(since_dt)
+        new: list[HingeChatMessage] = []
+        for _ in range(_MAX_CATCHUP_PAGES):
+            page = await self._api.fetch_channel_messages(
+                channel_url,
+                since_ts=since_ms,
+            )
+            fresh = [m for m in page if m.message_id > last_id]
+            new.extend(fresh)
+            if len(page) < MESSAGE_PAGE_SIZE or not fresh:
+                break
+            since_ms = max(_to_ms(m.created_at) for m in fresh)
+            last_id = max(m.message_id for m in fresh)
+        return new
+
+    async def _fetch_message_changes(
+        self,
+        channel_url: str,
+        token: str | None,
+        started_ms: int,
+    ) -> HingeChatMessageChanges:
+        """Edits/deletions since ``token``; with none, since ``started_ms``."""
+        if token is not None:
+            try:
+                return await self._api.fetch_message_changes(channel_url, token=token)
+            except HTTPStatusError as exc:
+                if exc.response.status_code != 400:
+                    raise
+                log.info("chat_message_changelog_token_rejected", channel=channel_url)
+        return await self._api.fetch_message_changes(
+            channel_url,
+            change_ts=started_ms,
+        )
+
+    async def _sync_channel_messages(
+        self,
+        channel_url: str,
+        cursor: tuple[datetime, int] | None,
+        token: str | None,
+        *,
+        fetch_new: bool = True,
+    ) -> int:
+        """Mirror one channel: new messages past ``cursor`` plus edits/deletions.
+
+        A channel seen for the first time has its newest page fetched
+        and its message changelog started from just before that fetch;
+        later runs apply edits and removals from the stored token instead
+        of re-fetching history. Without ``fetch_new`` only the changelog
+        is read. Returns the number of messages upserted.
+        """
+        started_ms = int(time.time() * 1000)
+        messages = (
+            await self._fetch_new_messages(channel_url, cursor) if fetch_new else []
+        )
+        changes = await self._fetch_message_changes(channel_url, token, started_ms)
+        by_id = {m.message_id: m for m in messages}
+        by_id.update((m.message_id, m) for m in changes.updated)
+        with self._uow() as uow:
+            written = uow.chat.upsert_messages(list(by_id.values()))
+            uow.chat.mark_messages_removed(changes.deleted)
+            if changes.token:
+                uow.sync_state.set(_message_changelog_key(channel_url), changes.token)
+            uow.commit()
+        return written
 
     async def sync_messages(self, channel_url: str) -> SyncResult:
-        """Fetch + upsert messages for a single channel."""
+        """Fetch new messages and apply edits/deletions for one channel."""
         start = time.monotonic()
-        messages = await self._api.fetch_channel_messages(channel_url)
         with self._uow() as uow:
-            written = uow.chat.upsert_messages(messages)
-            uow.commit()
+            cursor = uow.chat.message_cursors().get(channel_url)
+            token = uow.sync_state.get(_message_changelog_key(channel_url))
+        written = await self._sync_channel_messages(channel_url, cursor, token)
         duration_ms = int((time.monotonic() - start) * 1000)
         return SyncResult(
             channels_upserted=0,
@@ -133,28 +325,62 @@ class ChatSyncService:
         return len(seen)
 
     async def sync_all(self) -> SyncResult:
-        """Full sync: channels then messages for each channel (bounded parallelism)."""
+        """Full sync: changed channels then messages per changed channel.
+
+        Channels come from Sendbird's changelog since the stored token
+        (a full listing on first run). New messages are only fetched for
+        channels that are new or whose last message / unread count moved,
+        or active ones whose stored messages lag the channel's last
+        message (e.g. a previous fetch failed); metadata-only changes
+        fetch none. Every active channel (and every channel fetching new
+        messages) also reads its message changelog each run, so edits
+        and deletions of older messages in idle channels still land.
+        """
         start = time.monotonic()
-        channels = await self._api.fetch_chat_state()
-        upserted, orphaned = self._persist_channels(channels)
+        channels, orphans, token = await self._fetch_channel_delta()
+        upserted, orphaned, moved = self._persist_channels(
+            channels,
+            orphans=orphans,
+            token=token,
+        )
 
         # Backfill counterparty profiles so counterparty_name is never null
         await self._backfill_counterparty_profiles(channels)
 
+        with self._uow() as uow:
+            cursors = uow.chat.message_cursors()
+            stored = uow.chat.get_channels(include_orphans=True)
+            tokens = uow.sync_state.get_many(
+                [_message_changelog_key(c.channel_url) for c in stored],
+            )
+
+        def _behind(c: HingeChatChannel) -> bool:
+            if c.last_message_id is None:
+                return False
+            cursor = cursors.get(c.channel_url)
+            return cursor is None or c.last_message_id > cursor[1]
+
+        fetch_new = {
+            c.channel_url
+            for c in stored
+            if c.channel_url in moved or (c.is_connection_active and _behind(c))
+        }
+        synced = [
+            c for c in stored if c.channel_url in fetch_new or c.is_connection_active
+        ]
         sem = asyncio.Semaphore(_MESSAGE_SYNC_CONCURRENCY)
 
         async def _one(channel_url: str) -> int:
             async with sem:
-                messages = await self._api.fetch_channel_messages(channel_url)
-                if not messages:
-                    return 0
-                with self._uow() as uow:
-                    written = uow.chat.upsert_messages(messages)
-                    uow.commit()
-                return int(written)
+                return await self._sync_channel_messages(
+                    channel_url,
+                    cursors.get(channel_url),
+                    tokens.get(_message_changelog_key(channel_url)),
+                    fetch_new=channel_url in fetch_new,
+                )
 
         counts: list[int | BaseException] = await asyncio.gather(
-            *(_one(c.channel_url) for c in channels),
+            *(_one(c.channel_url) for c in synced),
             return_exceptions=True,
         )
         total_messages = 0
@@ -177,17 +403,25 @@ class ChatSyncService:
             "chat_sync_done",
             channels=upserted,
             orphaned=orphaned,
+            changed=len(channels),
+            fetched=len(fetch_new),
+            changelogs=len(synced),
             messages=total_messages,
             ms=duration_ms,
         )
         return result
 
     async def _loop(self) -> None:
-        """Background loop — runs sync_all every ~60s, swallowing errors."""
+        """Background loop — runs sync_all every ~60s, swallowing errors.
+
+        Runs in the governor's background lane so periodic syncs never
+        delay interactive routes.
+        """
         log.info("chat_sync_loop_started", interval=_SYNC_INTERVAL_SECONDS)
         while True:
             try:
-                await self.sync_all()
+                with background_lane():
+                    await self.sync_all()
             except asyncio.CancelledError:
                 log.info("chat_sync_loop_cancelled")
                 return
@@ -7,6 +7,15 @@ IMPORTANT: 429 (rate limit) from rec/v2 returns empty JSON `{}` which looks
 identical to feed exhaustion (0 subjects). The scan MUST check HTTP status
 codes and retry on 429 instead of treating it as exhaustion. Failing to do
 so causes massive false positives (82% in testing).
+
+Pacing is owned by the client-wide ``RateGovernor`` on ``HingeClient``:
+the scan simply loops and every call waits for its token, so it runs as
+fast as the upstream currently tolerates and a 429 pauses the scan and
+interactive routes alike until the cooldown has passed.
+
+Classifying the newly rejected profiles ("passed" vs "gone") is a
+separate post-scan job (``classify_rejections``) so the scan itself
+finishes as soon as the diff is committed.
 """
 
 import asyncio
@@ -16,6 +25,7 @@ from httpx import HTTPStatusError
 
 from hinge.core.logging_config import logger as log
 from hinge.bootstrap import HingeContainer
+from hinge.transport.governor import background_lane
 
 
 class RejectionScanResult:
@@ -47,6 +57,12 @@ class ScanState:
         self.running: bool = False
         self.current_run: RejectionScanResult | None = None
         self.last_result: RejectionScanResult | None = None
+        self.classification: asyncio.Task[None] | None = None
+
+    @property
+    def classifying(self) -> bool:
+        """Whether a post-scan classification job is still running."""
+        return self.classification is not None and not self.classification.done()
 
 
 scan_state = ScanState()
@@ -78,21 +94,21 @@ def persist_scan_result(
 
 
 _MISS_THRESHOLD = 3  # consecutive scans absent before marking rejected
+_CLASSIFY_BATCH_SIZE = 20  # /user/v2/public accepts up to 20 ids
 
 
 async def _exhaust_feed_phase1(
     container: HingeContainer,
     result: RejectionScanResult,
     *,
-    delay_seconds: float,
-    burst_size: int,
-    burst_pause: float,
     max_rate_limit_retries: int,
-    rate_limit_wait: float,
 ) -> set[str]:
-    """Phase 1: Exhaust the rec/v2 feed, collecting all subject IDs."""
+    """Phase 1: Exhaust the rec/v2 feed, collecting all subject IDs.
+
+    A 429 has already put the governor into cooldown, so retrying right
+    away just blocks in ``acquire`` until Cloudflare lets us back in.
+    """
     pool: set[str] = set()
-    calls_in_burst = 0
     consecutive_empty = 0
     rate_limit_retries = 0
 
@@ -117,11 +133,11 @@ async def _exhaust_feed_phase1(
                 log.warning(
                     "rejection_scan_rate_limited",
                     retry=rate_limit_retries,
-                    wait_seconds=rate_limit_wait,
+                    wait_seconds=round(
+                        container._client.governor.cooldown_remaining(), 1
+                    ),
                     pool_size=len(pool),
                 )
-                await asyncio.sleep(rate_limit_wait)
-                calls_in_burst = 0
                 continue
             raise
 
@@ -147,14 +163,6 @@ async def _exhaust_feed_phase1(
             consecutive_empty = 0
             rate_limit_retries = 0
 
-        calls_in_burst += 1
-        if calls_in_burst >= burst_size:
-            log.info("rejection_scan_burst_pause", pause_seconds=burst_pause)
-            await asyncio.sleep(burst_pause)
-            calls_in_burst = 0
-        else:
-            await asyncio.sleep(delay_seconds)
-
     return pool
 
 
@@ -164,24 +172,52 @@ async def _classify_rejections(
 ) -> dict[str, str]:
     """Classify newly rejected profiles as 'passed' or 'gone'.
 
-    Calls ``/user/v2/public`` for each subject_id. If data comes back
-    the user is still active (they passed on us); empty means gone.
+    Looks the ids up in full ``/user/v2/public`` batches. Ids that come
+    back are still active (they passed on us); ids missing from the
+    response are gone. Ids in a batch that errored are left out, so they
+    stay untyped and are retried after the next scan. Each batch waits
+    on the client's rate governor like any other call.
     """
+    ids = sorted(subject_ids)
     classifications: dict[str, str] = {}
-    for sid in subject_ids:
+    for i in range(0, len(ids), _CLASSIFY_BATCH_SIZE):
+        chunk = ids[i : i + _CLASSIFY_BATCH_SIZE]
         try:
-            v2_data = await container._client.get_profiles_v2([sid])
-            if v2_data:
-                classifications[sid] = "passed"
-            else:
-                classifications[sid] = "gone"
+            active = await container.hinge_api.get_active_subject_ids(chunk)
         except Exception:
-            classifications[sid] = "gone"
-        # Small delay to avoid hammering the API
-        await asyncio.sleep(2)
+            log.warning(
+                "rejection_classify_batch_failed",
+                size=len(chunk),
+                exc_info=True,
+            )
+            continue
+        for sid in chunk:
+            classifications[sid] = "passed" if sid in active else "gone"
     return classifications
 
 
+async def classify_rejections(
+    container: HingeContainer,
+    subject_ids: set[str],
+) -> None:
+    """Post-scan job: classify ``subject_ids`` and store the rejection types."""
+    with background_lane():
+        try:
+            classifications = await _classify_rejections(container, subject_ids)
+            with container.uow as uow:
+                for sid, rtype in classifications.items():
+                    uow.profiles.set_rejection_type(sid, rtype)
+                uow.commit()
+        except Exception:
+            log.warning("rejection_scan_classify_failed", exc_info=True)
+            return
+    log.info(
+        "rejection_scan_classified",
+        passed=sum(1 for v in classifications.values() if v == "passed"),
+        gone=sum(1 for v in classifications.values() if v == "gone"),
+    )
+
+
 def _find_newly_rejected(
     uow: object,
     disappeared: set[str],
@@ -203,8 +239,12 @@ async def _diff_and_track_misses(
     container: HingeContainer,
     result: RejectionScanResult,
     pool: set[str],
-) -> None:
-    """Phase 2: Diff pool against DB using consecutive miss tracking."""
+) -> set[str]:
+    """Phase 2: Diff pool against DB using consecutive miss tracking.
+
+    Returns the profiles newly marked as likely rejected, for
+    ``classify_rejections`` to pick up after the scan.
+    """
     with container.uow as uow:
         db_undecided = uow.profiles.get_undecided_subject_ids()
         disappeared = db_undecided - pool
@@ -232,19 +272,6 @@ async def _diff_and_track_misses(
 
         uow.commit()
 
-    # Phase 2b: Classify newly rejected profiles (async API calls)
-    if to_reject:
-        classifications = await _classify_rejections(container, to_reject)
-        with container.uow as uow:
-            for sid, rtype in classifications.items():
-                uow.profiles.set_rejection_type(sid, rtype)
-            uow.commit()
-        log.info(
-            "rejection_scan_classified",
-            passed=sum(1 for v in classifications.values() if v == "passed"),
-            gone=sum(1 for v in classifications.values() if v == "gone"),
-        )
-
     log.info(
         "rejection_scan_complete",
         pool_size=result.unique_pool,
@@ -254,6 +281,7 @@ async def _diff_and_track_misses(
         marked=result.marked_rejected,
         cleared=cleared,
     )
+    return to_reject
 
 
 async def _persist_discovered_profiles(
@@ -289,11 +317,7 @@ async def _persist_discovered_profiles(
 async def exhaust_feed(
     container: HingeContainer,
     *,
-    delay_seconds: float = 4.0,
-    burst_size: int = 12,
-    burst_pause: float = 35.0,
     max_rate_limit_retries: int = 5,
-    rate_limit_wait: float = 35.0,
     trigger: str = "manual",
 ) -> RejectionScanResult:
     """Exhaust the rec/v2 feed and detect likely rejections.
@@ -305,11 +329,7 @@ async def exhaust_feed(
 
     Args:
         container: Authenticated Hinge container.
-        delay_seconds: Delay between individual calls (4s is safe).
-        burst_size: Number of calls before a longer pause.
-        burst_pause: Pause duration after a burst (seconds).
-        max_rate_limit_retries: Max 429 retries before aborting.
-        rate_limit_wait: Wait time on 429 (Cloudflare 30s cooldown).
+        max_rate_limit_retries: Max consecutive 429s before aborting.
         trigger: How the scan was triggered ("manual" or "scheduled").
 
     Returns:
@@ -322,46 +342,45 @@ async def exhaust_feed(
     result = RejectionScanResult(trigger=trigger)
     scan_state.running = True
     scan_state.current_run = result
+    to_classify: set[str] = set()
 
-    try:
-        pool = await _exhaust_feed_phase1(
-            container,
-            result,
-            delay_seconds=delay_seconds,
-            burst_size=burst_size,
-            burst_pause=burst_pause,
-            max_rate_limit_retries=max_rate_limit_retries,
-            rate_limit_wait=rate_limit_wait,
-        )
-        result.unique_pool = len(pool)
-
-        # Phase 1b: Persist new profiles discovered during scan
+    # The whole scan yields to interactive routes sharing the governor.
+    with background_lane():
         try:
-            await _persist_discovered_profiles(container, pool)
-        except Exception:
-            log.warning("rejection_scan_profile_persist_failed", exc_info=True)
-
-        # Phase 2: Diff against DB — only if we got a meaningful pool
-        if result.error:
-            log.warning(
-                "rejection_scan_skipping_diff",
-                reason="partial_pool",
-                pool_size=result.unique_pool,
+            pool = await _exhaust_feed_phase1(
+                container,
+                result,
+                max_rate_limit_retries=max_rate_limit_retries,
             )
-        else:
-            await _diff_and_track_misses(container, result, pool)
+            result.unique_pool = len(pool)
 
-        # Phase 3: Recycle to restore the feed
-        await container.hinge_api.repeat_profiles()
-        log.info("rejection_scan_feed_recycled")
+            # Phase 1b: Persist new profiles discovered during scan
+            try:
+                await _persist_discovered_profiles(container, pool)
+            except Exception:
+                log.warning("rejection_scan_profile_persist_failed", exc_info=True)
 
-    except Exception as exc:
-        result.error = str(exc)
-        log.error("rejection_scan_failed", error=str(exc))
-        try:
+            # Phase 2: Diff against DB — only if we got a meaningful pool
+            if result.error:
+                log.warning(
+                    "rejection_scan_skipping_diff",
+                    reason="partial_pool",
+                    pool_size=result.unique_pool,
+                )
+            else:
+                to_classify = await _diff_and_track_misses(container, result, pool)
+
+            # Phase 3: Recycle to restore the feed
             await container.hinge_api.repeat_profiles()
-        except Exception:
-            pass
+            log.info("rejection_scan_feed_recycled")
+
+        except Exception as exc:
+            result.error = str(exc)
+            log.error("rejection_scan_failed", error=str(exc))
+            try:
+                await container.hinge_api.repeat_profiles()
+            except Exception:
+                pass
 
     result.finished_at = datetime.now(timezone.utc)
     scan_state.running = False
@@ -373,4 +392,21 @@ async def exhaust_feed(
     except Exception:
         log.warning("rejection_scan_persist_failed", exc_info=True)
 
+    # Phase 2b: Classify newly rejected profiles, decoupled from the scan,
+    # along with any left untyped by an earlier failed classification.
+    # While a previous job still runs, skip: ids it does not cover stay
+    # untyped and are picked up after the next scan.
+    if scan_state.classifying:
+        log.info("rejection_scan_classify_skipped", reason="already_running")
+        return result
+    try:
+        with container.uow as uow:
+            to_classify |= uow.profiles.get_untyped_rejections()
+    except Exception:
+        log.warning("rejection_scan_untyped_lookup_failed", exc_info=True)
+    if to_classify:
+        scan_state.classification = asyncio.create_task(
+            classify_rejections(container, to_classify),
+        )
+
     return result
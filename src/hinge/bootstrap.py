@@ -8,10 +8,12 @@ and adapters.
 """
 
 from dataclasses import dataclass, field
+from datetime import timedelta
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from hinge.application.services.chat_backfill_service import ChatBackfillService
 from hinge.application.services.chat_sync_service import ChatSyncService
 from hinge.application.services.sendbird_ws import SendbirdWsBridge
 from hinge.client import HingeClient
@@ -23,6 +25,10 @@ from hinge.infrastructure.db.mappers import start_hinge_mappers
 from hinge.infrastructure.db.unit_of_work import HingeSqlAlchemyUnitOfWork
 from hinge.infrastructure.hinge.adapter import HingeApiAdapter
 from hinge.infrastructure.scoring.rule_based import HingeRuleBasedScorer
+from hinge.transport.conditional import ConditionalCache
+from hinge.transport.governor import RateGovernor
+from hinge.transport.pools import PoolConfig
+from hinge.transport.retry import RetryPolicy
 
 
 @dataclass
@@ -39,6 +45,10 @@ class HingeContainer:
     _session_factory: sessionmaker[Session] = field(repr=False)
     sendbird_ws: SendbirdWsBridge | None = field(default=None, repr=False)
     chat_sync: ChatSyncService | None = field(default=None, repr=False)
+    chat_backfill: ChatBackfillService | None = field(default=None, repr=False)
+    # Seconds a route may spend on upstream batch calls before answering
+    # with what it has.
+    route_deadline: float = 8.0
 
     @property
     def uow(self) -> HingeUnitOfWorkPort:
@@ -84,15 +94,86 @@ def bootstrap_hinge(
 
     effective_phone = phone_number or settings.HINGE_PHONE_NUMBER or ""
 
-    client = HingeClient(phone_number=effective_phone)
+    governor = RateGovernor(
+        initial_rate=settings.RATE_INITIAL,
+        min_rate=settings.RATE_MIN,
+        max_rate=settings.RATE_MAX,
+        burst=settings.RATE_BURST,
+        increase_step=settings.RATE_INCREASE_STEP,
+        decrease_factor=settings.RATE_DECREASE_FACTOR,
+        default_cooldown=settings.RATE_DEFAULT_COOLDOWN,
+        background_reserve=settings.RATE_BACKGROUND_RESERVE,
+    )
+    client = HingeClient(
+        phone_number=effective_phone,
+        governor=governor,
+        cache_ttls={
+            "/user/v3": settings.CACHE_TTL_SELF_PROFILE,
+            "/content/v2": settings.CACHE_TTL_SELF_CONTENT,
+            "/preference/v2/selected": settings.CACHE_TTL_SELF_PREFERENCES,
+            "/content/v1/settings": settings.CACHE_TTL_CONTENT_SETTINGS,
+            "/likelimit": settings.CACHE_TTL_LIKE_LIMIT,
+        },
+        breaker_failure_threshold=settings.BREAKER_FAILURE_THRESHOLD,
+        breaker_reset_timeout=settings.BREAKER_RESET_SECONDS,
+        hedge_requests=settings.HEDGE_BATCH_REQUESTS,
+        hinge_pool=PoolConfig(
+            max_connections=settings.HINGE_POOL_MAX_CONNECTIONS,
+            max_keepalive=settings.HINGE_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=settings.POOL_KEEPALIVE_EXPIRY,
+            http2=settings.HTTP2_ENABLED,
+            connect_timeout=settings.HINGE_CONNECT_TIMEOUT,
+            read_timeout=settings.HINGE_READ_TIMEOUT,
+        ),
+        sendbird_pool=PoolConfig(
+            max_connections=settings.SENDBIRD_POOL_MAX_CONNECTIONS,
+            max_keepalive=settings.SENDBIRD_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=settings.POOL_KEEPALIVE_EXPIRY,
+            http2=settings.HTTP2_ENABLED,
+            connect_timeout=settings.SENDBIRD_CONNECT_TIMEOUT,
+            read_timeout=settings.SENDBIRD_READ_TIMEOUT,
+        ),
+        retry_policy=RetryPolicy(
+            max_attempts=settings.RETRY_MAX_ATTEMPTS,
+            base_delay=settings.RETRY_BASE_DELAY,
+            max_delay=settings.RETRY_MAX_DELAY,
+            max_retry_after=max(
+                settings.RETRY_MAX_RETRY_AFTER,
+                settings.RATE_DEFAULT_COOLDOWN,
+            ),
+        ),
+        conditional_cache=ConditionalCache(
+            max_entries=settings.CONDITIONAL_CACHE_MAX_ENTRIES,
+            persist_path=(
+                HingeClient.conditional_cache_file_for(effective_phone)
+                if settings.CONDITIONAL_CACHE_PERSIST and effective_phone
+                else None
+            ),
+        ),
+    )
 
     # Prompt catalog is DB-backed — adapter needs a UoW factory to read/write it.
     def _uow_factory() -> HingeUnitOfWorkPort:
         return HingeSqlAlchemyUnitOfWork(session_factory)
 
-    hinge_api = HingeApiAdapter(client, uow_factory=_uow_factory)
+    hinge_api = HingeApiAdapter(
+        client,
+        uow_factory=_uow_factory,
+        batch_concurrency=settings.HYDRATE_BATCH_CONCURRENCY,
+        content_ttl=timedelta(hours=settings.PROFILE_CONTENT_TTL_HOURS),
+        demographics_ttl=timedelta(hours=settings.PROFILE_DEMOGRAPHICS_TTL_HOURS),
+        loader_window=settings.PROFILE_LOADER_WINDOW_SECONDS,
+        prompt_refresh_interval=settings.PROMPT_REFRESH_INTERVAL_SECONDS,
+    )
     scorer = HingeRuleBasedScorer()
     chat_sync = ChatSyncService(api=hinge_api, uow_factory=session_factory)
+    chat_backfill = ChatBackfillService(
+        api=hinge_api,
+        uow_factory=session_factory,
+        concurrency=settings.CHAT_BACKFILL_CONCURRENCY,
+        interval=settings.CHAT_BACKFILL_INTERVAL_SECONDS,
+        page_delay=settings.CHAT_BACKFILL_PAGE_DELAY_SECONDS,
+    )
 
     return HingeContainer(
         hinge_api=hinge_api,
@@ -100,4 +181,6 @@ def bootstrap_hinge(
         _client=client,
         _session_factory=session_factory,
         chat_sync=chat_sync,
+        chat_backfill=chat_backfill,
+        route_deadline=settings.ROUTE_DEADLINE_SECONDS,
     )
@@ -1,13 +1,18 @@
 """Hinge API client — reverse-engineered from APK decompilation + network analysis."""
 
 import asyncio
+import functools
 import json
 import os
+import time
 import uuid
+from collections.abc import Callable, Mapping
+from dataclasses import replace
 from datetime import datetime, timezone
 from typing import Any, Literal
 
 import httpx
+from pydantic import TypeAdapter
 
 from hinge.core.logging_config import logger as log
 from hinge.error import HingeAuthError, HingeEmail2FAError
@@ -40,6 +45,20 @@ from hinge.models import (
     UserProfile,
     UserProfileV2,
 )
+from hinge.transport.breaker import BreakerTransport, CircuitBreaker
+from hinge.transport.conditional import ConditionalCache
+from hinge.transport.governor import RateGovernor
+from hinge.transport.hedge import LatencyTracker, hedged
+from hinge.transport.pools import PoolConfig, PooledTransport
+from hinge.transport.http import GovernedTransport
+from hinge.transport.retry import (
+    IDEMPOTENT_METHODS,
+    NO_RETRY,
+    RetryPolicy,
+    RetryTransport,
+)
+from hinge.transport.singleflight import SingleFlight
+from hinge.transport.ttl_cache import TTLCache
 
 # --- Constants ---
 
@@ -50,6 +69,97 @@ HINGE_BUILD_NUMBER = "11616"
 OS_VERSION = "26.0"
 SESSIONS_DIR = "hinge_sessions"
 
+# Seconds a self-data GET stays cached. Writes through this client
+# invalidate (or write through to) the affected paths.
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "/user/v3": 300.0,
+    "/content/v2": 300.0,
+    "/preference/v2/selected": 300.0,
+    "/content/v1/settings": 600.0,
+    "/likelimit": 60.0,
+}
+
+# Connection pools per upstream host. Sendbird REST is chat sync only —
+# smaller pool, shorter reads.
+DEFAULT_HINGE_POOL = PoolConfig()
+DEFAULT_SENDBIRD_POOL = PoolConfig(max_connections=10, read_timeout=15.0)
+
+# Batch profile reads issued in chunks by the adapter — a single slow
+# chunk holds up the whole hydration, so these may be hedged.
+HEDGED_PATHS = frozenset({"/content/v2/public", "/user/v2/public"})
+
+# GETs revalidated with ETag/Last-Modified: self data and catalogs that
+# are re-read often and rarely change. One-off batch lookups (e.g. the
+# /public profile reads) stay out so they cannot evict these.
+CONDITIONAL_PATHS = frozenset(
+    {
+        "/user/v3",
+        "/content/v2",
+        "/preference/v2/selected",
+        "/config/v3",
+        "/connection/v2",
+        "/standouts/v3",
+    },
+)
+
+
+# Auth/session calls are never retried, whatever the method. A GET
+# /auth/refresh rotates the token server-side, so replaying one whose
+# response was lost would send an already-invalidated token.
+_AUTH_ENDPOINTS = frozenset(
+    {
+        ("GET", "/auth/refresh"),
+        ("POST", "/auth/sms/v2/initiate"),
+        ("POST", "/auth/sms/v2"),
+        ("POST", "/auth/device/validate"),
+        ("POST", "/identity/install"),
+        ("POST", "/message/authenticate"),
+    },
+)
+
+
+def _endpoint_retry_policies(
+    base: RetryPolicy,
+) -> dict[tuple[str, str], RetryPolicy]:
+    """Per-endpoint overrides of ``base``, keyed by ``(method, path)``.
+
+    Idempotent methods not listed here use ``base``; other methods are
+    only retried when listed (``/rate/*`` and ``_AUTH_ENDPOINTS`` never
+    are).
+    """
+    return {
+        **dict.fromkeys(_AUTH_ENDPOINTS, NO_RETRY),
+        # Read-only despite being POSTs.
+        ("POST", "/rec/v2"): base,
+        ("POST", "/prompts"): base,
+        ("POST", "/content/v1/answer/evaluate"): base,
+        # A lone 401 here is often a throttle in disguise (session health).
+        ("GET", "/likelimit"): replace(
+            base,
+            retry_statuses=base.retry_statuses | {401},
+        ),
+    }
+
+
+def _decode(raw: bytes) -> Any:
+    """Default ``_get_model`` parser — plain JSON decode, no validation."""
+    return json.loads(raw)
+
+
+@functools.cache
+def _type_adapter(tp: Any) -> TypeAdapter[Any]:
+    """Return the (process-wide, built once) TypeAdapter for ``tp``."""
+    return TypeAdapter(tp)
+
+
+def _json_as[T](tp: type[T]) -> Callable[[bytes], T]:
+    """Parser that validates raw response bytes straight into ``tp``.
+
+    ``validate_json`` parses and validates in one pass inside
+    pydantic-core, skipping the intermediate ``response.json()`` dicts.
+    """
+    return _type_adapter(tp).validate_json
+
 
 def _derive_auth_state(
     saved_state: str,
@@ -79,6 +189,7 @@ def _derive_auth_state(
 
 
 async def _preflight_refresh_session(
+    http: httpx.AsyncClient,
     data: dict[str, Any],
     fpath: str,
     now: datetime,
@@ -86,10 +197,10 @@ async def _preflight_refresh_session(
 ) -> str:
     """Attempt to refresh a single session's token if expiring soon.
 
-    Returns one of: "refreshed", "skipped", "failed", "expired".
+    ``http`` is shared across all sessions so sequential refreshes reuse
+    one warm connection. Returns one of: "refreshed", "skipped",
+    "failed", "expired".
     """
-    import httpx
-
     token = data.get("hinge_token", "")
     expires_str = data.get("hinge_token_expires")
     saved_state = data.get("auth_state", "")
@@ -114,28 +225,24 @@ async def _preflight_refresh_session(
         expires=expires_str,
     )
     try:
-        async with httpx.AsyncClient(
-            base_url=BASE_URL,
-            timeout=15.0,
-        ) as tmp_client:
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "X-Device-Platform": "iOS",
-                "User-Agent": (
-                    f"Hinge/{HINGE_BUILD_NUMBER} CFNetwork/3857.100.1 Darwin/25.0.0"
-                ),
-                "Accept": "*/*",
-                "X-Device-Id": data.get("device_id", ""),
-                "X-Install-Id": data.get("install_id", ""),
-                "X-Session-Id": data.get("session_id", ""),
-                "X-App-Version": HINGE_APP_VERSION,
-                "X-Build-Number": HINGE_BUILD_NUMBER,
-                "X-OS-Version": OS_VERSION,
-            }
-            resp = await tmp_client.get(
-                "/auth/refresh",
-                headers=headers,
-            )
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "X-Device-Platform": "iOS",
+            "User-Agent": (
+                f"Hinge/{HINGE_BUILD_NUMBER} CFNetwork/3857.100.1 Darwin/25.0.0"
+            ),
+            "Accept": "*/*",
+            "X-Device-Id": data.get("device_id", ""),
+            "X-Install-Id": data.get("install_id", ""),
+            "X-Session-Id": data.get("session_id", ""),
+            "X-App-Version": HINGE_APP_VERSION,
+            "X-Build-Number": HINGE_BUILD_NUMBER,
+            "X-OS-Version": OS_VERSION,
+        }
+        resp = await http.get(
+            "/auth/refresh",
+            headers=headers,
+        )
         if resp.status_code == 201:
             resp_data = resp.json()
             data["hinge_token"] = resp_data["token"]
@@ -183,7 +290,6 @@ class HingeClient:
     installed: bool
     install_id: str
     phone_number: str
-    recommendations: dict[str, RecommendationSubject]
     sendbird_jwt: str
     sendbird_jwt_expires: datetime
     session_file: str
@@ -200,20 +306,48 @@ class HingeClient:
         self,
         phone_number: str,
         client: httpx.AsyncClient | None = None,
+        governor: RateGovernor | None = None,
+        cache_ttls: Mapping[str, float] | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_timeout: float = 30.0,
+        hedge_requests: bool = False,
+        hinge_pool: PoolConfig | None = None,
+        sendbird_pool: PoolConfig | None = None,
     ) -> None:
         """Initialize the HingeClient with a phone number.
 
         Args:
             phone_number: The phone number associated with the Hinge account.
             client: Optional HTTP client to use.
+            governor: Shared rate governor for Hinge API traffic. Ignored
+                when ``client`` is supplied (the caller owns its transport).
+            cache_ttls: Per-path TTLs (seconds) for cached GETs; defaults
+                to ``DEFAULT_CACHE_TTLS``. Paths not listed are never cached.
+            conditional_cache: ETag/Last-Modified store used to revalidate
+                GETs; defaults to an in-memory ``ConditionalCache``.
+            retry_policy: Base retry policy for Hinge API requests (see
+                ``_endpoint_retry_policies``). Ignored when ``client`` is
+                supplied.
+            breaker_failure_threshold: Consecutive failures (5xx/network)
+                that open a host's circuit breaker.
+            breaker_reset_timeout: Seconds an open breaker waits before
+                letting a probe request through.
+            hedge_requests: Re-issue a ``HEDGED_PATHS`` GET that is still
+                running past that path's observed p95 latency, taking
+                whichever copy answers first.
+            hinge_pool: Connection pool and timeouts for the Hinge API;
+                defaults to ``DEFAULT_HINGE_POOL``. Ignored when ``client``
+                is supplied.
+            sendbird_pool: Same for Sendbird REST; defaults to
+                ``DEFAULT_SENDBIRD_POOL``.
 
         """
         self.phone_number = phone_number
         self.auth_state: str = self.AUTH_UNAUTHENTICATED
         self._pending_email_2fa: dict[str, str] | None = None  # {case_id, email}
         self.feed_exhausted: bool = False
-        self._standouts_etag: str | None = None
-        self._standouts_cache: StandoutsV3Response | None = None
 
         # Ensure sessions directory exists
         os.makedirs(SESSIONS_DIR, exist_ok=True)
@@ -221,11 +355,39 @@ class HingeClient:
         # Session file is per-phone-number
         self.session_file = self._session_file_for(phone_number)
         self._load_or_create_session()
-        self._load_recommendations()
 
+        self.governor = governor or RateGovernor()
+        self._inflight = SingleFlight()
+        self._cache = TTLCache()
+        self._conditional = conditional_cache or ConditionalCache()
+        self._cache_ttls = dict(
+            DEFAULT_CACHE_TTLS if cache_ttls is None else cache_ttls,
+        )
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._retry_policies = _endpoint_retry_policies(self.retry_policy)
+        self.hedge_requests = hedge_requests
+        self._latency = LatencyTracker()
+        hinge_hosts = {httpx.URL(BASE_URL).host}
+        pools = PooledTransport(
+            {
+                httpx.URL(BASE_URL).host: hinge_pool or DEFAULT_HINGE_POOL,
+                self.SENDBIRD_REST_HOST: sendbird_pool or DEFAULT_SENDBIRD_POOL,
+            },
+        )
+        self._breakers = BreakerTransport(
+            GovernedTransport(self.governor, hosts=hinge_hosts, transport=pools),
+            failure_threshold=breaker_failure_threshold,
+            reset_timeout=breaker_reset_timeout,
+        )
         self.client = client or httpx.AsyncClient(
             base_url=BASE_URL,
             timeout=30.0,
+            transport=RetryTransport(
+                self._breakers,
+                policy_for=self.retry_policy_for,
+                hosts=hinge_hosts,
+                governor=self.governor,
+            ),
         )
         self._BASE_HEADERS = {
             "X-Device-Platform": "iOS",
@@ -241,6 +403,28 @@ class HingeClient:
             "X-Device-Region": "FR",
         }
 
+    def breaker(self, host: str | None = None) -> CircuitBreaker:
+        """Return the circuit breaker for ``host`` (default: the Hinge API)."""
+        return self._breakers.breaker(host or httpx.URL(BASE_URL).host)
+
+    def upstream_degraded(self, host: str | None = None) -> bool:
+        """True while ``host``'s breaker is open — skip live calls, serve the DB."""
+        return self.breaker(host).state == "open"
+
+    def breaker_snapshots(self) -> dict[str, dict[str, str | int | float]]:
+        """Return the state of every breaker created so far, keyed by host."""
+        return {
+            host: breaker.snapshot()
+            for host, breaker in self._breakers.breakers.items()
+        }
+
+    def retry_policy_for(self, request: httpx.Request) -> RetryPolicy:
+        """Return the retry policy that applies to ``request``."""
+        policy = self._retry_policies.get((request.method, request.url.path))
+        if policy is not None:
+            return policy
+        return self.retry_policy if request.method in IDEMPOTENT_METHODS else NO_RETRY
+
     def _get_default_headers(self) -> dict[str, str]:
         """Construct the default headers for most Hinge API requests."""
         headers = self._BASE_HEADERS.copy()
@@ -258,6 +442,132 @@ class HingeClient:
             headers["Authorization"] = f"Bearer {self.hinge_token}"
         return headers
 
+    async def _get_model[T](
+        self,
+        path: str,
+        parse: Callable[[bytes], T] = _decode,
+        *,
+        params: dict[str, str] | None = None,
+    ) -> T:
+        """GET ``path`` and parse the raw body, coalescing identical calls.
+
+        Concurrent callers with the same path and params share one
+        upstream request and one parsed result (treat it as read-only).
+        Paths with a TTL in ``_cache_ttls`` are served from the cache
+        until they expire or a write invalidates them.
+        """
+        key = ("GET", path, tuple(sorted((params or {}).items())))
+        ttl = self._cache_ttls.get(path, 0.0)
+        if ttl <= 0:
+            return await self._inflight.do(
+                key,
+                lambda: self._fetch(path, parse, params),
+            )
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        # Fence on the generation so a fetch racing a write neither
+        # repopulates the cache nor is joined by post-write callers.
+        generation = self._cache.generation(path)
+
+        async def _fetch_and_store() -> T:
+            result = await self._fetch(path, parse, params)
+            self._cache.set(key, result, ttl, generation=generation)
+            return result
+
+        return await self._inflight.do((*key, generation), _fetch_and_store)
+
+    async def _fetch[T](
+        self,
+        path: str,
+        parse: Callable[[bytes], T],
+        params: dict[str, str] | None,
+    ) -> T:
+        """Issue the GET, hedged for ``HEDGED_PATHS`` (see ``hedge_requests``)."""
+        if path in HEDGED_PATHS:
+            return await self._fetch_hedged(path, parse, params)
+        return await self._fetch_once(path, parse, params)
+
+    async def _fetch_hedged[T](
+        self,
+        path: str,
+        parse: Callable[[bytes], T],
+        params: dict[str, str] | None,
+    ) -> T:
+        """Fetch, hedging past the path's p95 and recording latencies."""
+
+        async def _timed() -> T:
+            started = time.monotonic()
+            result = await self._fetch_once(path, parse, params)
+            self._latency.observe(path, time.monotonic() - started)
+            return result
+
+        delay = self._latency.quantile(path) if self.hedge_requests else None
+        return await hedged(
+            _timed,
+            delay,
+            on_hedge=lambda: log.info(
+                "upstream_hedged",
+                path=path,
+                after_seconds=round(delay or 0.0, 3),
+            ),
+        )
+
+    async def _fetch_once[T](
+        self,
+        path: str,
+        parse: Callable[[bytes], T],
+        params: dict[str, str] | None,
+    ) -> T:
+        """Issue one GET; ``CONDITIONAL_PATHS`` revalidate stored validators."""
+        key = ("GET", path, tuple(sorted((params or {}).items())))
+        conditional = path in CONDITIONAL_PATHS
+        entry = self._conditional.get(key) if conditional else None
+        headers = self._get_default_headers()
+        if entry is not None:
+            headers.update(entry.validators())
+
+        response = await self.client.get(path, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            log.debug("hinge_get_not_modified", path=path)
+            return entry.parsed(parse)
+
+        response.raise_for_status()
+        result = parse(response.content)
+        if conditional:
+            self._conditional.store(
+                key,
+                response.headers,
+                response.content,
+                parse,
+                result,
+            )
+        return result
+
+    def _reset_caches(self) -> None:
+        """Drop cached responses and validators of the previous identity."""
+        self._cache.clear()
+        self._conditional.clear()
+
+    def _adopt_identity(self, identity_id: str) -> None:
+        """Switch to ``identity_id``, dropping caches if it is a new identity."""
+        if identity_id != self.identity_id:
+            self._reset_caches()
+            log.info("hinge_identity_changed")
+        self.identity_id = identity_id
+
+    def flush_conditional_cache(self) -> None:
+        """Persist pending conditional-cache changes now (call at shutdown)."""
+        self._conditional.flush()
+
+    def _cache_put(self, path: str, value: Any) -> None:
+        """Write ``value`` through to the cache entry for a param-less GET."""
+        self._cache.invalidate(path)
+        ttl = self._cache_ttls.get(path, 0.0)
+        if ttl > 0:
+            self._cache.set(("GET", path, ()), value, ttl)
+
     # --- Token Refresh ---
 
     def _token_expires_within(self, days: int = 7) -> bool:
@@ -294,7 +604,7 @@ class HingeClient:
             if response.status_code == 201:
                 data = response.json()
                 self.hinge_token = data["token"]
-                self.identity_id = data.get("identityId", self.identity_id)
+                self._adopt_identity(data.get("identityId", self.identity_id))
                 self.hinge_token_expires = datetime.fromisoformat(data["expires"])
                 # MUST save immediately — old token is already dead
                 self._save_session()
@@ -377,7 +687,7 @@ class HingeClient:
         response.raise_for_status()
         auth_data = HingeAuthToken.model_validate(response.json())
         self.hinge_token = auth_data.token
-        self.identity_id = auth_data.identity_id
+        self._adopt_identity(auth_data.identity_id)
         self.hinge_token_expires = auth_data.expires
         self.auth_state = self.AUTH_AUTHENTICATED
         self._save_session()
@@ -409,7 +719,7 @@ class HingeClient:
 
         auth_data = HingeAuthToken.model_validate(response.json())
         self.hinge_token = auth_data.token
-        self.identity_id = auth_data.identity_id
+        self._adopt_identity(auth_data.identity_id)
         self.hinge_token_expires = auth_data.expires
         self.auth_state = self.AUTH_AUTHENTICATED
         self._pending_email_2fa = None
@@ -463,29 +773,22 @@ class HingeClient:
         """Ping ``/likelimit`` to verify the session is truly alive.
 
         Returns the ``LikeLimit`` on success, or ``None`` if the session
-        is dead (confirmed by two consecutive 401s).  A single 401 may be
-        transient (rate limit masquerading as auth error), so we retry
-        once after a short delay before declaring the session dead.
+        is dead. A single 401 may be transient (rate limit masquerading
+        as auth error), so the ``/likelimit`` retry policy already
+        retries it with backoff — a 401 surfacing here is confirmed.
         """
         if not self.hinge_token:
             return None
 
-        for attempt in range(2):
-            try:
-                return await self.get_like_limit()
-            except httpx.HTTPStatusError as exc:
-                if exc.response.status_code == 401:
-                    if attempt == 0:
-                        log.info("session_health_retry")
-                        await asyncio.sleep(3)
-                        continue
-                    # Second 401 — session is genuinely dead
-                    log.warning("session_health_dead")
-                    self.auth_state = self.AUTH_UNAUTHENTICATED
-                    self._save_session()
-                    return None
+        try:
+            return await self.get_like_limit()
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code != 401:
                 raise
-        return None  # unreachable, but satisfies type checker
+        log.warning("session_health_dead")
+        self.auth_state = self.AUTH_UNAUTHENTICATED
+        self._save_session()
+        return None
 
     async def is_session_valid(self) -> bool:
         """Check if the current session is still valid via /likelimit.
@@ -530,37 +833,18 @@ class HingeClient:
         )
         response.raise_for_status()
 
-        recs_data = response.json()
-        new_count = 0
-
-        if "feeds" in recs_data:
-            for feed in recs_data["feeds"]:
-                feed_origin = feed.get("origin")
-                if "subjects" in feed:
-                    for subject_data in feed["subjects"]:
-                        subject_data["origin"] = feed_origin
-                        subject_id = subject_data.get(
-                            "subjectId",
-                        ) or subject_data.get("subject_id")
-                        if subject_id and subject_id not in self.recommendations:
-                            self.recommendations[subject_id] = (
-                                RecommendationSubject.model_validate(subject_data)
-                            )
-                            new_count += 1
+        recs = _json_as(RecommendationsResponse)(response.content)
 
         # Track feed exhaustion: empty subjects = exhausted
-        total_subjects = sum(
-            len(f.get("subjects", [])) for f in recs_data.get("feeds", [])
-        )
+        total_subjects = sum(len(f.subjects) for f in recs.feeds)
         self.feed_exhausted = total_subjects == 0
 
         log.info(
             "hinge_recommendations_fetched",
-            new=new_count,
+            subjects=total_subjects,
             exhausted=self.feed_exhausted,
         )
-        self._save_recommendations()
-        return RecommendationsResponse.model_validate(recs_data)
+        return recs
 
     async def repeat_profiles(self) -> dict[str, Any]:
         """Recycle previously seen profiles.
@@ -580,48 +864,26 @@ class HingeClient:
 
     async def get_self_profile(self) -> SelfProfileResponse:
         """Fetch the authenticated user's own profile data."""
-        response = await self.client.get(
-            "/user/v3",
-            headers=self._get_default_headers(),
-        )
-        response.raise_for_status()
-        return SelfProfileResponse.model_validate(response.json())
+        return await self._get_model("/user/v3", _json_as(SelfProfileResponse))
 
     async def get_self_content(self) -> SelfContentResponse:
         """Fetch the authenticated user's own content."""
-        response = await self.client.get(
-            "/content/v2",
-            headers=self._get_default_headers(),
-        )
-        response.raise_for_status()
-        return SelfContentResponse.model_validate(response.json())
+        return await self._get_model("/content/v2", _json_as(SelfContentResponse))
 
     async def get_profile_state(self) -> dict[str, Any]:
         """Fetch profile completion state (GET /profilestate/profile)."""
-        response = await self.client.get(
-            "/profilestate/profile",
-            headers=self._get_default_headers(),
-        )
-        response.raise_for_status()
-        return response.json()
+        return await self._get_model("/profilestate/profile")
 
     async def get_profile_basics_missing(self) -> dict[str, Any]:
         """Fetch missing profile basics (GET /profilestate/basics/missing)."""
-        response = await self.client.get(
-            "/profilestate/basics/missing",
-            headers=self._get_default_headers(),
-        )
-        response.raise_for_status()
-        return response.json()
+        return await self._get_model("/profilestate/basics/missing")
 
     async def get_self_preferences(self) -> Preferences:
         """Fetch the authenticated user's preferences."""
-        response = await self.client.get(
+        return await self._get_model(
             "/preference/v2/selected",
-            headers=self._get_default_headers(),
+            _json_as(Preferences),
         )
-        response.raise_for_status()
-        return Preferences.model_validate(response.json())
 
     async def update_self_preferences(self, payload: Preferences) -> dict[str, Any]:
         """Update the authenticated user's preferences."""
@@ -631,6 +893,7 @@ class HingeClient:
             json=_payload,
             headers=self._get_default_headers(),
         )
+        self._cache.invalidate("/preference/v2/selected")
         response.raise_for_status()
         return response.json()
 
@@ -645,6 +908,7 @@ class HingeClient:
             json=payload,
             headers=self._get_default_headers(),
         )
+        self._cache.invalidate("/user/v3")
         response.raise_for_status()
         return response.json()
 
@@ -661,6 +925,7 @@ class HingeClient:
             json=payload,
             headers=self._get_default_headers(),
         )
+        self._cache.invalidate("/content/v2")
         response.raise_for_status()
         return response.json()
 
@@ -679,6 +944,7 @@ class HingeClient:
             json={"photos": photos},
             headers=self._get_default_headers(),
         )
+        self._cache.invalidate("/content/v2")
         response.raise_for_status()
         return response.json()
 
@@ -698,50 +964,37 @@ class HingeClient:
 
     async def get_profiles(self, user_ids: list[str]) -> list[UserProfile]:
         """Fetch public profile data for a list of user IDs (v3, demographics only)."""
-        params = {"ids": ",".join(user_ids)}
-        response = await self.client.get(
+        return await self._get_model(
             "/user/v3/public",
-            params=params,
-            headers=self._get_default_headers(),
+            _json_as(list[UserProfile]),
+            params={"ids": ",".join(user_ids)},
         )
-        response.raise_for_status()
-        return [UserProfile.model_validate(user) for user in response.json()]
 
     async def get_profiles_v2(self, user_ids: list[str]) -> list[UserProfileV2]:
         """Fetch profile + content in one call (v2, no pHash/waveform/poll)."""
-        params = {"ids": ",".join(user_ids)}
-        response = await self.client.get(
+        return await self._get_model(
             "/user/v2/public",
-            params=params,
-            headers=self._get_default_headers(),
+            _json_as(list[UserProfileV2]),
+            params={"ids": ",".join(user_ids)},
         )
-        response.raise_for_status()
-        return [UserProfileV2.model_validate(user) for user in response.json()]
 
     async def get_profile_content(self, user_ids: list[str]) -> list[ProfileContent]:
         """Fetch content (photos, prompts) for a list of user IDs."""
-        params = {"ids": ",".join(user_ids)}
-        response = await self.client.get(
+        return await self._get_model(
             "/content/v2/public",
-            params=params,
-            headers=self._get_default_headers(),
+            lambda raw: _json_as(list[ProfileContent] | None)(raw) or [],
+            params={"ids": ",".join(user_ids)},
         )
-        response.raise_for_status()
-        data = response.json()
-        if not data:
-            return []
-        return [ProfileContent.model_validate(c) for c in data]
 
     # --- Rating ---
 
     async def get_like_limit(self) -> LikeLimit:
         """Fetch the authenticated user's daily like and superlike limits."""
-        response = await self.client.get(
-            "/likelimit",
-            headers=self._get_default_headers(),
-        )
-        response.raise_for_status()
-        return LikeLimit.model_validate(response.json())
+        return await self._get_model("/likelimit", _json_as(LikeLimit))
+
+    def invalidate_like_limit(self) -> None:
+        """Drop the cached like limit; call after any rating is sent."""
+        self._cache.invalidate("/likelimit")
 
     async def _run_text_review(self, text: str, receiver_id: str) -> str:
         """Run the pre-flight text moderation check."""
@@ -807,8 +1060,12 @@ class HingeClient:
             json=payload.model_dump(by_alias=True, exclude_none=True),
             headers=self._get_default_headers(),
         )
+        self.invalidate_like_limit()
         response.raise_for_status()
-        return LikeResponse.model_validate(response.json())
+        result = _json_as(LikeResponse)(response.content)
+        # The rate response carries the post-like limits — write them through.
+        self._cache_put("/likelimit", result.limit)
+        return result
 
     # --- Respond to likes / block matches ---
 
@@ -831,6 +1088,7 @@ class HingeClient:
             json=payload.model_dump(by_alias=True, exclude_none=True),
             headers=self._get_default_headers(),
         )
+        self.invalidate_like_limit()
         response.raise_for_status()
         return response.json()
 
@@ -861,77 +1119,41 @@ class HingeClient:
         sort: str | None = None,
     ) -> LikesYouResponse:
         """Fetch profiles who liked you (GET /like/v2)."""
-        params = {}
-        if sort:
-            params["sort"] = sort
-        response = await self.client.get(
+        return await self._get_model(
             "/like/v2",
-            params=params or None,
-            headers=self._get_default_headers(),
+            _json_as(LikesYouResponse),
+            params={"sort": sort} if sort else None,
         )
-        response.raise_for_status()
-        return LikesYouResponse.model_validate(response.json())
 
     async def get_matches(self) -> dict[str, Any]:
         """Fetch match list (GET /connection/v2)."""
-        response = await self.client.get(
-            "/connection/v2",
-            headers=self._get_default_headers(),
-        )
-        response.raise_for_status()
-        return response.json()
+        return await self._get_model("/connection/v2")
 
     async def get_standouts(self) -> StandoutsV2Response:
         """Fetch standouts feed (GET /standouts/v2)."""
-        response = await self.client.get(
+        return await self._get_model(
             "/standouts/v2",
-            headers=self._get_default_headers(),
+            _json_as(StandoutsV2Response),
         )
-        response.raise_for_status()
-        return StandoutsV2Response.model_validate(response.json())
 
-    async def get_standouts_v3(self) -> StandoutsV3Response | None:
-        """Fetch standouts feed (GET /standouts/v3) with ETag caching.
+    async def get_standouts_v3(self) -> StandoutsV3Response:
+        """Fetch standouts feed (GET /standouts/v3).
 
-        Returns None if server returns 304 Not Modified (use cached data).
+        Revalidated with ``If-None-Match``; a 304 returns the cached model.
         """
-        headers = self._get_default_headers()
-        if self._standouts_etag:
-            headers["If-None-Match"] = self._standouts_etag
-
-        response = await self.client.get(
+        return await self._get_model(
             "/standouts/v3",
-            headers=headers,
+            _json_as(StandoutsV3Response),
         )
-        if response.status_code == 304:
-            return self._standouts_cache
-
-        response.raise_for_status()
-        etag = response.headers.get("ETag")
-        if etag:
-            self._standouts_etag = etag
-
-        result = StandoutsV3Response.model_validate(response.json())
-        self._standouts_cache = result
-        return result
 
     async def get_user_traits(self) -> dict[str, Any]:
         """Fetch user traits (GET /user/v2/traits)."""
-        response = await self.client.get(
-            "/user/v2/traits",
-            headers=self._get_default_headers(),
-        )
-        response.raise_for_status()
-        return response.json()
+        return await self._get_model("/user/v2/traits")
 
     async def get_fresh_start_eligible(self) -> bool:
         """Check if eligible for fresh start (GET /freshstart/eligible)."""
-        response = await self.client.get(
-            "/freshstart/eligible",
-            headers=self._get_default_headers(),
-        )
-        response.raise_for_status()
-        return response.json().get("eligible", False)
+        data = await self._get_model("/freshstart/eligible")
+        return data.get("eligible", False)
 
     async def do_fresh_start(self) -> bool:
         """Execute a fresh start (POST /freshstart)."""
@@ -939,35 +1161,21 @@ class HingeClient:
             "/freshstart",
             headers=self._get_default_headers(),
         )
+        self._cache.clear()
         response.raise_for_status()
         return True
 
     async def get_store_account(self) -> dict[str, Any]:
         """Fetch store/account info (GET /store/v2/account)."""
-        response = await self.client.get(
-            "/store/v2/account",
-            headers=self._get_default_headers(),
-        )
-        response.raise_for_status()
-        return response.json()
+        return await self._get_model("/store/v2/account")
 
     async def get_config(self) -> dict[str, Any]:
         """Fetch server-side enum config (GET /config/v3)."""
-        response = await self.client.get(
-            "/config/v3",
-            headers=self._get_default_headers(),
-        )
-        response.raise_for_status()
-        return response.json()
+        return await self._get_model("/config/v3")
 
     async def get_boost_status(self) -> dict[str, Any]:
         """Fetch boost status (GET /boost/status)."""
-        response = await self.client.get(
-            "/boost/status",
-            headers=self._get_default_headers(),
-        )
-        response.raise_for_status()
-        return response.json()
+        return await self._get_model("/boost/status")
 
     # --- AI evaluation ---
 
@@ -983,18 +1191,16 @@ class HingeClient:
             headers=self._get_default_headers(),
         )
         response.raise_for_status()
-        return PromptEvaluation.model_validate(response.json())
+        return _json_as(PromptEvaluation)(response.content)
 
     # --- Content settings ---
 
     async def get_content_settings(self) -> ContentSettings:
         """Fetch content settings (GET /content/v1/settings)."""
-        response = await self.client.get(
+        return await self._get_model(
             "/content/v1/settings",
-            headers=self._get_default_headers(),
+            _json_as(ContentSettings),
         )
-        response.raise_for_status()
-        return ContentSettings.model_validate(response.json())
 
     async def update_content_settings(
         self,
@@ -1006,8 +1212,11 @@ class HingeClient:
             json=settings.model_dump(by_alias=True),
             headers=self._get_default_headers(),
         )
+        self._cache.invalidate("/content/v1/settings")
         response.raise_for_status()
-        return ContentSettings.model_validate(response.json())
+        result = _json_as(ContentSettings)(response.content)
+        self._cache_put("/content/v1/settings", result)
+        return result
 
     # --- Prompts ---
 
@@ -1026,7 +1235,7 @@ class HingeClient:
         )
         response.raise_for_status()
 
-        return PromptsResponse.model_validate(response.json())
+        return _json_as(PromptsResponse)(response.content)
 
     async def _prompt_payload(self) -> dict[str, Any]:  # noqa: C901
         """Build the payload structure for fetching prompts."""
@@ -1125,6 +1334,7 @@ class HingeClient:
     _SENDBIRD_REST_BASE = (
         "https://api-3cdad91c-1e0d-4a0d-bbee-9671988bf9e9.sendbird.com"
     )
+    SENDBIRD_REST_HOST = httpx.URL(_SENDBIRD_REST_BASE).host
 
     def _sendbird_headers(self) -> dict[str, str]:
         """Headers for Sendbird REST API calls."""
@@ -1133,22 +1343,62 @@ class HingeClient:
             "Content-Type": "application/json",
         }
 
+    _SENDBIRD_CHANNEL_PARAMS = {
+        "show_member": "true",
+        "show_read_receipt": "true",
+        "show_delivery_receipt": "true",
+        "show_metadata": "true",
+    }
+
     async def sendbird_get_conversations(
         self,
         limit: int = 100,
+        *,
+        token: str | None = None,
     ) -> dict[str, Any]:
-        """List match channels from Sendbird."""
+        """List one page of match channels from Sendbird.
+
+        Pass the previous page's ``next`` as ``token`` to continue; an
+        empty ``next`` means the listing is complete.
+        """
         url = (
             f"{self._SENDBIRD_REST_BASE}/v3/users/{self.identity_id}/my_group_channels"
         )
         params = {
-            "show_member": "true",
-            "show_read_receipt": "true",
-            "show_delivery_receipt": "true",
-            "show_metadata": "true",
+            **self._SENDBIRD_CHANNEL_PARAMS,
             "limit": str(limit),
             "order": "latest_last_message",
         }
+        if token:
+            params["token"] = token
+        resp = await self.client.get(
+            url,
+            params=params,
+            headers=self._sendbird_headers(),
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    async def sendbird_get_channel_changelogs(
+        self,
+        *,
+        token: str | None = None,
+        change_ts: int | None = None,
+    ) -> dict[str, Any]:
+        """Channels updated/deleted since ``token`` (or ``change_ts`` in ms).
+
+        Returns ``updated`` channels, ``deleted`` channel URLs, ``has_more``
+        and the ``next`` token to resume from.
+        """
+        url = (
+            f"{self._SENDBIRD_REST_BASE}/v3/users/{self.identity_id}"
+            "/my_group_channels/changelogs"
+        )
+        params = dict(self._SENDBIRD_CHANNEL_PARAMS)
+        if token:
+            params["token"] = token
+        else:
+            params["change_ts"] = str(change_ts or 0)
         resp = await self.client.get(
             url,
             params=params,
@@ -1182,6 +1432,35 @@ class HingeClient:
         resp.raise_for_status()
         return resp.json()
 
+    async def sendbird_get_message_changelogs(
+        self,
+        channel_url: str,
+        *,
+        token: str | None = None,
+        change_ts: int | None = None,
+    ) -> dict[str, Any]:
+        """Messages edited/deleted in a channel since ``token`` (or ``change_ts``).
+
+        Returns ``updated`` messages, ``deleted`` message ids, ``has_more``
+        and the ``next`` token to resume from.
+        """
+        url = (
+            f"{self._SENDBIRD_REST_BASE}/v3/group_channels/{channel_url}"
+            "/messages/changelogs"
+        )
+        params = {"include": "true", "with_sorted_meta_array": "true"}
+        if token:
+            params["token"] = token
+        else:
+            params["change_ts"] = str(change_ts or 0)
+        resp = await self.client.get(
+            url,
+            params=params,
+            headers=self._sendbird_headers(),
+        )
+        resp.raise_for_status()
+        return resp.json()
+
     async def sendbird_mark_as_read(
         self,
         channel_url: str,
@@ -1284,6 +1563,12 @@ class HingeClient:
         safe = phone.replace(" ", "").replace("-", "")
         return os.path.join(SESSIONS_DIR, f"{safe}.json")
 
+    @staticmethod
+    def conditional_cache_file_for(phone: str) -> str:
+        """Return the persisted conditional-GET cache path for a phone number."""
+        safe = phone.replace(" ", "").replace("-", "")
+        return os.path.join(SESSIONS_DIR, f"{safe}.validators")
+
     @staticmethod
     def list_sessions() -> list[dict[str, Any]]:
         """List all saved Hinge sessions.
@@ -1335,9 +1620,13 @@ class HingeClient:
     async def refresh_all_sessions(
         *,
         threshold_days: int = 14,
+        pool: PoolConfig | None = None,
     ) -> dict[str, str]:
         """Refresh tokens for all stored sessions expiring soon.
 
+        All sessions share one short-lived client built from ``pool``
+        (default ``DEFAULT_HINGE_POOL``) instead of a handshake each.
+
         Returns:
             Mapping of phone_number → result ("refreshed", "skipped",
             "failed", "expired").
@@ -1352,24 +1641,31 @@ class HingeClient:
         now = datetime.now(timezone.utc)
         threshold = now + timedelta(days=threshold_days)
 
-        for fname in os.listdir(SESSIONS_DIR):
-            if not fname.endswith(".json"):
-                continue
-            fpath = os.path.join(SESSIONS_DIR, fname)
-            try:
-                with open(fpath) as f:
-                    data = json.load(f)
-            except json.JSONDecodeError, OSError:
-                continue
+        pool = pool or DEFAULT_HINGE_POOL
+        async with httpx.AsyncClient(
+            base_url=BASE_URL,
+            timeout=pool.timeout(),
+            transport=pool.transport(),
+        ) as http:
+            for fname in os.listdir(SESSIONS_DIR):
+                if not fname.endswith(".json"):
+                    continue
+                fpath = os.path.join(SESSIONS_DIR, fname)
+                try:
+                    with open(fpath) as f:
+                        data = json.load(f)
+                except json.JSONDecodeError, OSError:
+                    continue
 
-            result = await _preflight_refresh_session(
-                data,
-                fpath,
-                now,
-                threshold,
-            )
-            phone = data.get("phone_number", fname)
-            results[phone] = result
+                result = await _preflight_refresh_session(
+                    http,
+                    data,
+                    fpath,
+                    now,
+                    threshold,
+                )
+                phone = data.get("phone_number", fname)
+                results[phone] = result
 
         return results
 
@@ -1382,8 +1678,30 @@ class HingeClient:
         self.phone_number = phone_number
         self.session_file = self._session_file_for(phone_number)
         self._load_or_create_session()
+        self._cache.clear()
+        # Validators belong to the previous account — start a fresh store.
+        self._conditional.flush()
+        self._conditional = ConditionalCache(
+            max_entries=self._conditional.max_entries,
+            persist_path=(
+                self.conditional_cache_file_for(phone_number)
+                if self._conditional.persist_path
+                else None
+            ),
+        )
         log.info("hinge_session_switched", phone=phone_number)
 
+    def reload_session(self) -> None:
+        """Re-read the session file (it may have been re-authed elsewhere).
+
+        Caches are dropped when the file now holds a different identity.
+        """
+        previous = self.identity_id
+        self._load_or_create_session()
+        if self.identity_id != previous:
+            self._reset_caches()
+            log.info("hinge_identity_changed")
+
     def _load_or_create_session(self) -> None:
         """Load an existing session or create a fresh one.
 
@@ -1530,35 +1848,3 @@ class HingeClient:
         }
         with open(self.session_file, "w") as f:
             json.dump(session_data, f)
-
-    def _load_recommendations(self) -> None:
-        """Load recommendations from file if available."""
-        self.recommendations = {}
-        recs_file = f"recommendations_{self.session_id}.json"
-
-        if not os.path.exists(recs_file):
-            return
-
-        try:
-            with open(recs_file) as f:
-                recs_data = json.load(f)
-                for subject_id, subject_data in recs_data.items():
-                    self.recommendations[subject_id] = (
-                        RecommendationSubject.model_validate(subject_data)
-                    )
-        except json.JSONDecodeError, KeyError:
-            self.recommendations = {}
-
-    def _save_recommendations(self) -> None:
-        """Save current recommendations to file."""
-        with open(f"recommendations_{self.session_id}.json", "w") as f:
-            serializable = {
-                sid: s.model_dump() for sid, s in self.recommendations.items()
-            }
-            json.dump(serializable, f, indent=2)
-
-    def remove_recommendation(self, subject_id: str) -> None:
-        """Remove a recommendation from memory and save state."""
-        if subject_id in self.recommendations:
-            del self.recommendations[subject_id]
-            self._save_recommendations()
@@ -25,9 +25,72 @@ class Settings(BaseSettings):
     HINGE_BUILD_NUMBER: str = "11616"
     OS_VERSION: str = "26.0"
 
+    # --- Upstream rate governor (AIMD token bucket, requests/second) ---
+    RATE_INITIAL: float = 1.0
+    RATE_MIN: float = 0.1
+    RATE_MAX: float = 5.0
+    RATE_BURST: float = 5.0
+    RATE_INCREASE_STEP: float = 0.02
+    RATE_DECREASE_FACTOR: float = 0.5
+    # Must not exceed RETRY_MAX_RETRY_AFTER, or a 429 without Retry-After
+    # is never retried (bootstrap raises the latter to match if it does).
+    RATE_DEFAULT_COOLDOWN: float = 30.0
+    RATE_BACKGROUND_RESERVE: float = 1.0
+
+    # --- Upstream retries (jittered exponential backoff, seconds) ---
+    RETRY_MAX_ATTEMPTS: int = 3
+    RETRY_BASE_DELAY: float = 0.5
+    RETRY_MAX_DELAY: float = 8.0
+    RETRY_MAX_RETRY_AFTER: float = 30.0
+
+    # --- Circuit breakers (per upstream host) ---
+    BREAKER_FAILURE_THRESHOLD: int = 5
+    BREAKER_RESET_SECONDS: float = 30.0
+
+    # --- HTTP connection pools (per upstream host; HTTP/2 needs h2) ---
+    HTTP2_ENABLED: bool = True
+    POOL_KEEPALIVE_EXPIRY: float = 60.0
+    HINGE_POOL_MAX_CONNECTIONS: int = 20
+    HINGE_POOL_MAX_KEEPALIVE: int = 10
+    HINGE_CONNECT_TIMEOUT: float = 5.0
+    HINGE_READ_TIMEOUT: float = 30.0
+    SENDBIRD_POOL_MAX_CONNECTIONS: int = 10
+    SENDBIRD_POOL_MAX_KEEPALIVE: int = 10
+    SENDBIRD_CONNECT_TIMEOUT: float = 5.0
+    SENDBIRD_READ_TIMEOUT: float = 15.0
+
+    # --- Request budgets (route deadline, hedged batch GETs) ---
+    ROUTE_DEADLINE_SECONDS: float = 8.0
+    HEDGE_BATCH_REQUESTS: bool = False
+
+    # --- Profile hydration (chunk concurrency, freshness TTLs, batching) ---
+    HYDRATE_BATCH_CONCURRENCY: int = 4
+    PROFILE_CONTENT_TTL_HOURS: float = 24.0
+    PROFILE_DEMOGRAPHICS_TTL_HOURS: float = 72.0
+    PROFILE_LOADER_WINDOW_SECONDS: float = 0.01
+    PROMPT_REFRESH_INTERVAL_SECONDS: float = 600.0
+
+    # --- Self-data cache TTLs (seconds; 0 disables caching for that GET) ---
+    CACHE_TTL_SELF_PROFILE: float = 300.0
+    CACHE_TTL_SELF_CONTENT: float = 300.0
+    CACHE_TTL_SELF_PREFERENCES: float = 300.0
+    CACHE_TTL_CONTENT_SETTINGS: float = 600.0
+    CACHE_TTL_LIKE_LIMIT: float = 60.0
+
+    # --- Conditional GET cache (ETag / Last-Modified validators) ---
+    CONDITIONAL_CACHE_MAX_ENTRIES: int = 256
+    CONDITIONAL_CACHE_PERSIST: bool = False
+
     # --- Sendbird (chat) constants ---
     SENDBIRD_APP_ID: str = "3CDAD91C-1E0D-4A0D-BBEE-9671988BF9E9"
 
+    # --- Chat history backfill (background, resumable) ---
+    CHAT_BACKFILL_ENABLED: bool = True
+    CHAT_BACKFILL_CONCURRENCY: int = 2
+    CHAT_BACKFILL_INTERVAL_SECONDS: float = 600.0
+    # Sendbird is not behind the Hinge governor; space history pages out.
+    CHAT_BACKFILL_PAGE_DELAY_SECONDS: float = 1.0
+
     # --- Database ---
     DATABASE_URL: str = "sqlite:///hinge.db"
 
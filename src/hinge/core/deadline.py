@@ -0,0 +1,25 @@
+"""Request-scoped time budgets passed from routes into adapter calls."""
+
+import time
+
+
+class Deadline:
+    """An absolute point on the monotonic clock a request must finish by.
+
+    Created once per route call and handed down to batch methods, which
+    stop waiting on outstanding chunks when it passes and return what
+    they already have.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        """Start a budget of ``seconds`` from now."""
+        self.budget = seconds
+        self._expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left in the budget (never negative)."""
+        return max(0.0, self._expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Whether the budget is used up."""
+        return self.remaining() <= 0.0
@@ -36,3 +36,13 @@ class HingeChatChannel:
         default_factory=lambda: datetime.now(timezone.utc),
     )
     raw_json: str = ""
+
+
+@dataclass
+class HingeChatChannelChanges:
+    """Channel delta from Sendbird's changelogs since a resume token."""
+
+    updated: list[HingeChatChannel]
+    deleted: set[str]
+    connection_ids: set[str]
+    token: str | None
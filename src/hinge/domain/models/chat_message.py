@@ -34,3 +34,13 @@ class HingeChatMessage:
     is_removed: bool = False
     is_silent: bool = False
     is_op_msg: bool = False
+
+
+@dataclass
+class HingeChatMessageChanges:
+    """Edits and deletions in one channel from Sendbird's message changelog."""
+
+    channel_url: str
+    updated: list[HingeChatMessage]
+    deleted: set[int]
+    token: str | None
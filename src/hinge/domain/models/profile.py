@@ -159,3 +159,7 @@ class HingeProfile:
     )
     times_seen: int = 1
     source: str | None = None
+
+    # Hydration freshness (None = never refreshed since first persisted)
+    content_refreshed_at: datetime | None = None
+    demographics_refreshed_at: datetime | None = None
@@ -0,0 +1,19 @@
+"""Hinge rating token domain model."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class HingeRatingToken:
+    """The token Hinge requires to rate (like/skip) one subject.
+
+    Issued per subject by the discover feed (``rec/v2``) and the standouts
+    feeds; standouts tokens carry the feed's expiration.
+    """
+
+    subject_id: str
+    rating_token: str
+    origin: str = "discover"
+    expires_at: datetime | None = None
+    updated_at: datetime | None = None
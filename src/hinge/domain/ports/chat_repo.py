@@ -19,6 +19,16 @@ class HingeChatRepo(ABC):
         """Insert or update a channel row keyed by ``channel_url``."""
         raise NotImplementedError
 
+    @abstractmethod
+    def upsert_channels(self, channels: list[HingeChatChannel]) -> int:
+        """Insert or update a batch of channels. Returns the number written."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def touch_channels(self, channel_urls: set[str], synced_at: datetime) -> int:
+        """Stamp ``last_synced_at`` on channels seen but unchanged upstream."""
+        raise NotImplementedError
+
     @abstractmethod
     def upsert_messages(self, messages: list[HingeChatMessage]) -> int:
         """Insert or update a batch of messages. Returns the number written."""
@@ -49,7 +59,25 @@ class HingeChatRepo(ABC):
         """Fetch messages for a channel, newest-first, paginated by timestamp."""
         raise NotImplementedError
 
+    @abstractmethod
+    def message_cursors(self) -> dict[str, tuple[datetime, int]]:
+        """Per-channel high-water mark: newest ``created_at`` and ``message_id``.
+
+        Channels with no stored messages are absent from the result.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def oldest_message_at(self, channel_url: str) -> datetime | None:
+        """``created_at`` of the oldest stored message in a channel, or None."""
+        raise NotImplementedError
+
     @abstractmethod
     def mark_channels_orphan(self, orphan_urls: set[str]) -> int:
         """Flag channels as unmatched. Returns the number updated."""
         raise NotImplementedError
+
+    @abstractmethod
+    def mark_messages_removed(self, message_ids: set[int]) -> int:
+        """Flag messages deleted upstream as removed. Returns the number updated."""
+        raise NotImplementedError
@@ -5,6 +5,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any
 
+from hinge.core.deadline import Deadline
 from hinge.domain.models.like_limit import HingeLikeLimit
 from hinge.domain.models.match import HingeMatch
 from hinge.domain.models.profile import HingeProfile
@@ -37,24 +38,70 @@ class HingeApiPort(ABC):
     async def get_profiles_quick(
         self,
         subject_ids: list[str],
+        *,
+        deadline: Deadline | None = None,
     ) -> dict[str, HingeProfile]:
-        """Fetch profile + basic content in one call (v2, no pHash/waveform/poll)."""
+        """Fetch profile + basic content in one call (v2, no pHash/waveform/poll).
+
+        Batches still outstanding when ``deadline`` passes are omitted.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_active_subject_ids(self, subject_ids: list[str]) -> set[str]:
+        """Return which of ``subject_ids`` still resolve to a public profile.
+
+        One upstream call; errors propagate so callers can tell "not
+        found" apart from "could not check".
+        """
         raise NotImplementedError
 
     @abstractmethod
     async def refresh_demographics(
         self,
         profiles: list[HingeProfile],
-    ) -> None:
-        """Re-fetch demographics from API and update profiles in-place."""
+        *,
+        force: bool = False,
+        deadline: Deadline | None = None,
+    ) -> list[HingeProfile]:
+        """Re-fetch demographics from API and update profiles in-place.
+
+        Only profiles past their freshness TTL are touched unless
+        ``force``; returns the ones that were refreshed before
+        ``deadline`` (if any) passed.
+        """
         raise NotImplementedError
 
     @abstractmethod
     async def hydrate_profiles(
         self,
         profiles: list[HingeProfile],
-    ) -> None:
-        """Fetch content and merge into existing profiles in-place."""
+        *,
+        force: bool = False,
+        deadline: Deadline | None = None,
+    ) -> list[HingeProfile]:
+        """Fetch content and merge into existing profiles in-place.
+
+        Only profiles past their freshness TTL are touched unless
+        ``force``; returns the ones that were refreshed before
+        ``deadline`` (if any) passed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def refresh_and_hydrate(
+        self,
+        profiles: list[HingeProfile],
+        *,
+        force: bool = False,
+        deadline: Deadline | None = None,
+    ) -> list[HingeProfile]:
+        """Refresh demographics and content in-place, sharing v2 fetches.
+
+        Only profiles past their freshness TTL are touched unless
+        ``force``; returns the ones that were refreshed before
+        ``deadline`` (if any) passed.
+        """
         raise NotImplementedError
 
     # Rating
@@ -93,3 +93,13 @@ class HingeProfileRepo(ABC):
     def get_untyped_rejections(self) -> set[str]:
         """Get subject_ids of rejected profiles with no rejection_type."""
         raise NotImplementedError
+
+    @abstractmethod
+    def load_content(self, profiles: list[HingeProfile]) -> None:
+        """Attach stored photos/prompts/polls/video prompt/date ideas in-place."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_content(self, profiles: list[HingeProfile]) -> None:
+        """Replace stored content for these profiles with their current content."""
+        raise NotImplementedError
@@ -0,0 +1,40 @@
+"""Hinge rating token repository port."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from hinge.domain.models.rating_token import HingeRatingToken
+
+
+class HingeRatingTokenRepo(ABC):
+    """Abstract store of the latest rating token per subject.
+
+    Written on every feed fetch and read on every like/skip, so lookups
+    are by primary key and writes are per-row upserts — never a rewrite
+    of the whole set. Expired tokens are treated as absent.
+    """
+
+    @abstractmethod
+    def get(self, subject_id: str) -> HingeRatingToken | None:
+        """Return the live token for one subject, or None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_many(self, subject_ids: list[str]) -> dict[str, HingeRatingToken]:
+        """Return live tokens for the given subjects, keyed by subject_id."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_many(self, tokens: list[HingeRatingToken]) -> int:
+        """Insert or replace tokens. Returns the number written."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, subject_id: str) -> None:
+        """Forget a subject's token (e.g. once it has been spent)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def purge_expired(self, now: datetime | None = None) -> int:
+        """Delete tokens whose expiry has passed. Returns the number removed."""
+        raise NotImplementedError
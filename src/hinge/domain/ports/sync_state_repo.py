@@ -0,0 +1,27 @@
+"""Hinge sync state repository port."""
+
+from abc import ABC, abstractmethod
+
+
+class HingeSyncStateRepo(ABC):
+    """Abstract key/value store for incremental sync resume points."""
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Return the stored value for ``key``, or None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        """Return stored values for ``keys``; absent keys are omitted."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Insert or replace the value for ``key``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Forget ``key`` (forces the next sync to start from scratch)."""
+        raise NotImplementedError
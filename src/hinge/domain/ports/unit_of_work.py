@@ -8,11 +8,13 @@ from hinge.domain.ports.chat_repo import HingeChatRepo
 from hinge.domain.ports.decision_repo import HingeDecisionRepo
 from hinge.domain.ports.profile_repo import HingeProfileRepo
 from hinge.domain.ports.prompts_repo import HingePromptsRepo
+from hinge.domain.ports.rating_token_repo import HingeRatingTokenRepo
 from hinge.domain.ports.session_repo import HingeSessionRepo
+from hinge.domain.ports.sync_state_repo import HingeSyncStateRepo
 
 
 class HingeUnitOfWorkPort(ABC):
-    """Abstract Unit of Work that aggregates the four Hinge repositories.
+    """Abstract Unit of Work that aggregates the Hinge repositories.
 
     Concrete implementations open a SQLAlchemy session in ``__enter__`` and
     expose it via ``session`` so routes that need raw SQL (analytics
@@ -26,6 +28,8 @@ class HingeUnitOfWorkPort(ABC):
     sessions: HingeSessionRepo
     chat: HingeChatRepo
     prompts: HingePromptsRepo
+    tokens: HingeRatingTokenRepo
+    sync_state: HingeSyncStateRepo
 
     @abstractmethod
     def __enter__(self) -> "HingeUnitOfWorkPort":
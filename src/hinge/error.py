@@ -49,3 +49,21 @@ class HingeEmail2FAError(HingeError):
         self.email = email
         msg = f"Email 2FA required. Check email ({email})."
         super().__init__(msg)
+
+
+class HingeUpstreamUnavailableError(HingeError):
+    """Exception raised when an upstream host's circuit breaker is open."""
+
+    def __init__(self, host: str, retry_after: float):
+        """Initialize the HingeUpstreamUnavailableError.
+
+        Args:
+            host: Upstream host whose breaker is open.
+            retry_after: Seconds until the breaker lets a probe through.
+
+        """
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(
+            f"{host} is unavailable (circuit open, retry in {retry_after:.0f}s).",
+        )
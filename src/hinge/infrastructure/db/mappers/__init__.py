@@ -13,9 +13,18 @@ from hinge.infrastructure.db.tables.chat_channel import hinge_chat_channel_table
 from hinge.infrastructure.db.tables.chat_message import hinge_chat_message_table
 from hinge.infrastructure.db.tables.decision import hinge_decision_table
 from hinge.infrastructure.db.tables.profile import hinge_profile_table
+from hinge.infrastructure.db.tables.profile_content import (  # noqa: F401
+    PROFILE_CONTENT_TABLES,
+)
 from hinge.infrastructure.db.tables.prompt import hinge_prompt_table
+from hinge.infrastructure.db.tables.rating_token import (  # noqa: F401
+    hinge_rating_token_table,
+)
 from hinge.infrastructure.db.tables.scan_run import hinge_scan_run_table  # noqa: F401
 from hinge.infrastructure.db.tables.session import hinge_session_table
+from hinge.infrastructure.db.tables.sync_state import (  # noqa: F401
+    hinge_sync_state_table,
+)
 
 hinge_mapper_registry = registry()
 
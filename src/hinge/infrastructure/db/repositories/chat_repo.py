@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
@@ -91,6 +91,35 @@ class SqlHingeChatRepo(HingeChatRepo):
         )
         self._session.execute(stmt)
 
+    def upsert_channels(self, channels: list[HingeChatChannel]) -> int:
+        """Bulk upsert channels in one executemany. Returns count written."""
+        if not channels:
+            return 0
+        rows = [_channel_to_row(c) for c in channels]
+        stmt = sqlite_insert(hinge_chat_channel_table)
+        update_cols = {
+            col.name: stmt.excluded[col.name]
+            for col in hinge_chat_channel_table.columns
+            if col.name != "channel_url"
+        }
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["channel_url"],
+            set_=update_cols,
+        )
+        self._session.execute(stmt, rows)
+        return len(rows)
+
+    def touch_channels(self, channel_urls: set[str], synced_at: datetime) -> int:
+        """Set last_synced_at on the given channels. Returns rowcount."""
+        if not channel_urls:
+            return 0
+        stmt = (
+            update(hinge_chat_channel_table)
+            .where(hinge_chat_channel_table.c.channel_url.in_(channel_urls))
+            .values(last_synced_at=synced_at)
+        )
+        return self._session.execute(stmt).rowcount  # type: ignore[attr-defined]
+
     def upsert_messages(self, messages: list[HingeChatMessage]) -> int:
         """Bulk upsert messages. Returns count written."""
         if not messages:
@@ -145,6 +174,30 @@ class SqlHingeChatRepo(HingeChatRepo):
         )
         return list(self._session.execute(stmt).scalars())
 
+    def message_cursors(self) -> dict[str, tuple[datetime, int]]:
+        """Max created_at / message_id per channel (one indexed GROUP BY).
+
+        Sendbird message ids increase monotonically, so the two maxima
+        describe the same (newest) message in practice.
+        """
+        t = hinge_chat_message_table
+        stmt = select(
+            t.c.channel_url,
+            func.max(t.c.created_at),
+            func.max(t.c.message_id),
+        ).group_by(t.c.channel_url)
+        return {
+            url: (created_at, message_id)
+            for url, created_at, message_id in self._session.execute(stmt)
+        }
+
+    def oldest_message_at(self, channel_url: str) -> datetime | None:
+        """MIN(created_at) for one channel (served by the channel/created index)."""
+        t = hinge_chat_message_table
+        return self._session.execute(
+            select(func.min(t.c.created_at)).where(t.c.channel_url == channel_url),
+        ).scalar_one_or_none()
+
     def mark_channels_orphan(self, orphan_urls: set[str]) -> int:
         """Mark channels as inactive. Returns rowcount."""
         if not orphan_urls:
@@ -155,3 +208,14 @@ class SqlHingeChatRepo(HingeChatRepo):
             .values(is_connection_active=False)
         )
         return self._session.execute(stmt).rowcount  # type: ignore[attr-defined]
+
+    def mark_messages_removed(self, message_ids: set[int]) -> int:
+        """Flag messages as removed. Returns rowcount."""
+        if not message_ids:
+            return 0
+        stmt = (
+            update(hinge_chat_message_table)
+            .where(hinge_chat_message_table.c.message_id.in_(message_ids))
+            .values(is_removed=True)
+        )
+        return self._session.execute(stmt).rowcount  # type: ignore[attr-defined]
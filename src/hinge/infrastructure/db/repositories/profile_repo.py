@@ -2,15 +2,76 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from datetime import datetime, timezone
+from typing import Any
 
-from sqlalchemy import func, select, update
+from sqlalchemy import Row, delete, func, insert, select, update
 from sqlalchemy.orm import Session
 
-from hinge.domain.models.profile import HingeProfile
+from hinge.domain.models.profile import (
+    HingeProfile,
+    ProfileDateIdea,
+    ProfilePhoto,
+    ProfilePoll,
+    ProfilePrompt,
+    ProfileVideoDetail,
+    ProfileVideoPrompt,
+)
 from hinge.domain.ports.profile_repo import HingeProfileRepo
 from hinge.infrastructure.db.tables.decision import hinge_decision_table
 from hinge.infrastructure.db.tables.profile import hinge_profile_table
+from hinge.infrastructure.db.tables.profile_content import (
+    PROFILE_CONTENT_TABLES,
+    hinge_profile_date_idea_table,
+    hinge_profile_photo_table,
+    hinge_profile_poll_table,
+    hinge_profile_prompt_table,
+    hinge_profile_video_prompt_table,
+)
+
+
+def _row_fields(row: Row[Any]) -> dict[str, Any]:
+    """Row mapping minus the child-table bookkeeping columns."""
+    data = dict(row._mapping)
+    data.pop("subject_id", None)
+    data.pop("sort_order", None)
+    return data
+
+
+def _photo_from_row(row: Row[Any]) -> ProfilePhoto:
+    data = _row_fields(row)
+    data["videos"] = [ProfileVideoDetail(**v) for v in data["videos"]]
+    return ProfilePhoto(**data)
+
+
+def _content_rows(profile: HingeProfile) -> dict[str, list[dict[str, Any]]]:
+    """Project a profile's content onto rows for each child table."""
+    sid = profile.subject_id
+    rows: dict[str, list[dict[str, Any]]] = {
+        hinge_profile_photo_table.name: [
+            {**asdict(photo), "subject_id": sid, "sort_order": i}
+            for i, photo in enumerate(profile.photos)
+        ],
+        hinge_profile_prompt_table.name: [
+            {**asdict(prompt), "subject_id": sid, "sort_order": i}
+            for i, prompt in enumerate(profile.prompts)
+        ],
+        hinge_profile_poll_table.name: [
+            {**asdict(poll), "subject_id": sid, "sort_order": i}
+            for i, poll in enumerate(profile.polls)
+        ],
+        hinge_profile_video_prompt_table.name: [],
+        hinge_profile_date_idea_table.name: [
+            {**asdict(idea), "subject_id": sid, "sort_order": i}
+            for i, idea in enumerate(profile.date_ideas)
+        ],
+    }
+    if profile.video_prompt is not None:
+        rows[hinge_profile_video_prompt_table.name].append(
+            {**asdict(profile.video_prompt), "subject_id": sid},
+        )
+    return rows
 
 
 class SqlHingeProfileRepo(HingeProfileRepo):
@@ -191,3 +252,62 @@ class SqlHingeProfileRepo(HingeProfileRepo):
             hinge_profile_table.c.rejection_type.is_(None),
         )
         return set(self._session.execute(stmt).scalars())
+
+    def load_content(self, profiles: list[HingeProfile]) -> None:
+        """Attach stored content to ``profiles`` in-place.
+
+        Issues one query per content table for the whole set, so loading
+        the recommendation queue costs five queries regardless of size.
+        Profiles with no stored content are left empty.
+        """
+        by_id = {p.subject_id: p for p in profiles}
+        if not by_id:
+            return
+        ids = list(by_id)
+        for p in by_id.values():
+            p.photos = []
+            p.prompts = []
+            p.polls = []
+            p.video_prompt = None
+            p.date_ideas = []
+
+        def _rows(table: Any) -> list[Row[Any]]:
+            stmt = select(table).where(table.c.subject_id.in_(ids))
+            if "sort_order" in table.c:
+                stmt = stmt.order_by(table.c.subject_id, table.c.sort_order)
+            return list(self._session.execute(stmt))
+
+        for row in _rows(hinge_profile_photo_table):
+            by_id[row.subject_id].photos.append(_photo_from_row(row))
+        for row in _rows(hinge_profile_prompt_table):
+            by_id[row.subject_id].prompts.append(ProfilePrompt(**_row_fields(row)))
+        for row in _rows(hinge_profile_poll_table):
+            by_id[row.subject_id].polls.append(ProfilePoll(**_row_fields(row)))
+        for row in _rows(hinge_profile_video_prompt_table):
+            by_id[row.subject_id].video_prompt = ProfileVideoPrompt(
+                **_row_fields(row),
+            )
+        for row in _rows(hinge_profile_date_idea_table):
+            by_id[row.subject_id].date_ideas.append(
+                ProfileDateIdea(**_row_fields(row)),
+            )
+
+    def save_content(self, profiles: list[HingeProfile]) -> None:
+        """Replace stored content for ``profiles`` with their in-memory content."""
+        if not profiles:
+            return
+        # Parent rows added via merge() in this session must exist first.
+        self._session.flush()
+        ids = [p.subject_id for p in profiles]
+        rows_by_table: dict[str, list[dict[str, Any]]] = {
+            t.name: [] for t in PROFILE_CONTENT_TABLES
+        }
+        for profile in profiles:
+            for name, rows in _content_rows(profile).items():
+                rows_by_table[name].extend(rows)
+        for table in PROFILE_CONTENT_TABLES:
+            self._session.execute(
+                delete(table).where(table.c.subject_id.in_(ids)),
+            )
+            if rows_by_table[table.name]:
+                self._session.execute(insert(table), rows_by_table[table.name])
@@ -0,0 +1,95 @@
+"""SQLAlchemy implementation of the Hinge rating token repository."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import ColumnElement, delete, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from hinge.domain.models.rating_token import HingeRatingToken
+from hinge.domain.ports.rating_token_repo import HingeRatingTokenRepo
+from hinge.infrastructure.db.tables.rating_token import hinge_rating_token_table
+
+_t = hinge_rating_token_table
+
+
+def _naive_utc(dt: datetime | None) -> datetime | None:
+    """SQLite DateTime columns are naive — store everything as naive UTC."""
+    if dt is None or dt.tzinfo is None:
+        return dt
+    return dt.astimezone(UTC).replace(tzinfo=None)
+
+
+def _live(now: datetime) -> ColumnElement[bool]:
+    return or_(_t.c.expires_at.is_(None), _t.c.expires_at > now)
+
+
+class SqlHingeRatingTokenRepo(HingeRatingTokenRepo):
+    """SQLAlchemy-backed rating token store (one row per subject)."""
+
+    def __init__(self, session: Session) -> None:
+        """Bind this repository to a SQLAlchemy session."""
+        self._session = session
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(UTC).replace(tzinfo=None)
+
+    def get(self, subject_id: str) -> HingeRatingToken | None:
+        """Primary-key lookup, ignoring expired tokens."""
+        row = self._session.execute(
+            select(_t).where(_t.c.subject_id == subject_id, _live(self._now())),
+        ).one_or_none()
+        return HingeRatingToken(**row._mapping) if row else None
+
+    def get_many(self, subject_ids: list[str]) -> dict[str, HingeRatingToken]:
+        """Bulk lookup in one ``IN`` query."""
+        if not subject_ids:
+            return {}
+        rows = self._session.execute(
+            select(_t).where(_t.c.subject_id.in_(subject_ids), _live(self._now())),
+        )
+        return {row.subject_id: HingeRatingToken(**row._mapping) for row in rows}
+
+    def upsert_many(self, tokens: list[HingeRatingToken]) -> int:
+        """Insert or replace a batch of tokens in one statement."""
+        if not tokens:
+            return 0
+        now = self._now()
+        # Last write wins within a batch (a subject can appear in two feeds).
+        rows = {
+            t.subject_id: {
+                "subject_id": t.subject_id,
+                "rating_token": t.rating_token,
+                "origin": t.origin,
+                "expires_at": _naive_utc(t.expires_at),
+                "updated_at": now,
+            }
+            for t in tokens
+            if t.rating_token
+        }
+        if not rows:
+            return 0
+        stmt = sqlite_insert(_t).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["subject_id"],
+            set_={
+                col.name: stmt.excluded[col.name]
+                for col in _t.columns
+                if col.name != "subject_id"
+            },
+        )
+        self._session.execute(stmt)
+        return len(rows)
+
+    def delete(self, subject_id: str) -> None:
+        """Drop one subject's token."""
+        self._session.execute(delete(_t).where(_t.c.subject_id == subject_id))
+
+    def purge_expired(self, now: datetime | None = None) -> int:
+        """Delete every token whose ``expires_at`` is in the past."""
+        cutoff = _naive_utc(now) or self._now()
+        result = self._session.execute(
+            delete(_t).where(_t.c.expires_at.is_not(None), _t.c.expires_at <= cutoff),
+        )
+        return result.rowcount or 0
@@ -0,0 +1,52 @@
+"""SQLAlchemy implementation of the Hinge sync state repository."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from hinge.domain.ports.sync_state_repo import HingeSyncStateRepo
+from hinge.infrastructure.db.tables.sync_state import hinge_sync_state_table
+
+_t = hinge_sync_state_table
+
+
+class SqlHingeSyncStateRepo(HingeSyncStateRepo):
+    """SQLAlchemy-backed sync state store (one row per key)."""
+
+    def __init__(self, session: Session) -> None:
+        """Bind this repository to a SQLAlchemy session."""
+        self._session = session
+
+    def get(self, key: str) -> str | None:
+        """Primary-key lookup."""
+        return self._session.execute(
+            select(_t.c.value).where(_t.c.key == key),
+        ).scalar_one_or_none()
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        """Bulk lookup in one ``IN`` query."""
+        if not keys:
+            return {}
+        rows = self._session.execute(
+            select(_t.c.key, _t.c.value).where(_t.c.key.in_(keys)),
+        )
+        return {key: value for key, value in rows}
+
+    def set(self, key: str, value: str) -> None:
+        """Upsert one key."""
+        stmt = sqlite_insert(_t).values(
+            key=key,
+            value=value,
+            updated_at=datetime.now(UTC).replace(tzinfo=None),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={"value": stmt.excluded.value, "updated_at": stmt.excluded.updated_at},
+        )
+        self._session.execute(stmt)
+
+    def delete(self, key: str) -> None:
+        """Drop one key."""
+        self._session.execute(delete(_t).where(_t.c.key == key))
@@ -63,4 +63,7 @@ hinge_profile_table = Table(
     # Rating context for like/skip API calls
     Column("rating_token", String),
     Column("origin", String),
+    # Hydration freshness — drives the adapter's TTL policy
+    Column("content_refreshed_at", DateTime),
+    Column("demographics_refreshed_at", DateTime),
 )
@@ -0,0 +1,108 @@
+"""Hinge profile content table definitions (photos, prompts, polls, ...).
+
+Content is stored in child tables keyed by ``subject_id`` rather than
+mapped onto ``HingeProfile`` — the repository bulk-loads each table once
+for a whole set of profiles and attaches the rows in-place.
+"""
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ForeignKey,
+    Integer,
+    String,
+    Table,
+)
+
+from hinge.infrastructure.db.metadata import metadata
+from hinge.infrastructure.db.types import JsonList
+
+
+def _subject_fk() -> Column:
+    return Column(
+        "subject_id",
+        String,
+        ForeignKey("hinge_profiles.subject_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+
+hinge_profile_photo_table = Table(
+    "hinge_profile_photos",
+    metadata,
+    _subject_fk(),
+    Column("sort_order", Integer, primary_key=True),
+    Column("content_id", String, nullable=False),
+    Column("cdn_id", String, nullable=False),
+    Column("url", String, nullable=False),
+    Column("width", Integer),
+    Column("height", Integer),
+    Column("p_hash", String),
+    Column("selfie_verified", Boolean, nullable=False, default=False),
+    Column("video_url", String),
+    Column("videos", JsonList, nullable=False, default=list),
+    Column("caption", String),
+    Column("location", String),
+    Column("prompt_id", String),
+)
+
+hinge_profile_prompt_table = Table(
+    "hinge_profile_prompts",
+    metadata,
+    _subject_fk(),
+    Column("sort_order", Integer, primary_key=True),
+    Column("question_id", String, nullable=False),
+    Column("question_text", String, nullable=False),
+    Column("response", String),
+    Column("content_type", String, nullable=False, default="text"),
+    Column("content_id", String),
+    Column("position", Integer),
+    Column("audio_url", String),
+    Column("waveform", String),
+    Column("transcription", String),
+    Column("video_url", String),
+    Column("thumbnail_url", String),
+)
+
+hinge_profile_poll_table = Table(
+    "hinge_profile_polls",
+    metadata,
+    _subject_fk(),
+    Column("sort_order", Integer, primary_key=True),
+    Column("content_id", String, nullable=False),
+    Column("question_id", String, nullable=False),
+    Column("question_text", String, nullable=False),
+    Column("options", JsonList, nullable=False, default=list),
+    Column("selected_option_index", Integer),
+)
+
+hinge_profile_video_prompt_table = Table(
+    "hinge_profile_video_prompts",
+    metadata,
+    _subject_fk(),
+    Column("content_id", String, nullable=False),
+    Column("question_id", String),
+    Column("question_text", String, nullable=False, default=""),
+    Column("video_url", String),
+    Column("thumbnail_url", String),
+    Column("cdn_id", String),
+)
+
+hinge_profile_date_idea_table = Table(
+    "hinge_profile_date_ideas",
+    metadata,
+    _subject_fk(),
+    Column("sort_order", Integer, primary_key=True),
+    Column("content_id", String, nullable=False),
+    Column("question_id", String),
+    Column("question_text", String, nullable=False, default=""),
+    Column("options", JsonList, nullable=False, default=list),
+)
+
+PROFILE_CONTENT_TABLES = (
+    hinge_profile_photo_table,
+    hinge_profile_prompt_table,
+    hinge_profile_poll_table,
+    hinge_profile_video_prompt_table,
+    hinge_profile_date_idea_table,
+)
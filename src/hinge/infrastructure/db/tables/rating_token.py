@@ -0,0 +1,24 @@
+"""Hinge rating token table definition.
+
+Deliberately not foreign-keyed to ``hinge_profiles``: standouts tokens
+are stored before (or without) their profile being persisted.
+"""
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    String,
+    Table,
+)
+
+from hinge.infrastructure.db.metadata import metadata
+
+hinge_rating_token_table = Table(
+    "hinge_rating_tokens",
+    metadata,
+    Column("subject_id", String, primary_key=True),
+    Column("rating_token", String, nullable=False),
+    Column("origin", String, nullable=False, server_default="discover"),
+    Column("expires_at", DateTime),
+    Column("updated_at", DateTime, nullable=False),
+)
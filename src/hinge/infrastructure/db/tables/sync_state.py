@@ -0,0 +1,23 @@
+"""Hinge sync state table definition.
+
+A small key/value store for resume points of incremental syncs (e.g.
+the Sendbird channel changelog token), so a restart picks up where the
+last run left off instead of re-listing everything.
+"""
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    String,
+    Table,
+)
+
+from hinge.infrastructure.db.metadata import metadata
+
+hinge_sync_state_table = Table(
+    "hinge_sync_state",
+    metadata,
+    Column("key", String, primary_key=True),
+    Column("value", String, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
@@ -7,7 +7,13 @@ from hinge.infrastructure.db.repositories.chat_repo import SqlHingeChatRepo
 from hinge.infrastructure.db.repositories.decision_repo import SqlHingeDecisionRepo
 from hinge.infrastructure.db.repositories.profile_repo import SqlHingeProfileRepo
 from hinge.infrastructure.db.repositories.prompts_repo import SqlHingePromptsRepo
+from hinge.infrastructure.db.repositories.rating_token_repo import (
+    SqlHingeRatingTokenRepo,
+)
 from hinge.infrastructure.db.repositories.session_repo import SqlHingeSessionRepo
+from hinge.infrastructure.db.repositories.sync_state_repo import (
+    SqlHingeSyncStateRepo,
+)
 
 
 class HingeSqlAlchemyUnitOfWork(HingeUnitOfWorkPort):
@@ -18,6 +24,8 @@ class HingeSqlAlchemyUnitOfWork(HingeUnitOfWorkPort):
     sessions: SqlHingeSessionRepo
     chat: SqlHingeChatRepo
     prompts: SqlHingePromptsRepo
+    tokens: SqlHingeRatingTokenRepo
+    sync_state: SqlHingeSyncStateRepo
 
     def __init__(self, session_factory: sessionmaker[Session]) -> None:
         """Store the SQLAlchemy session factory."""
@@ -31,6 +39,8 @@ class HingeSqlAlchemyUnitOfWork(HingeUnitOfWorkPort):
         self.sessions = SqlHingeSessionRepo(self.session)
         self.chat = SqlHingeChatRepo(self.session)
         self.prompts = SqlHingePromptsRepo(self.session)
+        self.tokens = SqlHingeRatingTokenRepo(self.session)
+        self.sync_state = SqlHingeSyncStateRepo(self.session)
         return self
 
     def __exit__(self, *args: object) -> None:
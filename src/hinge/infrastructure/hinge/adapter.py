@@ -3,14 +3,21 @@
 import asyncio
 import json
 import time
-from collections.abc import Callable
-from datetime import UTC, datetime
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from hinge.client import HingeClient
+from hinge.core.deadline import Deadline
 from hinge.core.logging_config import logger as log
-from hinge.domain.models.chat_channel import HingeChatChannel
-from hinge.domain.models.chat_message import HingeChatMessage
+from hinge.domain.models.chat_channel import (
+    HingeChatChannel,
+    HingeChatChannelChanges,
+)
+from hinge.domain.models.chat_message import (
+    HingeChatMessage,
+    HingeChatMessageChanges,
+)
 from hinge.domain.models.like_limit import HingeLikeLimit
 from hinge.domain.models.match import HingeMatch
 from hinge.domain.models.profile import (
@@ -23,19 +30,24 @@ from hinge.domain.models.profile import (
     ProfileVideoPrompt,
 )
 from hinge.domain.models.prompt import HingePrompt
+from hinge.domain.models.rating_token import HingeRatingToken
 from hinge.domain.models.recommendation import Recommendation
 from hinge.domain.ports.hinge_api_port import HingeApiPort
 from hinge.domain.ports.unit_of_work import HingeUnitOfWorkPort
+from hinge.infrastructure.hinge.loader import BatchLoader
 from hinge.models import (
+    AnswerContent,
     CreateRate,
     CreateRateContent,
     CreateRateContentPrompt,
+    PhotoContent,
     ProfileContent,
     ProfileContentContent,
     RatePhoto,
     UserProfile,
     UserProfileV2,
 )
+from hinge.transport.singleflight import SingleFlight
 
 # Rating origin mapping (from APK yl.l()):
 # Feed origins (compatibles, active_lately, nearby, new_here) → "discover"
@@ -52,6 +64,55 @@ _RATING_ORIGIN_MAP: dict[str, str] = {
     "matches": "matches",
 }
 
+# Hydration TTLs — profiles refreshed more recently are served as stored.
+_DEFAULT_CONTENT_TTL = timedelta(hours=24)
+_DEFAULT_DEMOGRAPHICS_TTL = timedelta(days=3)
+
+# A profile with every one of these NULL predates the v2 demographics
+# mapping and is refreshed regardless of its timestamp.
+_LIFESTYLE_ATTRS = (
+    "children",
+    "dating_intention",
+    "drinking",
+    "drugs",
+    "marijuana",
+    "smoking",
+    "family_plans",
+    "politics",
+)
+
+# Chunked batch calls (v2 public, content) in flight at once per method.
+# The client-wide rate governor still paces the actual requests.
+_DEFAULT_BATCH_CONCURRENCY = 4
+
+# /user/v2/public takes up to 20 ids; concurrent get_profiles_quick
+# callers within this window share full batches.
+_V2_BATCH_SIZE = 20
+_DEFAULT_LOADER_WINDOW = 0.01
+
+# Sendbird returns at most this many messages per history page.
+MESSAGE_PAGE_SIZE = 100
+
+# Sendbird's maximum page size for channel listings, and a safety cap on
+# pages followed per listing/changelog drain (5000 channels).
+_CHANNEL_PAGE_SIZE = 100
+_MAX_CHANNEL_PAGES = 50
+# Cap on message changelog pages drained per channel per call.
+_MAX_CHANGELOG_PAGES = 20
+
+# Minimum seconds between /prompts catalog refreshes triggered by
+# unknown prompt ids — a new rollout shouldn't refetch it per batch.
+_DEFAULT_PROMPT_REFRESH_INTERVAL = 600.0
+
+
+def _expired(stamp: datetime | None, ttl: timedelta, now: datetime) -> bool:
+    """True when ``stamp`` is missing or older than ``ttl`` (naive = UTC)."""
+    if stamp is None:
+        return True
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=UTC)
+    return now - stamp >= ttl
+
 
 def _to_rating_origin(feed_origin: str) -> str:
     """Map a feed origin to the correct rating origin."""
@@ -352,7 +413,7 @@ def _resolve_question(
 
     Returns ``(text, resolved)``. ``resolved`` is False when the lookup
     is present but the id is unknown — the adapter then refreshes the
-    catalog and retries.
+    catalog and patches just those entries (``_apply_prompt_texts``).
     """
     if prompt_lookup is None:
         return "", True
@@ -440,8 +501,11 @@ def _reset_and_merge(
     profile: HingeProfile,
     content: ProfileContent,
     prompt_lookup: dict[str, str] | None,
-) -> bool:
-    """Clear transient content fields, then merge fresh content."""
+) -> set[str]:
+    """Clear transient content fields, then merge fresh content.
+
+    Returns the prompt ids the lookup could not resolve.
+    """
     profile.photos.clear()
     profile.photo_urls.clear()
     profile.prompts.clear()
@@ -455,13 +519,13 @@ def _merge_content_into_profile(
     profile: HingeProfile,
     content: ProfileContent,
     prompt_lookup: dict[str, str] | None = None,
-) -> bool:
+) -> set[str]:
     """Merge all content types into a domain profile.
 
-    Returns True if all prompt question texts were resolved, False if
-    any fell back to "Unknown Question" (cache may be stale).
+    Returns the question ids that fell back to "Unknown Question"
+    (empty when everything resolved; the catalog may be stale).
     """
-    all_resolved = True
+    unresolved: set[str] = set()
 
     for photo in content.content.photos:
         profile.photos.append(_photo_to_domain(photo))
@@ -471,14 +535,14 @@ def _merge_content_into_profile(
         prompt, resolved = _answer_to_prompt(answer, prompt_lookup)
         profile.prompts.append(prompt)
         if not resolved:
-            all_resolved = False
+            unresolved.add(prompt.question_id)
 
     if content.content.prompt_poll:
         poll = content.content.prompt_poll
         poll_q_id = str(poll.question_id)
         poll_q_text, resolved = _resolve_question(poll_q_id, prompt_lookup)
         if not resolved:
-            all_resolved = False
+            unresolved.add(poll_q_id)
         profile.polls.append(
             ProfilePoll(
                 content_id=poll.content_id,
@@ -495,8 +559,8 @@ def _merge_content_into_profile(
             str(vp.question_id) if vp.question_id else None,
             prompt_lookup,
         )
-        if not resolved:
-            all_resolved = False
+        if not resolved and q_id:
+            unresolved.add(q_id)
         profile.video_prompt = ProfileVideoPrompt(
             content_id=vp.content_id,
             question_id=q_id,
@@ -512,8 +576,8 @@ def _merge_content_into_profile(
             str(di.question_id) if di.question_id else None,
             prompt_lookup,
         )
-        if not resolved:
-            all_resolved = False
+        if not resolved and q_id:
+            unresolved.add(q_id)
         profile.date_ideas.append(
             ProfileDateIdea(
                 content_id=di.content_id,
@@ -523,7 +587,67 @@ def _merge_content_into_profile(
             ),
         )
 
-    return all_resolved
+    return unresolved
+
+
+def _merge_inline_content(
+    profile: HingeProfile,
+    photos: list[PhotoContent],
+    answers: list[AnswerContent],
+    prompt_lookup: dict[str, str] | None,
+) -> set[str]:
+    """Update photos and prompts from an inline v2 payload, non-destructively.
+
+    The v2 payload lacks pHash and voice waveforms/transcriptions, so
+    stored values for those carry over (matched by content id). Polls,
+    the video prompt and date ideas are not in the payload and are left
+    as stored; so is any list the payload leaves empty.
+
+    Returns the prompt ids the lookup could not resolve.
+    """
+    unresolved: set[str] = set()
+    if photos:
+        stored_photos = {p.content_id: p for p in profile.photos}
+        fresh_photos = [_photo_to_domain(photo) for photo in photos]
+        for photo in fresh_photos:
+            old = stored_photos.get(photo.content_id)
+            if old is not None and photo.p_hash is None:
+                photo.p_hash = old.p_hash
+        profile.photos[:] = fresh_photos
+        profile.photo_urls[:] = [photo.url for photo in fresh_photos]
+    if answers:
+        stored_prompts = {p.content_id: p for p in profile.prompts if p.content_id}
+        fresh_prompts: list[ProfilePrompt] = []
+        for answer in answers:
+            prompt, resolved = _answer_to_prompt(answer, prompt_lookup)
+            old = stored_prompts.get(prompt.content_id or "")
+            if old is not None:
+                prompt.waveform = prompt.waveform or old.waveform
+                prompt.transcription = prompt.transcription or old.transcription
+            if not resolved:
+                unresolved.add(prompt.question_id)
+            fresh_prompts.append(prompt)
+        profile.prompts[:] = fresh_prompts
+    return unresolved
+
+
+def _apply_prompt_texts(profile: HingeProfile, texts: dict[str, str]) -> int:
+    """Fill in question text for entries whose id is in ``texts``.
+
+    Used after a catalog refresh to patch only the prompts that were
+    unresolved, instead of clearing and re-merging the whole profile.
+    Returns the number of entries updated.
+    """
+    entries: list[Any] = [*profile.prompts, *profile.polls, *profile.date_ideas]
+    if profile.video_prompt is not None:
+        entries.append(profile.video_prompt)
+    updated = 0
+    for entry in entries:
+        text = texts.get(entry.question_id or "")
+        if text is not None and entry.question_text != text:
+            entry.question_text = text
+            updated += 1
+    return updated
 
 
 class HingeApiAdapter(HingeApiPort):
@@ -533,16 +657,101 @@ class HingeApiAdapter(HingeApiPort):
         self,
         client: HingeClient,
         uow_factory: Callable[[], HingeUnitOfWorkPort] | None = None,
+        *,
+        batch_concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+        content_ttl: timedelta = _DEFAULT_CONTENT_TTL,
+        demographics_ttl: timedelta = _DEFAULT_DEMOGRAPHICS_TTL,
+        loader_window: float = _DEFAULT_LOADER_WINDOW,
+        prompt_refresh_interval: float = _DEFAULT_PROMPT_REFRESH_INTERVAL,
     ) -> None:
         """Wrap a HingeClient and the UoW factory.
 
         ``uow_factory`` is required for prompts caching (DB-backed). It's
         optional so unit tests of pure mapper helpers can construct an
-        adapter without standing up a DB.
+        adapter without standing up a DB. ``batch_concurrency`` caps how
+        many chunks of a batch method are in flight at once; the TTLs
+        decide which profiles the hydration methods consider stale.
+        ``loader_window`` is how long ``get_profiles_quick`` collects ids
+        from concurrent callers before sending a batch, and
+        ``prompt_refresh_interval`` the minimum gap between catalog
+        refreshes triggered by unknown prompt ids.
         """
         self._client = client
         self._uow_factory = uow_factory
         self._prompt_lookup: dict[str, str] | None = None
+        self._prompt_refresh = SingleFlight()
+        self._prompt_refresh_interval = prompt_refresh_interval
+        self._prompts_fetched_at: float | None = None
+        # Prompt ids seen on profiles but missing from the catalog.
+        self.unresolved_prompts: set[str] = set()
+        self._batch_concurrency = max(1, batch_concurrency)
+        self._content_ttl = content_ttl
+        self._demographics_ttl = demographics_ttl
+        self._profiles_v2 = BatchLoader(
+            self._fetch_profiles_v2,
+            max_batch=_V2_BATCH_SIZE,
+            window=loader_window,
+            max_concurrency=self._batch_concurrency,
+            event="profiles_quick_chunk_failed",
+        )
+
+    async def _gather_chunks[T](
+        self,
+        ids: list[str],
+        batch_size: int,
+        fetch: Callable[[list[str]], Awaitable[T]],
+        *,
+        event: str,
+        deadline: Deadline | None = None,
+    ) -> list[tuple[int, list[str], T]]:
+        """Run ``fetch`` over ``batch_size`` chunks of ``ids`` concurrently.
+
+        At most ``batch_concurrency`` chunks are in flight. A failing
+        chunk is logged under ``event`` and dropped so the others still
+        land; so is every chunk still outstanding when ``deadline``
+        passes. Returns ``(offset, chunk, result)`` in input order.
+        """
+        sem = asyncio.Semaphore(self._batch_concurrency)
+        chunks = [
+            (i, ids[i : i + batch_size]) for i in range(0, len(ids), batch_size)
+        ]
+        if not chunks:
+            return []
+
+        async def _one(chunk: list[str]) -> T:
+            async with sem:
+                return await fetch(chunk)
+
+        tasks = [asyncio.ensure_future(_one(chunk)) for _, chunk in chunks]
+        try:
+            _, pending = await asyncio.wait(
+                tasks,
+                timeout=deadline.remaining() if deadline else None,
+            )
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        done: list[tuple[int, list[str], T]] = []
+        for (offset, chunk), task in zip(chunks, tasks, strict=True):
+            if task in pending:
+                continue
+            if task.cancelled():
+                raise asyncio.CancelledError
+            exc = task.exception()
+            if exc is not None:
+                log.warning(event, offset=offset, size=len(chunk), exc_info=exc)
+                continue
+            done.append((offset, chunk, task.result()))
+        if pending:
+            log.warning(
+                "batch_deadline_exceeded",
+                batch=event,
+                dropped_chunks=len(pending),
+                total_chunks=len(chunks),
+                budget_seconds=deadline.budget if deadline else None,
+            )
+        return done
 
     async def _ensure_prompts(
         self,
@@ -566,6 +775,7 @@ class HingeApiAdapter(HingeApiPort):
                     self._prompt_lookup = {p.prompt_id: p.text for p in stored}
                     return self._prompt_lookup
 
+        self._prompts_fetched_at = time.monotonic()
         try:
             response = await self._client.fetch_prompts()
         except Exception:  # noqa: BLE001 — network/auth failures are non-fatal
@@ -590,8 +800,49 @@ class HingeApiAdapter(HingeApiPort):
                 uow.commit()
 
         self._prompt_lookup = {p.prompt_id: p.text for p in prompts_domain}
+        self.unresolved_prompts -= self._prompt_lookup.keys()
         return self._prompt_lookup
 
+    async def _resolve_unknown_prompts(
+        self,
+        unknown: set[str],
+        profiles: Iterable[HingeProfile],
+    ) -> None:
+        """Resolve ``unknown`` prompt ids and patch them into ``profiles``.
+
+        The catalog is refetched only if some id is still missing from it
+        and the last fetch is older than ``prompt_refresh_interval``;
+        concurrent callers share one fetch. Only the affected prompt
+        entries are updated — nothing is re-merged.
+        """
+        lookup = self._prompt_lookup or {}
+        missing = unknown - lookup.keys()
+        if missing:
+            self.unresolved_prompts |= missing
+            fetched_at = self._prompts_fetched_at
+            if (
+                fetched_at is None
+                or time.monotonic() - fetched_at >= self._prompt_refresh_interval
+            ):
+                lookup = (
+                    await self._prompt_refresh.do(
+                        "prompts",
+                        lambda: self._ensure_prompts(force=True),
+                    )
+                    or lookup
+                )
+        texts = {pid: lookup[pid] for pid in unknown if pid in lookup}
+        if not texts:
+            log.info("prompts_unresolved", count=len(unknown))
+            return
+        updated = sum(_apply_prompt_texts(p, texts) for p in profiles)
+        log.info(
+            "prompts_resolved_incrementally",
+            resolved=len(texts),
+            still_unknown=len(unknown) - len(texts),
+            entries_updated=updated,
+        )
+
     async def get_recommendations(self) -> list[Recommendation]:
         """Fetch recommendation feed."""
         response = await self._client.get_recommendations()
@@ -612,6 +863,12 @@ class HingeApiAdapter(HingeApiPort):
                         second_chance_source=sc_source,
                     ),
                 )
+        self._store_tokens(
+            [
+                HingeRatingToken(r.subject_id, r.rating_token, r.origin)
+                for r in recommendations
+            ],
+        )
         return recommendations
 
     async def get_standouts(self) -> list[Recommendation]:
@@ -626,8 +883,36 @@ class HingeApiAdapter(HingeApiPort):
                     origin="standouts",
                 ),
             )
+        self._store_tokens(
+            [
+                HingeRatingToken(
+                    r.subject_id,
+                    r.rating_token,
+                    r.origin,
+                    expires_at=response.expiration,
+                )
+                for r in recommendations
+            ],
+        )
         return recommendations
 
+    def _store_tokens(self, tokens: list[HingeRatingToken]) -> None:
+        """Upsert freshly issued rating tokens into the token store."""
+        if self._uow_factory is None or not tokens:
+            return
+        with self._uow_factory() as uow:
+            uow.tokens.upsert_many(tokens)
+            uow.tokens.purge_expired()
+            uow.commit()
+
+    def _forget_token(self, subject_id: str) -> None:
+        """Drop a token once it has been spent on a rating."""
+        if self._uow_factory is None:
+            return
+        with self._uow_factory() as uow:
+            uow.tokens.delete(subject_id)
+            uow.commit()
+
     async def get_profile_content(
         self,
         subject_ids: list[str],
@@ -637,161 +922,180 @@ class HingeApiAdapter(HingeApiPort):
         content_data = await self._client.get_profile_content(subject_ids)
 
         prompt_lookup = await self._ensure_prompts()
+        now = datetime.now(UTC)
 
         result: dict[str, HingeProfile] = {}
         for p in profiles_data:
             profile = _user_profile_to_domain(p)
+            profile.demographics_refreshed_at = now
             result[p.user_id] = profile
 
-        has_unknown = False
+        unknown: set[str] = set()
         for c in content_data:
             if c.user_id in result:
-                resolved = _merge_content_into_profile(
+                result[c.user_id].content_refreshed_at = now
+                unknown |= _merge_content_into_profile(
                     result[c.user_id],
                     c,
                     prompt_lookup,
                 )
-                if not resolved:
-                    has_unknown = True
-
-        # Refresh cache and re-merge if any prompts were unknown
-        if has_unknown and prompt_lookup:
-            prompt_lookup = await self._ensure_prompts(force=True)
-            if prompt_lookup:
-                for c in content_data:
-                    if c.user_id in result:
-                        p = result[c.user_id]
-                        p.prompts.clear()
-                        p.polls.clear()
-                        p.photos.clear()
-                        p.photo_urls.clear()
-                        p.video_prompt = None
-                        p.date_ideas.clear()
-                        _merge_content_into_profile(p, c, prompt_lookup)
-                log.info("prompts_cache_refreshed_on_miss")
+
+        if unknown and prompt_lookup:
+            await self._resolve_unknown_prompts(unknown, result.values())
 
         return result
 
+    async def _fetch_profiles_v2(
+        self,
+        subject_ids: list[str],
+    ) -> dict[str, UserProfileV2]:
+        """One ``/user/v2/public`` batch, keyed by requested id.
+
+        Results are matched on ``identity_id``; if none match but the
+        counts agree, they are matched by position instead.
+        """
+        v2_data = await self._client.get_profiles_v2(subject_ids)
+        by_id = {p.identity_id: p for p in v2_data}
+        if len(v2_data) == len(subject_ids) and by_id.keys().isdisjoint(subject_ids):
+            by_id = dict(zip(subject_ids, v2_data, strict=True))
+        return by_id
+
+    async def get_active_subject_ids(self, subject_ids: list[str]) -> set[str]:
+        """Which of ``subject_ids`` come back from one ``/user/v2/public`` call.
+
+        Uses the same id matching as ``get_profiles_quick``; upstream
+        errors are raised, not reported as missing.
+        """
+        found = await self._fetch_profiles_v2(subject_ids)
+        return found.keys() & set(subject_ids)
+
     async def get_profiles_quick(
         self,
         subject_ids: list[str],
         *,
-        batch_size: int = 20,
+        deadline: Deadline | None = None,
     ) -> dict[str, HingeProfile]:
         """Fetch profile + basic content in batched v2 calls.
 
-        The result dict is keyed by both ``identity_id`` (from the v2
-        response) AND the original input ``subject_id`` so callers can
-        look up by whichever ID format they have.
+        Ids are batched with those of concurrent callers (see
+        ``loader_window``), so overlapping lookups share one fetch and
+        batches go out full. The result dict is keyed by both
+        ``identity_id`` (from the v2 response) AND the original input
+        ``subject_id`` so callers can look up by whichever ID format they
+        have. Ids still outstanding when ``deadline`` passes are left
+        out of the result.
         """
         log.debug("profiles_quick_fetching", count=len(subject_ids))
         prompt_lookup = await self._ensure_prompts()
 
+        found = await self._profiles_v2.load_many(
+            subject_ids,
+            timeout=deadline.remaining() if deadline else None,
+        )
+
         result: dict[str, HingeProfile] = {}
-        has_unknown = False
-        contents: list[tuple[HingeProfile, ProfileContent]] = []
-
-        for i in range(0, len(subject_ids), batch_size):
-            chunk = subject_ids[i : i + batch_size]
-            v2_data = await self._client.get_profiles_v2(chunk)
-            for idx, p in enumerate(v2_data):
-                profile = _v2_profile_to_domain(p)
-                if p.profile.photos or p.profile.answers:
-                    content = ProfileContent(
-                        user_id=p.identity_id,
-                        content=ProfileContentContent(
-                            photos=p.profile.photos,
-                            answers=p.profile.answers,
-                        ),
-                    )
-                    resolved = _merge_content_into_profile(
-                        profile,
-                        content,
-                        prompt_lookup,
-                    )
-                    if not resolved:
-                        has_unknown = True
-                    contents.append((profile, content))
-                # Key by identity_id (from response)
-                result[p.identity_id] = profile
-                # Also key by original input subject_id (may differ)
-                abs_idx = i + idx
-                if abs_idx < len(subject_ids):
-                    result[subject_ids[abs_idx]] = profile
-
-        if has_unknown and prompt_lookup:
-            await self._retry_unknown_prompts(
-                [c for _, c in contents],
-                {p.subject_id: p for p, _ in contents},
-            )
+        unknown: set[str] = set()
+        for subject_id, p in found.items():
+            profile = _v2_profile_to_domain(p)
+            if p.profile.photos or p.profile.answers:
+                content = ProfileContent(
+                    user_id=p.identity_id,
+                    content=ProfileContentContent(
+                        photos=p.profile.photos,
+                        answers=p.profile.answers,
+                    ),
+                )
+                unknown |= _merge_content_into_profile(
+                    profile,
+                    content,
+                    prompt_lookup,
+                )
+            # Key by identity_id (from response) and the requested id
+            result[p.identity_id] = profile
+            result[subject_id] = profile
+
+        if unknown and prompt_lookup:
+            await self._resolve_unknown_prompts(unknown, result.values())
 
         log.info(
             "profiles_quick_loaded",
             requested=len(subject_ids),
-            returned=len(result),
+            returned=len(found),
         )
         return result
 
-    async def _retry_unknown_prompts(
-        self,
-        all_content: list[ProfileContent],
-        profile_map: dict[str, HingeProfile],
-    ) -> None:
-        """Re-merge content after refreshing the prompts cache."""
-        prompt_lookup = await self._ensure_prompts(force=True)
-        if prompt_lookup:
-            for c in all_content:
-                profile = profile_map.get(c.user_id)
-                if profile:
-                    _reset_and_merge(profile, c, prompt_lookup)
-            log.info("prompts_cache_refreshed_on_miss")
-
     async def _retry_missing_content(
         self,
         missing_ids: list[str],
         profile_map: dict[str, HingeProfile],
         prompt_lookup: dict[str, str] | None,
         all_content: list[ProfileContent],
-    ) -> bool:
+    ) -> set[str]:
         """Retry fetching content for profiles that returned nothing.
 
-        Returns True if any content had unresolved prompts.
+        Returns the prompt ids the retried content could not resolve.
         """
-        await asyncio.sleep(3)
+        # Content that is missing right after a feed fetch usually shows up
+        # a moment later — wait a jittered backoff rather than a fixed 3 s.
+        await asyncio.sleep(self._client.retry_policy.backoff(2))
         retry_data = await self._client.get_profile_content(missing_ids)
-        has_unknown = False
+        unknown: set[str] = set()
         for c in retry_data:
             profile = profile_map.get(c.user_id)
             if profile:
-                if not _reset_and_merge(profile, c, prompt_lookup):
-                    has_unknown = True
+                unknown |= _reset_and_merge(profile, c, prompt_lookup)
                 all_content.append(c)
         still_missing = len(missing_ids) - len(retry_data)
         if still_missing:
             log.info("hydrate_skipped_missing", count=still_missing)
-        return has_unknown
+        return unknown
+
+    def _demographics_stale(self, profile: HingeProfile, now: datetime) -> bool:
+        """Past the demographics TTL, never refreshed, or lifestyle all NULL."""
+        if all(getattr(profile, attr) is None for attr in _LIFESTYLE_ATTRS):
+            return True
+        return _expired(profile.demographics_refreshed_at, self._demographics_ttl, now)
+
+    def _content_stale(self, profile: HingeProfile, now: datetime) -> bool:
+        """Past the content TTL, never hydrated, or loaded without photos."""
+        if not profile.photos:
+            return True
+        return _expired(profile.content_refreshed_at, self._content_ttl, now)
 
     async def refresh_demographics(
         self,
         profiles: list[HingeProfile],
         *,
         batch_size: int = 20,
-    ) -> None:
+        force: bool = False,
+        deadline: Deadline | None = None,
+    ) -> list[HingeProfile]:
         """Re-fetch demographics from v2 API and update profiles in-place.
 
-        This ensures DB-loaded profiles get fresh lifestyle/enum fields
-        that may have been NULL when originally persisted.
+        Only profiles past ``demographics_ttl`` (or with NULL lifestyle
+        fields) are fetched unless ``force``. Returns the profiles that
+        were refreshed, with ``demographics_refreshed_at`` stamped;
+        chunks cut off by ``deadline`` keep their old data and stamps.
         """
-        if not profiles:
-            return
+        now = datetime.now(UTC)
+        stale = [
+            p for p in profiles if force or self._demographics_stale(p, now)
+        ]
+        if not stale:
+            return []
 
-        profile_map = {p.subject_id: p for p in profiles}
+        profile_map = {p.subject_id: p for p in stale}
         all_ids = list(profile_map)
-        updated = 0
-
-        for i in range(0, len(all_ids), batch_size):
-            chunk = all_ids[i : i + batch_size]
-            v2_data = await self._client.get_profiles_v2(chunk)
+        refreshed: dict[str, HingeProfile] = {}
+
+        batches = await self._gather_chunks(
+            all_ids,
+            batch_size,
+            self._client.get_profiles_v2,
+            event="demographics_chunk_failed",
+            deadline=deadline,
+        )
+        for _, chunk, v2_data in batches:
             for idx, v2 in enumerate(v2_data):
                 fresh = _v2_profile_to_domain(v2)
                 existing = profile_map.get(v2.identity_id)
@@ -799,61 +1103,231 @@ class HingeApiAdapter(HingeApiPort):
                     existing = profile_map.get(chunk[idx])
                 if existing:
                     _copy_demographics(existing, fresh)
-                    updated += 1
+                    existing.demographics_refreshed_at = now
+                    refreshed[existing.subject_id] = existing
 
         log.info(
             "demographics_refreshed",
             total=len(profiles),
-            updated=updated,
+            stale=len(stale),
+            updated=len(refreshed),
         )
+        return list(refreshed.values())
 
     async def hydrate_profiles(
         self,
         profiles: list[HingeProfile],
         *,
         batch_size: int = 20,
-    ) -> None:
+        force: bool = False,
+        deadline: Deadline | None = None,
+    ) -> list[HingeProfile]:
         """Fetch content and merge into existing profiles in-place.
 
-        Profiles that return no content are retried once after a short
-        backoff (transient API visibility). Remaining misses are silently
-        skipped — only the rejection scan should mark profiles as rejected.
+        Only profiles past ``content_ttl`` (or without photos) are fetched
+        unless ``force``. Profiles that return no content are retried once
+        after a short backoff (transient API visibility). Remaining misses
+        are silently skipped — only the rejection scan should mark profiles
+        as rejected. Returns the profiles whose content was replaced, with
+        ``content_refreshed_at`` stamped.
+
+        With a ``deadline``, chunks still outstanding when it passes are
+        dropped (like failed chunks) and the missing-content retry only
+        runs within what is left of the budget.
         """
-        if not profiles:
-            return
+        now = datetime.now(UTC)
+        stale = [p for p in profiles if force or self._content_stale(p, now)]
+        if not stale:
+            return []
 
         prompt_lookup = await self._ensure_prompts()
 
-        profile_map = {p.subject_id: p for p in profiles}
+        profile_map = {p.subject_id: p for p in stale}
         all_ids = list(profile_map)
-        has_unknown = False
+        unknown: set[str] = set()
         all_content: list[ProfileContent] = []
         returned_ids: set[str] = set()
 
-        for i in range(0, len(all_ids), batch_size):
-            chunk = all_ids[i : i + batch_size]
-            content_data = await self._client.get_profile_content(chunk)
+        batches = await self._gather_chunks(
+            all_ids,
+            batch_size,
+            self._client.get_profile_content,
+            event="hydrate_chunk_failed",
+            deadline=deadline,
+        )
+        failed_ids = set(all_ids).difference(*(chunk for _, chunk, _ in batches))
+        for _, _chunk, content_data in batches:
             for c in content_data:
                 returned_ids.add(c.user_id)
                 profile = profile_map.get(c.user_id)
                 if profile:
-                    if not _reset_and_merge(profile, c, prompt_lookup):
-                        has_unknown = True
+                    unknown |= _reset_and_merge(profile, c, prompt_lookup)
                     all_content.append(c)
 
-        # Retry missing profiles once after a short backoff (transient)
-        missing_ids = [sid for sid in all_ids if sid not in returned_ids]
-        if missing_ids:
-            if await self._retry_missing_content(
-                missing_ids,
-                profile_map,
-                prompt_lookup,
-                all_content,
-            ):
-                has_unknown = True
+        # Retry missing profiles once after a short backoff (transient).
+        # Chunks that failed outright are not retried — the caller keeps
+        # whatever content those profiles already had.
+        missing_ids = [
+            sid
+            for sid in all_ids
+            if sid not in returned_ids and sid not in failed_ids
+        ]
+        if missing_ids and not (deadline and deadline.expired()):
+            try:
+                async with asyncio.timeout(
+                    deadline.remaining() if deadline else None,
+                ):
+                    unknown |= await self._retry_missing_content(
+                        missing_ids,
+                        profile_map,
+                        prompt_lookup,
+                        all_content,
+                    )
+            except TimeoutError:
+                log.info("hydrate_retry_deadline_exceeded", count=len(missing_ids))
 
-        if has_unknown and prompt_lookup:
-            await self._retry_unknown_prompts(all_content, profile_map)
+        if unknown and prompt_lookup:
+            await self._resolve_unknown_prompts(unknown, profile_map.values())
+
+        refreshed = {
+            c.user_id: profile_map[c.user_id]
+            for c in all_content
+            if c.user_id in profile_map
+        }
+        for profile in refreshed.values():
+            profile.content_refreshed_at = now
+        return list(refreshed.values())
+
+    async def _refresh_from_v2(
+        self,
+        profiles: dict[str, HingeProfile],
+        demographics: set[str],
+        inline: set[str],
+        *,
+        batch_size: int,
+        deadline: Deadline | None,
+        now: datetime,
+    ) -> tuple[dict[str, HingeProfile], set[str], set[str]]:
+        """One ``/user/v2/public`` pass for demographics and inline content.
+
+        Profiles in ``demographics`` get their demographics copied over;
+        profiles in ``inline`` get the payload's photos and answers merged
+        with ``_merge_inline_content``. Returns (refreshed profiles, ids
+        whose content came inline, ids whose chunk failed).
+        """
+        ids = [sid for sid in profiles if sid in demographics or sid in inline]
+        if not ids:
+            return {}, set(), set()
+        prompt_lookup = await self._ensure_prompts() if inline else None
+        batches = await self._gather_chunks(
+            ids,
+            batch_size,
+            self._client.get_profiles_v2,
+            event="refresh_chunk_failed",
+            deadline=deadline,
+        )
+        failed = set(ids).difference(*(chunk for _, chunk, _ in batches))
+        refreshed: dict[str, HingeProfile] = {}
+        served_inline: set[str] = set()
+        unknown: set[str] = set()
+        for _, chunk, v2_data in batches:
+            for idx, v2 in enumerate(v2_data):
+                existing = profiles.get(v2.identity_id)
+                if not existing and idx < len(chunk):
+                    existing = profiles.get(chunk[idx])
+                if not existing:
+                    continue
+                sid = existing.subject_id
+                if sid in demographics:
+                    _copy_demographics(existing, _v2_profile_to_domain(v2))
+                    existing.demographics_refreshed_at = now
+                    refreshed[sid] = existing
+                if sid in inline and (v2.profile.photos or v2.profile.answers):
+                    unknown |= _merge_inline_content(
+                        existing,
+                        v2.profile.photos,
+                        v2.profile.answers,
+                        prompt_lookup,
+                    )
+                    existing.content_refreshed_at = now
+                    served_inline.add(sid)
+                    refreshed[sid] = existing
+        if unknown and prompt_lookup:
+            await self._resolve_unknown_prompts(unknown, refreshed.values())
+        return refreshed, served_inline, failed
+
+    async def refresh_and_hydrate(
+        self,
+        profiles: list[HingeProfile],
+        *,
+        batch_size: int = 20,
+        force: bool = False,
+        deadline: Deadline | None = None,
+    ) -> list[HingeProfile]:
+        """Refresh demographics and content in one v2 pass where possible.
+
+        Profiles past ``demographics_ttl`` and profiles past
+        ``content_ttl`` that already have stored content share one
+        ``/user/v2/public`` fetch per batch: demographics are copied over
+        and the inline photos/answers are merged without dropping pHash,
+        waveforms, polls, video prompts or date ideas. Only profiles with
+        no stored content (they need those content-only fields) and ones
+        whose payload came back without inline content fall back to
+        ``/content/v2/public``. ``force`` treats every profile as past
+        both TTLs; ``deadline`` bounds every pass.
+
+        Returns the profiles that had either timestamp bumped.
+        """
+        now = datetime.now(UTC)
+        profile_map = {p.subject_id: p for p in profiles}
+        demographics = {
+            p.subject_id
+            for p in profiles
+            if force or self._demographics_stale(p, now)
+        }
+        content_stale = [p for p in profiles if force or self._content_stale(p, now)]
+        inline = {p.subject_id for p in content_stale if p.photos or p.prompts}
+        needs_full = [p for p in content_stale if p.subject_id not in inline]
+
+        (refreshed, served_inline, failed), hydrated = await asyncio.gather(
+            self._refresh_from_v2(
+                profile_map,
+                demographics,
+                inline,
+                batch_size=batch_size,
+                deadline=deadline,
+                now=now,
+            ),
+            self.hydrate_profiles(
+                needs_full,
+                batch_size=batch_size,
+                force=True,
+                deadline=deadline,
+            ),
+        )
+        # Stored content stays as-is when its chunk failed outright.
+        fallback = [
+            p
+            for p in content_stale
+            if p.subject_id in inline - served_inline - failed
+        ]
+        if fallback and not (deadline and deadline.expired()):
+            hydrated += await self.hydrate_profiles(
+                fallback,
+                batch_size=batch_size,
+                force=True,
+                deadline=deadline,
+            )
+        for p in hydrated:
+            refreshed[p.subject_id] = p
+        log.info(
+            "profiles_refreshed_and_hydrated",
+            total=len(profiles),
+            demographics=len(demographics),
+            inline=len(served_inline),
+            content=len(hydrated),
+        )
+        return list(refreshed.values())
 
     async def skip(
         self,
@@ -876,8 +1350,9 @@ class HingeApiAdapter(HingeApiPort):
             headers=self._client._get_default_headers(),
         )
         log.info("skip_sent", subject_id=subject_id[:12], origin=origin)
+        self._client.invalidate_like_limit()
         response.raise_for_status()
-        self._client.remove_recommendation(subject_id)
+        self._forget_token(subject_id)
 
     async def like_photo(
         self,
@@ -928,8 +1403,9 @@ class HingeApiAdapter(HingeApiPort):
             json=payload.model_dump(by_alias=True, exclude_none=True),
             headers=self._client._get_default_headers(),
         )
+        self._client.invalidate_like_limit()
         response.raise_for_status()
-        self._client.remove_recommendation(subject_id)
+        self._forget_token(subject_id)
         log.info(
             "like_photo_sent",
             subject_id=subject_id[:12],
@@ -997,8 +1473,9 @@ class HingeApiAdapter(HingeApiPort):
             json=payload.model_dump(by_alias=True, exclude_none=True),
             headers=self._client._get_default_headers(),
         )
+        self._client.invalidate_like_limit()
         response.raise_for_status()
-        self._client.remove_recommendation(subject_id)
+        self._forget_token(subject_id)
         log.info(
             "like_prompt_sent",
             subject_id=subject_id[:12],
@@ -1075,37 +1552,117 @@ class HingeApiAdapter(HingeApiPort):
 
     # --- Chat sync ---
 
-    async def fetch_chat_state(self) -> list[HingeChatChannel]:
-        """Fetch all Sendbird channels and cross-reference with connections."""
-        convs_task = self._client.sendbird_get_conversations(limit=100)
-        matches_task = self._client.get_matches()
-        convs, matches = await asyncio.gather(convs_task, matches_task)
-
-        connection_ids: set[str] = {
+    async def _connection_ids(self) -> set[str]:
+        matches = await self._client.get_matches()
+        return {
             c["subjectId"] for c in matches.get("connections", []) if c.get("subjectId")
         }
-        my_id = self._client.identity_id
 
+    def _channels_from_sendbird(
+        self,
+        raws: Iterable[dict[str, Any]],
+        connection_ids: set[str],
+    ) -> list[HingeChatChannel]:
+        my_id = self._client.identity_id
         channels: list[HingeChatChannel] = []
-        for raw in convs.get("channels", []):
+        for raw in raws:
             channel = _channel_from_sendbird(raw, my_id, connection_ids)
             if channel is not None:
                 channels.append(channel)
         return channels
 
+    async def _list_all_channels(self) -> list[dict[str, Any]]:
+        """Page through ``my_group_channels`` until its ``next`` token runs out."""
+        raws: list[dict[str, Any]] = []
+        token: str | None = None
+        for _ in range(_MAX_CHANNEL_PAGES):
+            page = await self._client.sendbird_get_conversations(
+                limit=_CHANNEL_PAGE_SIZE,
+                token=token,
+            )
+            raws.extend(page.get("channels", []))
+            token = page.get("next") or None
+            if token is None:
+                break
+        else:
+            log.warning("chat_channel_listing_truncated", pages=_MAX_CHANNEL_PAGES)
+        return raws
+
+    async def fetch_chat_state(self) -> list[HingeChatChannel]:
+        """Fetch every Sendbird channel and cross-reference with connections."""
+        raws, connection_ids = await asyncio.gather(
+            self._list_all_channels(),
+            self._connection_ids(),
+        )
+        return self._channels_from_sendbird(raws, connection_ids)
+
+    async def fetch_chat_changes(
+        self,
+        *,
+        token: str | None = None,
+        change_ts: int | None = None,
+    ) -> HingeChatChannelChanges:
+        """Fetch channels changed since ``token`` (or ``change_ts`` in ms).
+
+        Follows ``has_more`` until the changelog is drained and returns
+        the token to resume from next time. A channel that changed more
+        than once appears with its latest state only.
+        """
+        connection_task = asyncio.ensure_future(self._connection_ids())
+        updated: dict[str, dict[str, Any]] = {}
+        deleted: set[str] = set()
+        try:
+            for _ in range(_MAX_CHANNEL_PAGES):
+                page = await self._client.sendbird_get_channel_changelogs(
+                    token=token,
+                    change_ts=change_ts,
+                )
+                for raw in page.get("updated", []):
+                    url = raw.get("channel_url")
+                    if url:
+                        updated[url] = raw
+                        deleted.discard(url)
+                for url in page.get("deleted", []):
+                    updated.pop(url, None)
+                    deleted.add(url)
+                token = page.get("next") or token
+                if not page.get("has_more"):
+                    break
+            connection_ids = await connection_task
+        finally:
+            connection_task.cancel()
+        return HingeChatChannelChanges(
+            updated=self._channels_from_sendbird(updated.values(), connection_ids),
+            deleted=deleted,
+            connection_ids=connection_ids,
+            token=token,
+        )
+
     async def fetch_channel_messages(
         self,
         channel_url: str,
         *,
         since_ts: int = 0,
+        before_ts: int = 0,
     ) -> list[HingeChatMessage]:
-        """Fetch messages for a channel, optionally after a timestamp."""
-        anchor = since_ts if since_ts > 0 else int(time.time() * 1000)
+        """Fetch one page of a channel's messages around a timestamp.
+
+        With ``since_ts`` (ms) this is one forward page starting at (and
+        including) that timestamp; with ``before_ts`` one backward page
+        ending at (and including) it; with neither, the newest page.
+        """
+        if since_ts > 0:
+            anchor, next_limit, prev_limit = since_ts, MESSAGE_PAGE_SIZE, 0
+        elif before_ts > 0:
+            anchor, next_limit, prev_limit = before_ts, 0, MESSAGE_PAGE_SIZE
+        else:
+            anchor = int(time.time() * 1000)
+            next_limit = prev_limit = MESSAGE_PAGE_SIZE
         data = await self._client.sendbird_get_messages(
             channel_url,
-            next_limit=100,
+            next_limit=next_limit,
             message_ts=anchor,
-            prev_limit=0 if since_ts > 0 else 100,
+            prev_limit=prev_limit,
         )
         my_id = self._client.identity_id
         return [
@@ -1113,6 +1670,45 @@ class HingeApiAdapter(HingeApiPort):
             for raw in data.get("messages", [])
         ]
 
+    async def fetch_message_changes(
+        self,
+        channel_url: str,
+        *,
+        token: str | None = None,
+        change_ts: int | None = None,
+    ) -> HingeChatMessageChanges:
+        """Fetch edits/deletions in a channel since ``token`` (or ``change_ts``).
+
+        Follows ``has_more`` until the changelog is drained; a message
+        edited and then deleted is reported as deleted only.
+        """
+        my_id = self._client.identity_id
+        updated: dict[int, HingeChatMessage] = {}
+        deleted: set[int] = set()
+        for _ in range(_MAX_CHANGELOG_PAGES):
+            page = await self._client.sendbird_get_message_changelogs(
+                channel_url,
+                token=token,
+                change_ts=change_ts,
+            )
+            for raw in page.get("updated", []):
+                msg = _message_from_sendbird(raw, channel_url=channel_url, my_id=my_id)
+                updated[msg.message_id] = msg
+                deleted.discard(msg.message_id)
+            for item in page.get("deleted", []):
+                message_id = int(item["message_id"] if isinstance(item, dict) else item)
+                updated.pop(message_id, None)
+                deleted.add(message_id)
+            token = page.get("next") or token
+            if not page.get("has_more"):
+                break
+        return HingeChatMessageChanges(
+            channel_url=channel_url,
+            updated=list(updated.values()),
+            deleted=deleted,
+            token=token,
+        )
+
 
 def _ms_to_dt(ms: int | None) -> datetime | None:
     """Convert a Sendbird millisecond timestamp to UTC datetime."""
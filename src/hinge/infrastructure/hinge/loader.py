@@ -0,0 +1,139 @@
+"""DataLoader-style batching of keyed lookups across concurrent callers."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+
+from hinge.core.logging_config import logger as log
+from hinge.transport.governor import Lane, current_lane, use_lane
+
+
+class BatchLoader[K: Hashable, V]:
+    """Collect keys for a short window and fetch them in full batches.
+
+    Callers ask for keys with ``load_many``; keys requested by anyone
+    within ``window`` seconds are deduplicated and sent to ``fetch`` in
+    batches of up to ``max_batch`` (a full batch is sent immediately).
+    A key already queued or in flight is shared rather than re-fetched.
+    Nothing is cached once a batch settles.
+
+    A batch runs in the interactive governor lane if any of its keys was
+    asked for from the interactive lane, and in the background lane
+    otherwise — never in whichever lane happened to arm the timer.
+
+    ``fetch`` returns a mapping for the keys it found; keys it omits
+    resolve to "missing". If ``fetch`` raises, every caller waiting on
+    that batch sees the exception.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        *,
+        max_batch: int = 20,
+        window: float = 0.005,
+        max_concurrency: int = 4,
+        event: str = "batch_load_failed",
+    ) -> None:
+        """Bind the batch fetch and the batching parameters."""
+        self._fetch = fetch
+        self._max_batch = max(1, max_batch)
+        self._window = window
+        self._max_concurrency = max(1, max_concurrency)
+        self._event = event
+        self._queued: dict[K, asyncio.Future[V | None]] = {}
+        # Queued keys requested by at least one interactive-lane caller.
+        self._interactive: set[K] = set()
+        self._in_flight: dict[K, asyncio.Future[V | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._sem: asyncio.Semaphore | None = None
+        self._sem_loop: asyncio.AbstractEventLoop | None = None
+        self.batches_sent = 0
+
+    async def load_many(
+        self,
+        keys: Iterable[K],
+        *,
+        timeout: float | None = None,
+    ) -> dict[K, V]:
+        """Resolve ``keys``; missing ones and any not back in time are omitted.
+
+        Timing out only stops this caller waiting — the batch keeps
+        running for everyone else sharing it. Re-raises the error of
+        the first failed batch among ``keys``.
+        """
+        futures = {key: self._future_for(key) for key in dict.fromkeys(keys)}
+        if not futures:
+            return {}
+        await asyncio.wait(futures.values(), timeout=timeout)
+        for fut in futures.values():
+            if fut.done() and (exc := fut.exception()) is not None:
+                raise exc
+        return {
+            key: fut.result()
+            for key, fut in futures.items()
+            if fut.done() and fut.result() is not None
+        }
+
+    def _future_for(self, key: K) -> asyncio.Future[V | None]:
+        if current_lane() == "interactive" and key not in self._in_flight:
+            self._interactive.add(key)
+        fut = self._queued.get(key) or self._in_flight.get(key)
+        if fut is not None:
+            return fut
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._queued[key] = fut
+        if len(self._queued) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return fut
+
+    def _flush(self) -> None:
+        """Dispatch everything queued, in ``max_batch`` chunks."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        queued = list(self._queued.items())
+        self._queued.clear()
+        interactive, self._interactive = self._interactive, set()
+        self._in_flight.update(queued)
+        keys = [key for key, _ in queued]
+        for i in range(0, len(keys), self._max_batch):
+            batch = keys[i : i + self._max_batch]
+            lane: Lane = (
+                "interactive" if interactive.intersection(batch) else "background"
+            )
+            # The task copies the context here, so this pins its lane.
+            with use_lane(lane):
+                task = asyncio.ensure_future(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: list[K]) -> None:
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem_loop is not loop:
+            self._sem = asyncio.Semaphore(self._max_concurrency)
+            self._sem_loop = loop
+        found: Mapping[K, V] = {}
+        error: Exception | None = None
+        try:
+            async with self._sem:
+                self.batches_sent += 1
+                found = await self._fetch(batch)
+        except Exception as exc:
+            log.warning(self._event, size=len(batch), exc_info=True)
+            error = exc
+        finally:
+            for key in batch:
+                fut = self._in_flight.pop(key)
+                if fut.done():
+                    continue
+                if error is None:
+                    fut.set_result(found.get(key))
+                else:
+                    fut.set_exception(error)
+                    # Already logged above; callers that timed out never
+                    # read it, so keep asyncio from reporting it again.
+                    fut.exception()
@@ -76,14 +76,22 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     if container.chat_sync is not None:
         chat_sync_task = asyncio.create_task(container.chat_sync._loop())
 
+    # Background chat history backfill (resumable, low priority)
+    chat_backfill_task: asyncio.Task | None = None
+    if container.chat_backfill is not None and settings.CHAT_BACKFILL_ENABLED:
+        chat_backfill_task = asyncio.create_task(container.chat_backfill._loop())
+
     try:
         yield
     finally:
         scan_task.cancel()
         if chat_sync_task is not None:
             chat_sync_task.cancel()
+        if chat_backfill_task is not None:
+            chat_backfill_task.cancel()
         if container.sendbird_ws:
             await container.sendbird_ws.stop()
+        container._client.flush_conditional_cache()
         log.info("hinge_app_stopped")
 
 
@@ -322,6 +322,14 @@ class RecommendationsFeed(BaseHingeModel):
     origin: str
     subjects: list[RecommendationSubject]
 
+    @model_validator(mode="after")
+    def stamp_subject_origin(self) -> RecommendationsFeed:
+        """Copy the feed origin onto subjects (rating needs it later)."""
+        for subject in self.subjects:
+            if subject.origin is None:
+                subject.origin = self.origin
+        return self
+
 
 class RecommendationsResponse(BaseHingeModel):
     """The full response from the recommendations endpoint."""
@@ -0,0 +1 @@
+"""HTTP transport layer shared by every HingeClient request."""
@@ -0,0 +1,155 @@
+"""Per-host circuit breakers for upstream HTTP calls."""
+
+import asyncio
+import time
+from typing import Literal
+
+import httpx
+
+from hinge.core.logging_config import logger as log
+from hinge.error import HingeUpstreamUnavailableError
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """Classic three-state breaker for one upstream host.
+
+    ``failure_threshold`` consecutive failures (5xx or network errors)
+    open the breaker; while open, calls fail immediately. After
+    ``reset_timeout`` seconds a single probe is let through (half-open):
+    success closes the breaker, failure re-opens it for another period.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        """Start closed with no recorded failures."""
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_count = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state (an elapsed open period reads as half-open)."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (claims the probe if half-open)."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Upstream answered — close the breaker."""
+        if self._opened_at is not None:
+            log.info("circuit_breaker_closed", host=self.host)
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Upstream failed — count it, opening (or re-opening) as needed."""
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            if self._opened_at is None:
+                self.opened_count += 1
+            self._opened_at = time.monotonic()
+            log.warning(
+                "circuit_breaker_opened",
+                host=self.host,
+                failures=self.failures,
+                reset_seconds=self.reset_timeout,
+            )
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """Give up a claimed probe without a verdict (e.g. cancellation)."""
+        self._probing = False
+
+    def snapshot(self) -> dict[str, str | int | float]:
+        """Return the breaker state for status endpoints."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened_count": self.opened_count,
+            "retry_in": round(self.retry_in(), 1),
+        }
+
+
+class BreakerTransport(httpx.AsyncBaseTransport):
+    """Fail fast with ``HingeUpstreamUnavailableError`` while a host is down.
+
+    Breakers are created lazily per request host, so Hinge and Sendbird
+    trip independently.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        """Bind the inner transport and the breaker settings."""
+        self._transport = transport
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self.breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """Return (creating on first use) the breaker for ``host``."""
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                host,
+                failure_threshold=self._failure_threshold,
+                reset_timeout=self._reset_timeout,
+            )
+            self.breakers[host] = breaker
+        return breaker
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send unless the host's breaker is open; record the outcome."""
+        breaker = self.breaker(request.url.host)
+        if not breaker.allow():
+            raise HingeUpstreamUnavailableError(breaker.host, breaker.retry_in())
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    async def aclose(self) -> None:
+        """Close the inner transport."""
+        await self._transport.aclose()
@@ -0,0 +1,184 @@
+"""Conditional-request (ETag / Last-Modified) cache for upstream GETs."""
+
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from hinge.core.logging_config import logger as log
+
+# Seconds to coalesce changes before the persisted copy is rewritten.
+_DEFAULT_SAVE_DELAY = 5.0
+
+
+@dataclass
+class ConditionalEntry:
+    """Validators plus the last 200 body (and its parsed forms) for one URL."""
+
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+    # Parsed body per parser, so call sites parsing one URL into
+    # different models never get each other's type back.
+    _parsed: dict[Callable[[bytes], Any], Any] = field(
+        default_factory=dict,
+        repr=False,
+    )
+
+    def validators(self) -> dict[str, str]:
+        """Request headers that revalidate this entry."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def parsed[T](self, parse: Callable[[bytes], T]) -> T:
+        """Return the body parsed by ``parse``, parsing at most once per parser."""
+        if parse not in self._parsed:
+            self._parsed[parse] = parse(self.body)
+        return self._parsed[parse]
+
+
+class ConditionalCache:
+    """Bounded LRU of validators and bodies keyed by ``(method, path, params)``.
+
+    Only responses that carry an ``ETag`` or ``Last-Modified`` header are
+    stored. On a 304 the client returns the entry's parsed model instead
+    of downloading and re-validating the body. With ``persist_path`` set
+    the validators and raw bodies survive restarts (parsed models are
+    rebuilt lazily on first hit). Changes are coalesced for
+    ``save_delay`` seconds and written in a worker thread, off the event
+    loop; ``flush`` writes any pending changes immediately (shutdown).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        persist_path: str | None = None,
+        save_delay: float = _DEFAULT_SAVE_DELAY,
+    ) -> None:
+        """Create an empty cache, loading ``persist_path`` if it exists."""
+        self.max_entries = max_entries
+        self.persist_path = persist_path
+        self.save_delay = save_delay
+        self._entries: OrderedDict[Hashable, ConditionalEntry] = OrderedDict()
+        self._dirty = False
+        self._save_task: asyncio.Task[None] | None = None
+        if persist_path:
+            self._load()
+
+    def __len__(self) -> int:
+        """Number of stored entries."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> ConditionalEntry | None:
+        """Return the entry for ``key`` (marking it recently used)."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store[T](
+        self,
+        key: Hashable,
+        headers: Mapping[str, str],
+        body: bytes,
+        parse: Callable[[bytes], T],
+        parsed: T,
+    ) -> None:
+        """Remember a 200 response (and ``parse``'s result) if it has validators."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            if self._entries.pop(key, None) is not None:
+                self._mark_dirty()
+            return
+        entry = ConditionalEntry(etag, last_modified, body)
+        entry._parsed[parse] = parsed
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._mark_dirty()
+
+    def clear(self) -> None:
+        """Drop all entries (and, on the next save, the persisted copy)."""
+        self._entries.clear()
+        self._mark_dirty()
+
+    def flush(self) -> None:
+        """Write pending changes now, synchronously."""
+        if self._dirty and self.persist_path:
+            self._write(self.persist_path, self._snapshot())
+        self._dirty = False
+
+    # --- Persistence ---
+
+    def _mark_dirty(self) -> None:
+        """Schedule a coalesced background save (immediate without a loop)."""
+        if not self.persist_path:
+            return
+        self._dirty = True
+        if self._save_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._save_task = loop.create_task(self._save_later())
+
+    async def _save_later(self) -> None:
+        path = self.persist_path
+        try:
+            while self._dirty and path:
+                await asyncio.sleep(self.save_delay)
+                rows = self._snapshot()
+                self._dirty = False
+                await asyncio.to_thread(self._write, path, rows)
+        except OSError:
+            log.warning("conditional_cache_save_failed", path=self.persist_path)
+        finally:
+            self._save_task = None
+
+    def _snapshot(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "key": [key[0], key[1], [list(p) for p in key[2]]],
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "body": entry.body.decode(),
+            }
+            for key, entry in self._entries.items()
+        ]
+
+    @staticmethod
+    def _write(path: str, rows: list[dict[str, Any]]) -> None:
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(rows, f)
+        os.replace(tmp, path)
+
+    def _load(self) -> None:
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+        try:
+            with open(self.persist_path) as f:
+                rows = json.load(f)
+            for row in rows[-self.max_entries :]:
+                method, path, params = row["key"]
+                key = (method, path, tuple(tuple(p) for p in params))
+                self._entries[key] = ConditionalEntry(
+                    row["etag"],
+                    row["last_modified"],
+                    row["body"].encode(),
+                )
+        except AttributeError, KeyError, TypeError, ValueError:
+            log.warning("conditional_cache_load_failed", path=self.persist_path)
+            self._entries.clear()
@@ -0,0 +1,216 @@
+"""Adaptive client-wide rate governor for upstream Hinge traffic.
+
+Cloudflare in front of ``prod-api.hingeaws.net`` answers 429 (followed by
+a ~30 s cooldown) once a client exceeds an undocumented request rate.
+Instead of hardcoding a pessimistic pace per caller, every request goes
+through one token bucket whose refill rate adapts AIMD-style:
+
+- each non-429 response nudges the rate up by ``increase_step``;
+- a 429 multiplies it by ``decrease_factor``, drains the bucket and
+  blocks all traffic for ``Retry-After`` (or ``default_cooldown``).
+
+The rate that triggered the last 429 is kept as the learned ceiling;
+once the rate climbs back near it, probing slows down tenfold so the
+bucket settles just below the threshold instead of oscillating over it.
+
+Requests are scheduled in two lanes. Interactive (the default) is what
+user-facing routes run in; background jobs (rejection scan, chat sync)
+enter ``background_lane()``. Background requests leave
+``background_reserve`` tokens in the bucket and stand aside while any
+interactive request is waiting, so a like/skip never queues behind a scan.
+"""
+
+import asyncio
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Literal
+
+from hinge.core.logging_config import logger as log
+
+# Probing slows down once the rate is within this fraction of the ceiling.
+_CEILING_APPROACH = 0.9
+_CEILING_SLOWDOWN = 0.1
+
+# How often a background waiter re-checks whether interactive traffic cleared.
+_BACKGROUND_POLL_SECONDS = 0.05
+
+Lane = Literal["interactive", "background"]
+
+_current_lane: ContextVar[Lane] = ContextVar("hinge_rate_lane", default="interactive")
+
+
+@contextmanager
+def use_lane(lane: Lane) -> Iterator[None]:
+    """Run upstream calls made inside the block in ``lane``.
+
+    The lane is a context variable, so tasks spawned inside the block
+    (``asyncio.gather``, ``create_task``) inherit it.
+    """
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+def background_lane() -> AbstractContextManager[None]:
+    """Run upstream calls made inside the block in the background lane."""
+    return use_lane("background")
+
+
+def current_lane() -> Lane:
+    """Return the lane upstream calls from the current context run in."""
+    return _current_lane.get()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+class RateGovernor:
+    """Token bucket with AIMD rate adaptation and 429 cooldowns."""
+
+    def __init__(
+        self,
+        *,
+        initial_rate: float = 1.0,
+        min_rate: float = 0.1,
+        max_rate: float = 5.0,
+        burst: float = 5.0,
+        increase_step: float = 0.02,
+        decrease_factor: float = 0.5,
+        default_cooldown: float = 30.0,
+        background_reserve: float = 1.0,
+    ) -> None:
+        """Configure the bucket.
+
+        Args:
+            initial_rate: Starting refill rate in requests/second.
+            min_rate: Floor the rate never decreases below.
+            max_rate: Cap the rate never increases above.
+            burst: Bucket capacity (max requests sent back-to-back).
+            increase_step: Additive increase per successful response.
+            decrease_factor: Multiplicative decrease applied on 429.
+            default_cooldown: Pause when a 429 carries no ``Retry-After``;
+                keep it within the retry policy's ``max_retry_after`` or
+                such 429s are never retried.
+            background_reserve: Tokens the background lane must leave in
+                the bucket for interactive requests.
+
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.default_cooldown = default_cooldown
+        self.background_reserve = min(background_reserve, max(0.0, burst - 1))
+
+        self.rate = min(max(initial_rate, min_rate), max_rate)
+        self.ceiling: float | None = None
+        self.throttled_count = 0
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._interactive_waiting = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+
+    def cooldown_remaining(self) -> float:
+        """Seconds left in the current 429 cooldown (0 when not blocked)."""
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    async def acquire(self, lane: Lane | None = None) -> None:
+        """Wait until one request may be sent under the current budget.
+
+        Args:
+            lane: Scheduling lane; defaults to the context's ``current_lane()``.
+
+        """
+        lane = lane or current_lane()
+        interactive = lane == "interactive"
+        floor = 1.0 if interactive else 1.0 + self.background_reserve
+        if interactive:
+            self._interactive_waiting += 1
+        try:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                yielding = not interactive and self._interactive_waiting > 0
+                if self._tokens >= floor and not yielding:
+                    self._tokens -= 1
+                    return
+                wait = max(0.0, floor - self._tokens) / self.rate
+                if not interactive:
+                    wait = max(wait, _BACKGROUND_POLL_SECONDS)
+                await asyncio.sleep(wait)
+        finally:
+            if interactive:
+                self._interactive_waiting -= 1
+
+    def record(self, status_code: int, retry_after: str | None = None) -> None:
+        """Feed an upstream response back into the rate estimate."""
+        if status_code == 429:
+            self._on_throttled(parse_retry_after(retry_after))
+        elif status_code < 500:
+            self._on_success()
+
+    def _on_success(self) -> None:
+        step = self.increase_step
+        if self.ceiling is not None:
+            if self.rate >= self.ceiling:
+                # Survived past the old threshold — it moved, forget it.
+                self.ceiling = None
+            elif self.rate >= self.ceiling * _CEILING_APPROACH:
+                step *= _CEILING_SLOWDOWN
+        self.rate = min(self.max_rate, self.rate + step)
+
+    def _on_throttled(self, retry_after: float | None) -> None:
+        self.throttled_count += 1
+        self.ceiling = self.rate
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        cooldown = retry_after if retry_after is not None else self.default_cooldown
+        self._blocked_until = max(self._blocked_until, time.monotonic() + cooldown)
+        self._tokens = 0.0
+        log.warning(
+            "rate_governor_throttled",
+            ceiling=round(self.ceiling, 3),
+            new_rate=round(self.rate, 3),
+            cooldown_seconds=round(cooldown, 1),
+        )
+
+    def snapshot(self) -> dict[str, float | int | None]:
+        """Return the current governor state for status endpoints."""
+        return {
+            "rate_per_second": round(self.rate, 3),
+            "ceiling_per_second": (
+                round(self.ceiling, 3) if self.ceiling is not None else None
+            ),
+            "cooldown_remaining": round(self.cooldown_remaining(), 1),
+            "throttled_count": self.throttled_count,
+            "interactive_waiting": self._interactive_waiting,
+        }
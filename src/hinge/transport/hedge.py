@@ -0,0 +1,73 @@
+"""Hedged requests: re-issue a slow idempotent GET past its observed p95."""
+
+import asyncio
+import math
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies per key.
+
+    ``quantile`` returns None until ``min_samples`` calls have been seen,
+    so hedging only starts once there is a meaningful baseline.
+    """
+
+    def __init__(self, *, window: int = 200, min_samples: int = 20) -> None:
+        """Keep the last ``window`` samples per key."""
+        self._window = window
+        self._min_samples = min_samples
+        self._samples: dict[Hashable, deque[float]] = {}
+
+    def observe(self, key: Hashable, seconds: float) -> None:
+        """Record one latency sample for ``key``."""
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self._window)
+        samples.append(seconds)
+
+    def quantile(self, key: Hashable, q: float = 0.95) -> float | None:
+        """Nearest-rank ``q`` quantile for ``key``, or None if too few samples."""
+        samples = self._samples.get(key)
+        if samples is None or len(samples) < self._min_samples:
+            return None
+        ordered = sorted(samples)
+        rank = min(len(ordered), math.ceil(q * len(ordered)))
+        return ordered[rank - 1]
+
+
+async def hedged[T](
+    fn: Callable[[], Awaitable[T]],
+    delay: float | None,
+    *,
+    on_hedge: Callable[[], None] | None = None,
+) -> T:
+    """Run ``fn``; if it is still running after ``delay``, start a second copy.
+
+    The first copy to succeed wins and the other is cancelled. If one
+    copy fails the other is still awaited, so a hedge never turns a
+    success into an error. Only use this for idempotent calls.
+    """
+    primary = asyncio.ensure_future(fn())
+    if delay is None:
+        return await primary
+
+    tasks = {primary}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            if on_hedge is not None:
+                on_hedge()
+            tasks.add(asyncio.ensure_future(fn()))
+        while True:
+            done, pending = await asyncio.wait(
+                tasks,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            winners = [task for task in done if task.exception() is None]
+            if winners or not pending:
+                return (winners or list(done))[0].result()
+            tasks = pending
+    finally:
+        for task in tasks:
+            task.cancel()
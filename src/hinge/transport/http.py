@@ -0,0 +1,42 @@
+"""httpx transport that routes Hinge requests through the rate governor."""
+
+import httpx
+
+from hinge.transport.governor import RateGovernor
+
+
+class GovernedTransport(httpx.AsyncBaseTransport):
+    """Wrap an inner transport so governed hosts share one rate budget.
+
+    Only hosts listed in ``hosts`` pay the governor — Sendbird REST calls
+    made through the same ``AsyncClient`` pass straight through.
+    """
+
+    def __init__(
+        self,
+        governor: RateGovernor,
+        *,
+        hosts: set[str],
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Bind the governor, the governed hosts and the inner transport."""
+        self._governor = governor
+        self._hosts = frozenset(hosts)
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Acquire a token, send, and feed the status back to the governor."""
+        if request.url.host not in self._hosts:
+            return await self._transport.handle_async_request(request)
+
+        await self._governor.acquire()
+        response = await self._transport.handle_async_request(request)
+        self._governor.record(
+            response.status_code,
+            response.headers.get("Retry-After"),
+        )
+        return response
+
+    async def aclose(self) -> None:
+        """Close the inner transport."""
+        await self._transport.aclose()
@@ -0,0 +1,100 @@
+"""Per-host connection pools: limits, keep-alive, timeouts and HTTP/2."""
+
+import importlib.util
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import httpx
+
+
+def http2_available() -> bool:
+    """Whether the optional ``h2`` package (``httpx[http2]``) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool and timeout settings for one upstream host.
+
+    Attributes:
+        max_connections: Cap on open connections to the host.
+        max_keepalive: Idle connections kept warm for reuse.
+        keepalive_expiry: Seconds an idle connection is kept.
+        http2: Negotiate HTTP/2 (multiplexed streams on one connection)
+            when ``h2`` is installed; silently HTTP/1.1 otherwise.
+        connect_timeout: Seconds to establish a connection (incl. TLS).
+        read_timeout: Seconds to wait for response bytes.
+        write_timeout: Seconds to send the request body.
+        pool_timeout: Seconds to wait for a free connection from the pool.
+
+    """
+
+    max_connections: int = 20
+    max_keepalive: int = 10
+    keepalive_expiry: float = 60.0
+    http2: bool = True
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 10.0
+
+    def limits(self) -> httpx.Limits:
+        """Return the httpx pool limits."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        """Return the httpx timeouts."""
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def transport(self) -> httpx.AsyncHTTPTransport:
+        """Build a connection pool with these settings."""
+        return httpx.AsyncHTTPTransport(
+            limits=self.limits(),
+            http2=self.http2 and http2_available(),
+        )
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """Route each request to its host's own connection pool.
+
+    Hinge and Sendbird REST get separate pools so a burst of chat sync
+    cannot starve hydration of connections (and vice versa). Each pool's
+    timeouts replace the client-wide default for requests to its host;
+    hosts without a pool use ``default``.
+    """
+
+    def __init__(
+        self,
+        pools: Mapping[str, PoolConfig],
+        *,
+        default: PoolConfig | None = None,
+    ) -> None:
+        """Open one pool per host plus a fallback pool."""
+        self._timeouts = {
+            host: cfg.timeout().as_dict() for host, cfg in pools.items()
+        }
+        self._pools = {host: cfg.transport() for host, cfg in pools.items()}
+        self._default = (default or PoolConfig()).transport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send through the pool for ``request``'s host."""
+        pool = self._pools.get(request.url.host)
+        if pool is None:
+            return await self._default.handle_async_request(request)
+        request.extensions["timeout"] = self._timeouts[request.url.host]
+        return await pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close every pool."""
+        for pool in self._pools.values():
+            await pool.aclose()
+        await self._default.aclose()
@@ -0,0 +1,136 @@
+"""Declarative retry policies applied at the httpx transport layer."""
+
+import asyncio
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import httpx
+
+from hinge.core.logging_config import logger as log
+from hinge.transport.governor import RateGovernor, parse_retry_after
+
+# Methods that are safe to resend by HTTP semantics; anything else needs
+# an explicit per-endpoint policy to be retried.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How (and whether) to retry one kind of request.
+
+    Attributes:
+        max_attempts: Total tries including the first (1 disables retries).
+        base_delay: Backoff ceiling before the first retry, in seconds.
+        max_delay: Cap on the exponential backoff ceiling.
+        retry_statuses: Response codes worth another attempt.
+        retry_network_errors: Retry connect/read/timeout errors too.
+        max_retry_after: Give up instead of waiting longer than this for a
+            ``Retry-After`` (or governor cooldown) — callers on the
+            interactive path would rather fail fast.
+
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    retry_statuses: frozenset[int] = field(
+        default=frozenset({429, 500, 502, 503, 504}),
+    )
+    retry_network_errors: bool = True
+    max_retry_after: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential delay before retry number ``attempt``."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** max(0, attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def delay(self, attempt: int, response: httpx.Response | None) -> float | None:
+        """Seconds to wait before the next attempt, or None to stop.
+
+        ``response`` is None when the attempt failed with a network error.
+        A ``Retry-After`` header replaces the backoff curve when present.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if response is None:
+            return self.backoff(attempt) if self.retry_network_errors else None
+        if response.status_code not in self.retry_statuses:
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return self.backoff(attempt)
+        return retry_after if retry_after <= self.max_retry_after else None
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """Resend failed requests according to a per-request ``RetryPolicy``.
+
+    Wraps the governed transport so every attempt still pays the rate
+    governor; after a 429 the wait is at least the governor's cooldown,
+    and the request gives up if that exceeds ``max_retry_after``.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        policy_for: Callable[[httpx.Request], RetryPolicy],
+        hosts: set[str],
+        governor: RateGovernor | None = None,
+    ) -> None:
+        """Bind the inner transport, the policy lookup and the hosts to retry."""
+        self._transport = transport
+        self._policy_for = policy_for
+        self._hosts = frozenset(hosts)
+        self._governor = governor
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send, retrying per policy with jittered backoff / Retry-After."""
+        if request.url.host not in self._hosts:
+            return await self._transport.handle_async_request(request)
+
+        policy = self._policy_for(request)
+        attempt = 1
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as exc:
+                wait = policy.delay(attempt, None)
+                if wait is None:
+                    raise
+                reason = type(exc).__name__
+            else:
+                wait = policy.delay(attempt, response)
+                if wait is not None and response.status_code == 429:
+                    wait = self._after_cooldown(wait, policy)
+                if wait is None:
+                    return response
+                reason = str(response.status_code)
+                await response.aclose()
+
+            log.info(
+                "upstream_retry",
+                method=request.method,
+                path=request.url.path,
+                attempt=attempt,
+                reason=reason,
+                wait_seconds=round(wait, 2),
+            )
+            await asyncio.sleep(wait)
+            attempt += 1
+
+    def _after_cooldown(self, wait: float, policy: RetryPolicy) -> float | None:
+        if self._governor is None:
+            return wait
+        cooldown = self._governor.cooldown_remaining()
+        if cooldown > policy.max_retry_after:
+            return None
+        return max(wait, cooldown)
+
+    async def aclose(self) -> None:
+        """Close the inner transport."""
+        await self._transport.aclose()
@@ -0,0 +1,37 @@
+"""Single-flight coalescing of identical concurrent upstream calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight:
+    """Share one in-flight call (and its result) between identical callers.
+
+    The first caller for a key starts ``fn``; callers arriving while it is
+    still running await the same task and receive the same result or
+    exception. Nothing is cached once the call settles — the next caller
+    triggers a fresh request.
+    """
+
+    def __init__(self) -> None:
+        """Start with no calls in flight."""
+        self._calls: dict[Hashable, asyncio.Task[Any]] = {}
+
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being fetched."""
+        return len(self._calls)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    async def do[T](self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` once per key among concurrent callers."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        # Shield so one caller's cancellation doesn't cancel the shared call.
+        return await asyncio.shield(task)
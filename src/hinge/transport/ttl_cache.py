@@ -0,0 +1,75 @@
+"""Short-lived in-memory cache for idempotent upstream GETs."""
+
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Per-key expiring values with path-scoped invalidation.
+
+    Keys are the ``(method, path, params)`` tuples used by the client's
+    single-flight layer; ``invalidate`` drops every entry for a path and
+    bumps that path's generation so a fetch that started before the
+    write cannot repopulate the cache with pre-write data.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Start empty; ``clock`` is injectable for tests."""
+        self._clock = clock
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._generations: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of entries currently stored (including expired ones)."""
+        return len(self._entries)
+
+    @staticmethod
+    def _path(key: Hashable) -> str:
+        return key[1] if isinstance(key, tuple) else str(key)
+
+    def generation(self, path: str) -> int:
+        """Current invalidation generation for ``path``."""
+        return self._generations.get(path, 0)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the live value for ``key``, or ``None`` if absent/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: float,
+        *,
+        generation: int | None = None,
+    ) -> bool:
+        """Store ``value`` for ``ttl`` seconds.
+
+        When ``generation`` is given and the path has been invalidated
+        since, the value is discarded and ``False`` returned.
+        """
+        if generation is not None and generation != self.generation(self._path(key)):
+            return False
+        self._entries[key] = (self._clock() + ttl, value)
+        return True
+
+    def invalidate(self, *paths: str) -> None:
+        """Drop all entries for ``paths`` and fence in-flight fetches."""
+        for path in paths:
+            self._generations[path] = self.generation(path) + 1
+        dropped = set(paths)
+        for key in [k for k in self._entries if self._path(k) in dropped]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop everything (e.g. on session switch)."""
+        self.invalidate(*self._generations, *{self._path(k) for k in self._entries})
+        self._entries.clear()
@@ -0,0 +1,242 @@
+"""Tests for HingeApiAdapter batched profile hydration."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hinge.core.deadline import Deadline
+from hinge.domain.models.profile import HingeProfile, ProfilePhoto, ProfilePoll
+from hinge.infrastructure.hinge.adapter import HingeApiAdapter
+from hinge.models import ProfileContent, UserProfileV2
+
+
+def test_gather_chunks_caps_concurrency_and_keeps_order():
+    adapter = HingeApiAdapter(MagicMock(), batch_concurrency=2)
+    in_flight = 0
+    peak = 0
+
+    async def _fetch(chunk: list[str]) -> list[str]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [s.upper() for s in chunk]
+
+    ids = [f"id{i}" for i in range(7)]
+    batches = asyncio.run(
+        adapter._gather_chunks(ids, 2, _fetch, event="test_chunk_failed"),
+    )
+
+    assert peak == 2
+    assert [offset for offset, _, _ in batches] == [0, 2, 4, 6]
+    assert batches[-1] == (6, ["id6"], ["ID6"])
+
+
+def test_gather_chunks_isolates_failed_chunk():
+    adapter = HingeApiAdapter(MagicMock())
+
+    async def _fetch(chunk: list[str]) -> list[str]:
+        if "bad" in chunk:
+            raise RuntimeError("upstream 500")
+        return chunk
+
+    batches = asyncio.run(
+        adapter._gather_chunks(
+            ["a", "b", "bad", "c"],
+            2,
+            _fetch,
+            event="test_chunk_failed",
+        ),
+    )
+
+    assert batches == [(0, ["a", "b"], ["a", "b"])]
+
+
+def test_gather_chunks_returns_partial_results_at_deadline():
+    adapter = HingeApiAdapter(MagicMock())
+    cancelled: list[str] = []
+
+    async def _fetch(chunk: list[str]) -> list[str]:
+        if "slow" in chunk:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(chunk[0])
+                raise
+        return chunk
+
+    async def _run() -> list:
+        return await adapter._gather_chunks(
+            ["a", "b", "slow", "c"],
+            2,
+            _fetch,
+            event="test_chunk_failed",
+            deadline=Deadline(0.05),
+        )
+
+    batches = asyncio.run(_run())
+
+    assert batches == [(0, ["a", "b"], ["a", "b"])]
+    assert cancelled == ["slow"]
+
+
+def _v2(identity_id: str, *, with_photo: bool) -> UserProfileV2:
+    photos = (
+        [{"cdnId": "cdn", "contentId": "c1", "url": "https://img/1.jpg"}]
+        if with_photo
+        else []
+    )
+    return UserProfileV2.model_validate(
+        {
+            "identityId": identity_id,
+            "profile": {
+                "firstName": "Alex",
+                "age": 29,
+                "location": {"name": "Zurich"},
+                "zodiac": 3,
+                "photos": photos,
+            },
+        },
+    )
+
+
+def test_refresh_and_hydrate_keeps_content_only_fields():
+    client = MagicMock()
+    client.fetch_prompts = AsyncMock(side_effect=RuntimeError("offline"))
+    client.get_profiles_v2 = AsyncMock(return_value=[_v2("a", with_photo=True)])
+    client.get_profile_content = AsyncMock(
+        return_value=[
+            ProfileContent.model_validate(
+                {
+                    "userId": "a",
+                    "content": {
+                        "photos": [
+                            {
+                                "cdnId": "cdn",
+                                "contentId": "c1",
+                                "url": "https://img/1.jpg",
+                                "pHash": "abc",
+                            },
+                        ],
+                        "answers": [],
+                        "promptPoll": {
+                            "contentId": "poll",
+                            "questionId": "q1",
+                            "options": ["yes", "no"],
+                        },
+                        "videoPrompt": {"contentId": "vid", "videoUrl": "v.mp4"},
+                    },
+                },
+            ),
+        ],
+    )
+    adapter = HingeApiAdapter(client)
+    # Content and demographics both past their TTLs (never refreshed).
+    a = HingeProfile(subject_id="a", first_name="A")
+
+    refreshed = asyncio.run(adapter.refresh_and_hydrate([a]))
+
+    assert refreshed == [a]
+    assert a.zodiac == 3
+    assert [poll.content_id for poll in a.polls] == ["poll"]
+    assert a.video_prompt is not None and a.video_prompt.content_id == "vid"
+    assert a.photos[0].p_hash == "abc"
+    client.get_profile_content.assert_awaited_once_with(["a"])
+
+
+def test_refresh_and_hydrate_skips_fresh_profiles():
+    client = MagicMock()
+    client.fetch_prompts = AsyncMock(side_effect=RuntimeError("offline"))
+    client.get_profiles_v2 = AsyncMock(return_value=[_v2("old", with_photo=True)])
+    adapter = HingeApiAdapter(client)
+    now = datetime.now(UTC)
+    photo = ProfilePhoto(content_id="keep", cdn_id="c", url="https://img/keep.jpg")
+    fresh = HingeProfile(
+        subject_id="fresh",
+        first_name="F",
+        drinking=1,
+        photos=[photo],
+        content_refreshed_at=now,
+        demographics_refreshed_at=now,
+    )
+    # Content is fresh but demographics are past the TTL (naive = UTC).
+    old = HingeProfile(
+        subject_id="old",
+        first_name="O",
+        drinking=1,
+        photos=[photo],
+        content_refreshed_at=now,
+        demographics_refreshed_at=(now - timedelta(days=30)).replace(tzinfo=None),
+    )
+
+    refreshed = asyncio.run(adapter.refresh_and_hydrate([fresh, old]))
+
+    client.get_profiles_v2.assert_awaited_once_with(["old"])
+    assert refreshed == [old]
+    assert old.zodiac == 3
+    # Fresh content is not overwritten by the inline v2 photos.
+    assert [p.content_id for p in old.photos] == ["keep"]
+    client.get_profile_content.assert_not_called()
+
+
+def test_refresh_and_hydrate_shares_one_v2_fetch_per_batch():
+    client = MagicMock()
+    client.fetch_prompts = AsyncMock(side_effect=RuntimeError("offline"))
+    client.get_profiles_v2 = AsyncMock(
+        return_value=[
+            _v2("a", with_photo=True),
+            _v2("b", with_photo=True),
+            _v2("c", with_photo=False),
+        ],
+    )
+    client.get_profile_content = AsyncMock(
+        return_value=[
+            ProfileContent.model_validate(
+                {
+                    "userId": "c",
+                    "content": {
+                        "photos": [
+                            {"cdnId": "cdn", "contentId": "c9", "url": "https://c"},
+                        ],
+                        "answers": [],
+                    },
+                },
+            ),
+        ],
+    )
+    adapter = HingeApiAdapter(client)
+    stale = (datetime.now(UTC) - timedelta(days=30)).replace(tzinfo=None)
+
+    def _stored(subject_id: str) -> HingeProfile:
+        photo = ProfilePhoto(
+            content_id="c1",
+            cdn_id="cdn",
+            url="https://img/old.jpg",
+            p_hash="abc",
+        )
+        return HingeProfile(
+            subject_id=subject_id,
+            first_name=subject_id.upper(),
+            photos=[photo],
+            photo_urls=[photo.url],
+            polls=[ProfilePoll(content_id="poll", question_id="q1", question_text="")],
+            content_refreshed_at=stale,
+            demographics_refreshed_at=stale,
+        )
+
+    a, b, c = _stored("a"), _stored("b"), _stored("c")
+
+    refreshed = asyncio.run(adapter.refresh_and_hydrate([a, b, c]))
+
+    # One /user/v2/public batch covers demographics and inline content;
+    # only "c", whose payload had no inline content, hits /content/v2/public.
+    client.get_profiles_v2.assert_awaited_once_with(["a", "b", "c"])
+    client.get_profile_content.assert_awaited_once_with(["c"])
+    assert {p.subject_id for p in refreshed} == {"a", "b", "c"}
+    assert a.zodiac == b.zodiac == c.zodiac == 3
+    assert a.photo_urls == ["https://img/1.jpg"]
+    assert a.photos[0].p_hash == "abc"
+    assert [poll.content_id for poll in a.polls] == ["poll"]
+    assert a.content_refreshed_at is not None and a.content_refreshed_at != stale
+    assert [p.content_id for p in c.photos] == ["c9"]
@@ -110,3 +110,84 @@ def test_fetch_channel_messages(sendbird_messages):
 
     assert len(messages) == len(channel_payload["messages"])
     assert all(m.channel_url == channel_payload["channel_url"] for m in messages)
+
+
+def _raw_channel(url: str, member: str) -> dict:
+    return {
+        "channel_url": url,
+        "members": [{"user_id": MY_ID}, {"user_id": member}],
+        "created_at": 1_700_000_000,
+    }
+
+
+def test_fetch_chat_state_follows_next_token():
+    client = MagicMock()
+    client.identity_id = MY_ID
+    client.sendbird_get_conversations = AsyncMock(
+        side_effect=[
+            {"channels": [_raw_channel("c1", "a")], "next": "p2"},
+            {"channels": [_raw_channel("c2", "b")], "next": ""},
+        ],
+    )
+    client.get_matches = AsyncMock(return_value={"connections": [{"subjectId": "a"}]})
+    adapter = HingeApiAdapter(client)
+
+    channels = asyncio.run(adapter.fetch_chat_state())
+
+    assert [c.channel_url for c in channels] == ["c1", "c2"]
+    calls = client.sendbird_get_conversations.await_args_list
+    assert [c.kwargs["token"] for c in calls] == [None, "p2"]
+
+
+def test_fetch_chat_changes_drains_changelog():
+    client = MagicMock()
+    client.identity_id = MY_ID
+    client.sendbird_get_channel_changelogs = AsyncMock(
+        side_effect=[
+            {
+                "updated": [_raw_channel("c1", "a"), _raw_channel("c2", "b")],
+                "deleted": [],
+                "has_more": True,
+                "next": "t1",
+            },
+            {"updated": [], "deleted": ["c2"], "has_more": False, "next": "t2"},
+        ],
+    )
+    client.get_matches = AsyncMock(return_value={"connections": [{"subjectId": "a"}]})
+    adapter = HingeApiAdapter(client)
+
+    changes = asyncio.run(adapter.fetch_chat_changes(token="t0"))
+
+    assert [c.channel_url for c in changes.updated] == ["c1"]
+    assert changes.updated[0].is_connection_active is True
+    assert changes.deleted == {"c2"}
+    assert changes.connection_ids == {"a"}
+    assert changes.token == "t2"
+
+
+def test_fetch_message_changes_collapses_edit_then_delete():
+    client = MagicMock()
+    client.identity_id = MY_ID
+    edited = {
+        "message_id": 7,
+        "user": {"user_id": "a"},
+        "created_at": 1_700_000_000_000,
+    }
+    client.sendbird_get_message_changelogs = AsyncMock(
+        side_effect=[
+            {"updated": [edited], "deleted": [], "has_more": True, "next": "t1"},
+            {
+                "updated": [],
+                "deleted": [{"message_id": 7, "deleted_at": 1}],
+                "has_more": False,
+                "next": "t2",
+            },
+        ],
+    )
+    adapter = HingeApiAdapter(client)
+
+    changes = asyncio.run(adapter.fetch_message_changes("c1", token="t0"))
+
+    assert changes.updated == []
+    assert changes.deleted == {7}
+    assert changes.token == "t2"
@@ -0,0 +1,161 @@
+"""Tests for ChatBackfillService."""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from hinge.application.services.chat_backfill_service import ChatBackfillService
+from hinge.domain.models.chat_channel import HingeChatChannel
+from hinge.domain.models.chat_message import HingeChatMessage
+from hinge.infrastructure.db.mappers import start_hinge_mappers
+from hinge.infrastructure.db.metadata import metadata
+from hinge.infrastructure.db.unit_of_work import HingeSqlAlchemyUnitOfWork
+from hinge.infrastructure.hinge.adapter import MESSAGE_PAGE_SIZE
+
+_BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def uow_factory():
+    start_hinge_mappers()
+    engine = create_engine("sqlite:///:memory:")
+    metadata.create_all(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _message(message_id: int) -> HingeChatMessage:
+    return HingeChatMessage(
+        message_id=message_id,
+        channel_url="c1",
+        sender_sendbird_id="111",
+        is_from_me=False,
+        message_type="MESG",
+        body="hi",
+        data="",
+        custom_type="",
+        created_at=_BASE + timedelta(seconds=message_id),
+        message_survival_seconds=0,
+        message_retention_hour=0,
+        raw_json="",
+    )
+
+
+def _history_adapter(history: list[HingeChatMessage]) -> AsyncMock:
+    async def _fetch(channel_url, since_ts=0, before_ts=0):
+        # Backward pages include the anchor message itself.
+        older = [m for m in history if m.created_at.timestamp() * 1000 <= before_ts]
+        return older[-MESSAGE_PAGE_SIZE:]
+
+    adapter = AsyncMock()
+    adapter.fetch_channel_messages = AsyncMock(side_effect=_fetch)
+    return adapter
+
+
+def _seed(uow_factory, messages: list[HingeChatMessage]) -> None:
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        uow.chat.upsert_channel(
+            HingeChatChannel(
+                channel_url="c1",
+                counterparty_sendbird_id="111",
+                custom_type="",
+                channel_created_at=_BASE,
+            ),
+        )
+        uow.chat.upsert_messages(messages)
+        uow.commit()
+
+
+def _stored_ids(uow_factory) -> set[int]:
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        return {m.message_id for m in uow.chat.get_messages("c1", limit=1000)}
+
+
+def test_backfill_pages_back_to_first_message(uow_factory):
+    history = [_message(i) for i in range(1, 251)]
+    _seed(uow_factory, history[-MESSAGE_PAGE_SIZE:])
+    adapter = _history_adapter(history)
+    service = ChatBackfillService(
+        api=adapter,
+        uow_factory=uow_factory,
+        page_delay=0,
+    )
+
+    result = asyncio.run(service.run())
+
+    assert result.channels_completed == 1
+    assert result.channels_pending == 0
+    assert _stored_ids(uow_factory) == set(range(1, 251))
+    # 151..250 stored: a full page back from 151, then a short one from 52.
+    assert adapter.fetch_channel_messages.await_count == 2
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        assert uow.sync_state.get("chat_backfill:c1") == "done"
+
+    adapter.fetch_channel_messages.reset_mock()
+    asyncio.run(service.run())
+    assert adapter.fetch_channel_messages.await_count == 0
+
+
+def test_backfill_resumes_from_checkpoint_after_failure(uow_factory):
+    history = [_message(i) for i in range(1, 251)]
+    _seed(uow_factory, history[-MESSAGE_PAGE_SIZE:])
+    adapter = _history_adapter(history)
+    fetch = adapter.fetch_channel_messages.side_effect
+    calls = 0
+
+    async def _flaky(channel_url, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("boom")
+        return await fetch(channel_url, **kwargs)
+
+    adapter.fetch_channel_messages = AsyncMock(side_effect=_flaky)
+    service = ChatBackfillService(
+        api=adapter,
+        uow_factory=uow_factory,
+        page_delay=0,
+    )
+
+    first = asyncio.run(service.run())
+    assert first.channels_pending == 1
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        checkpoint = uow.sync_state.get("chat_backfill:c1")
+    assert checkpoint == str(int(history[51].created_at.timestamp() * 1000))
+
+    second = asyncio.run(service.run())
+    assert second.channels_completed == 1
+    assert adapter.fetch_channel_messages.await_args.kwargs == {
+        "before_ts": int(checkpoint),
+    }
+    assert _stored_ids(uow_factory) == set(range(1, 251))
+
+
+def test_backfill_spaces_sendbird_pages_by_page_delay(uow_factory):
+    history = [_message(i) for i in range(1, 351)]
+    _seed(uow_factory, history[-MESSAGE_PAGE_SIZE:])
+    adapter = _history_adapter(history)
+    fetch = adapter.fetch_channel_messages.side_effect
+    called_at: list[float] = []
+
+    async def _timed(channel_url, **kwargs):
+        called_at.append(time.monotonic())
+        return await fetch(channel_url, **kwargs)
+
+    adapter.fetch_channel_messages = AsyncMock(side_effect=_timed)
+    service = ChatBackfillService(
+        api=adapter,
+        uow_factory=uow_factory,
+        page_delay=0.05,
+    )
+
+    result = asyncio.run(service.run())
+
+    assert result.channels_completed == 1
+    assert len(called_at) == 3
+    gaps = [b - a for a, b in zip(called_at, called_at[1:], strict=False)]
+    assert all(gap >= 0.05 for gap in gaps)
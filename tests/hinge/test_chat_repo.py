@@ -121,3 +121,39 @@ def test_get_channels_include_orphans_toggle(uow_factory):
         active = uow.chat.get_channels(include_orphans=False)
     assert {c.channel_url for c in all_} == {"c1", "c2"}
     assert {c.channel_url for c in active} == {"c2"}
+
+
+def test_message_cursors_track_newest_per_channel(uow_factory):
+    now = datetime.now(UTC)
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        uow.chat.upsert_channel(_make_channel("c1"))
+        uow.chat.upsert_channel(_make_channel("c2"))
+        uow.chat.upsert_messages(
+            [
+                _make_message(1, "c1", now - timedelta(hours=1)),
+                _make_message(5, "c1", now),
+                _make_message(3, "c2", now - timedelta(hours=2)),
+            ],
+        )
+        uow.commit()
+        cursors = uow.chat.message_cursors()
+    assert set(cursors) == {"c1", "c2"}
+    assert cursors["c1"][1] == 5
+    assert cursors["c2"][1] == 3
+    assert cursors["c1"][0] > cursors["c2"][0]
+
+
+def test_upsert_channels_bulk_and_touch(uow_factory):
+    earlier = datetime(2026, 1, 1)
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        assert uow.chat.upsert_channels([_make_channel("c1"), _make_channel("c2")]) == 2
+        updated = _make_channel("c1")
+        updated.unread_count = 3
+        uow.chat.upsert_channels([updated])
+        assert uow.chat.touch_channels({"c2"}, earlier) == 1
+        uow.commit()
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        c1 = uow.chat.get_channel("c1")
+        c2 = uow.chat.get_channel("c2")
+    assert c1 is not None and c1.unread_count == 3
+    assert c2 is not None and c2.last_synced_at == earlier
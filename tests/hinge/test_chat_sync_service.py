@@ -1,6 +1,7 @@
 """Tests for ChatSyncService."""
 
 import asyncio
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock
 
 import pytest
@@ -9,6 +10,14 @@ from sqlalchemy.orm import sessionmaker
 
 from hinge.infrastructure.db.metadata import metadata
 from hinge.application.services.chat_sync_service import ChatSyncService
+from hinge.domain.models.chat_channel import (
+    HingeChatChannel,
+    HingeChatChannelChanges,
+)
+from hinge.domain.models.chat_message import (
+    HingeChatMessage,
+    HingeChatMessageChanges,
+)
 from hinge.infrastructure.db.mappers import start_hinge_mappers
 from hinge.infrastructure.db.unit_of_work import HingeSqlAlchemyUnitOfWork
 from hinge.infrastructure.hinge.adapter import (
@@ -36,6 +45,23 @@ def mock_adapter(sendbird_channels, sendbird_messages):
         for raw in sendbird_channels["channels"]
     ]
     adapter.fetch_chat_state = AsyncMock(return_value=channels)
+    adapter.fetch_chat_changes = AsyncMock(
+        return_value=HingeChatChannelChanges(
+            updated=[],
+            deleted=set(),
+            connection_ids=connection_ids,
+            token="t0",
+        ),
+    )
+
+    adapter.fetch_message_changes = AsyncMock(
+        side_effect=lambda url, **_: HingeChatMessageChanges(
+            channel_url=url,
+            updated=[],
+            deleted=set(),
+            token="m0",
+        ),
+    )
 
     by_url = {
         payload["channel_url"]: payload["messages"]
@@ -102,3 +128,242 @@ def test_sync_all_marks_orphans(uow_factory, mock_adapter):
         stale = uow.chat.get_channel("stale_channel")
     assert stale is not None
     assert stale.is_connection_active is False
+
+
+
+_BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _chat_message(channel_url: str, message_id: int) -> HingeChatMessage:
+    return HingeChatMessage(
+        message_id=message_id,
+        channel_url=channel_url,
+        sender_sendbird_id="111",
+        is_from_me=False,
+        message_type="MESG",
+        body="hi",
+        data="",
+        custom_type="",
+        created_at=_BASE + timedelta(seconds=message_id),
+        message_survival_seconds=0,
+        message_retention_hour=0,
+        raw_json="",
+    )
+
+
+def _fake_sendbird(upstream: dict[str, list[HingeChatMessage]]) -> AsyncMock:
+    """Adapter serving channels/messages from ``upstream``.
+
+    Change messages with ``adapter.post(url, message)``,
+    ``adapter.edit(url, message)`` or ``adapter.unsend(url, message_id)``
+    (or drop a channel with ``adapter.delete(url)``) so the fake
+    changelogs see them; a changelog token is the number of changes
+    seen so far.
+    """
+    log: list[tuple[str, bool]] = []
+    edits: dict[str, list[HingeChatMessage | int]] = {}
+
+    def _channel(url: str) -> HingeChatChannel:
+        msgs = upstream[url]
+        return HingeChatChannel(
+            channel_url=url,
+            counterparty_sendbird_id=url,
+            custom_type="",
+            channel_created_at=_BASE,
+            subject_id=url,
+            last_message_id=msgs[-1].message_id if msgs else None,
+            last_message_at=msgs[-1].created_at if msgs else None,
+        )
+
+    async def _state():
+        return [_channel(url) for url in upstream]
+
+    async def _changes(token=None, change_ts=None):
+        since = int(token) if token is not None else len(log)
+        updated: dict[str, HingeChatChannel] = {}
+        deleted: set[str] = set()
+        for url, gone in log[since:]:
+            if gone:
+                updated.pop(url, None)
+                deleted.add(url)
+            else:
+                updated[url] = _channel(url)
+        return HingeChatChannelChanges(
+            updated=list(updated.values()),
+            deleted=deleted,
+            connection_ids=set(upstream),
+            token=str(len(log)),
+        )
+
+    async def _fetch(channel_url, since_ts=None, before_ts=None):
+        msgs = upstream[channel_url]
+        if since_ts is None:
+            return list(msgs)
+        # Forward pages include the anchor message itself.
+        return [m for m in msgs if m.created_at.timestamp() * 1000 >= since_ts]
+
+    async def _message_changes(url, token=None, change_ts=None):
+        history = edits.setdefault(url, [])
+        since = int(token) if token is not None else len(history)
+        changed = history[since:]
+        return HingeChatMessageChanges(
+            channel_url=url,
+            updated=[m for m in changed if isinstance(m, HingeChatMessage)],
+            deleted={m for m in changed if isinstance(m, int)},
+            token=str(len(history)),
+        )
+
+    def _edit(url: str, message: HingeChatMessage) -> None:
+        upstream[url] = [
+            message if m.message_id == message.message_id else m
+            for m in upstream[url]
+        ]
+        edits.setdefault(url, []).append(message)
+        log.append((url, False))
+
+    def _unsend(url: str, message_id: int) -> None:
+        upstream[url] = [m for m in upstream[url] if m.message_id != message_id]
+        edits.setdefault(url, []).append(message_id)
+        log.append((url, False))
+
+    def _post(url: str, message: HingeChatMessage) -> None:
+        upstream[url].append(message)
+        log.append((url, False))
+
+    def _delete(url: str) -> None:
+        del upstream[url]
+        log.append((url, True))
+
+    adapter = AsyncMock()
+    adapter.fetch_chat_state = AsyncMock(side_effect=_state)
+    adapter.fetch_chat_changes = AsyncMock(side_effect=_changes)
+    adapter.fetch_channel_messages = AsyncMock(side_effect=_fetch)
+    adapter.fetch_message_changes = AsyncMock(side_effect=_message_changes)
+    adapter.get_profiles_quick = AsyncMock(return_value={})
+    adapter.post = _post
+    adapter.delete = _delete
+    adapter.edit = _edit
+    adapter.unsend = _unsend
+    return adapter
+
+
+def test_sync_all_only_fetches_past_stored_cursor(uow_factory):
+    upstream = {"c1": [_chat_message("c1", i) for i in range(1, 4)]}
+    adapter = _fake_sendbird(upstream)
+    service = ChatSyncService(api=adapter, uow_factory=uow_factory)
+
+    assert asyncio.run(service.sync_all()).messages_upserted == 3
+    assert adapter.fetch_channel_messages.await_args.kwargs == {}
+
+    adapter.post("c1", _chat_message("c1", 4))
+    adapter.post("c1", _chat_message("c1", 5))
+    assert asyncio.run(service.sync_all()).messages_upserted == 2
+    assert adapter.fetch_channel_messages.await_args.kwargs == {
+        "since_ts": int((_BASE + timedelta(seconds=3)).timestamp() * 1000),
+    }
+
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        ids = {m.message_id for m in uow.chat.get_messages("c1")}
+    assert ids == {1, 2, 3, 4, 5}
+
+
+def test_sync_all_skips_unchanged_channels(uow_factory):
+    upstream = {
+        url: [_chat_message(url, i) for i in range(n, n + 2)]
+        for url, n in (("c1", 1), ("c2", 10), ("c3", 20))
+    }
+    adapter = _fake_sendbird(upstream)
+    service = ChatSyncService(api=adapter, uow_factory=uow_factory)
+
+    first = asyncio.run(service.sync_all())
+    assert first.channels_upserted == 3
+    assert adapter.fetch_channel_messages.await_count == 3
+
+    adapter.fetch_channel_messages.reset_mock()
+    adapter.post("c2", _chat_message("c2", 12))
+    second = asyncio.run(service.sync_all())
+    assert second.channels_upserted == 1
+    assert second.messages_upserted == 1
+    assert [c.args[0] for c in adapter.fetch_channel_messages.await_args_list] == [
+        "c2",
+    ]
+
+    adapter.fetch_channel_messages.reset_mock()
+    third = asyncio.run(service.sync_all())
+    assert third.channels_upserted == 0
+    assert adapter.fetch_channel_messages.await_count == 0
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        stored = uow.chat.get_channel("c2")
+    assert stored is not None
+    assert stored.last_message_id == 12
+
+
+def test_sync_all_reads_channel_changelog_after_first_listing(uow_factory):
+    upstream = {url: [_chat_message(url, n)] for url, n in (("c1", 1), ("c2", 2))}
+    adapter = _fake_sendbird(upstream)
+    service = ChatSyncService(api=adapter, uow_factory=uow_factory)
+
+    asyncio.run(service.sync_all())
+    assert adapter.fetch_chat_state.await_count == 1
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        assert uow.sync_state.get("sendbird_channel_changelog_token") == "0"
+
+    adapter.delete("c1")
+    adapter.post("c2", _chat_message("c2", 3))
+    result = asyncio.run(service.sync_all())
+
+    assert adapter.fetch_chat_state.await_count == 1
+    assert adapter.fetch_chat_changes.await_args.kwargs == {"token": "0"}
+    assert result.channels_upserted == 1
+    assert result.channels_marked_orphan == 1
+    assert result.messages_upserted == 1
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        assert uow.sync_state.get("sendbird_channel_changelog_token") == "2"
+        gone = uow.chat.get_channel("c1")
+    assert gone is not None and gone.is_connection_active is False
+
+
+def test_sync_all_applies_message_edits_and_deletions(uow_factory):
+    upstream = {"c1": [_chat_message("c1", i) for i in range(1, 4)]}
+    adapter = _fake_sendbird(upstream)
+    service = ChatSyncService(api=adapter, uow_factory=uow_factory)
+    asyncio.run(service.sync_all())
+    assert adapter.fetch_message_changes.await_args.kwargs["change_ts"] > 0
+
+    edited = _chat_message("c1", 1)
+    edited.body = "edited"
+    edited.updated_at = _BASE + timedelta(hours=1)
+    adapter.edit("c1", edited)
+    adapter.unsend("c1", 2)
+    asyncio.run(service.sync_all())
+
+    assert adapter.fetch_message_changes.await_args.kwargs == {"token": "0"}
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        msgs = {m.message_id: m for m in uow.chat.get_messages("c1")}
+        assert uow.sync_state.get("sendbird_message_changelog:c1") == "2"
+    assert msgs[1].body == "edited"
+    assert msgs[2].is_removed is True
+    assert msgs[3].is_removed is False
+
+
+def test_sync_all_applies_old_message_edit_in_idle_channel(uow_factory):
+    upstream = {
+        "c1": [_chat_message("c1", i) for i in range(1, 4)],
+        "c2": [_chat_message("c2", i) for i in range(10, 12)],
+    }
+    adapter = _fake_sendbird(upstream)
+    service = ChatSyncService(api=adapter, uow_factory=uow_factory)
+    asyncio.run(service.sync_all())
+
+    # Editing an old message moves neither last message nor unread count.
+    edited = _chat_message("c1", 1)
+    edited.body = "edited"
+    edited.updated_at = _BASE + timedelta(hours=1)
+    adapter.edit("c1", edited)
+    adapter.fetch_channel_messages.reset_mock()
+    asyncio.run(service.sync_all())
+
+    adapter.fetch_channel_messages.assert_not_awaited()
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        msgs = {m.message_id: m for m in uow.chat.get_messages("c1")}
+    assert msgs[1].body == "edited"
@@ -0,0 +1,74 @@
+"""Tests for per-host circuit breakers."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from hinge.client import BASE_URL
+from hinge.error import HingeUpstreamUnavailableError
+from hinge.transport.breaker import BreakerTransport, CircuitBreaker
+
+_HOST = httpx.URL(BASE_URL).host
+
+
+def test_breaker_opens_after_threshold_and_probes():
+    breaker = CircuitBreaker(_HOST, failure_threshold=2, reset_timeout=0.0)
+
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.opened_count == 1
+
+    # reset_timeout elapsed: exactly one probe goes through.
+    assert breaker.state == "half_open"
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker(_HOST, failure_threshold=5, reset_timeout=60.0)
+    for _ in range(5):
+        breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.retry_in() > 0
+
+    breaker._opened_at -= 60.0
+    assert breaker.allow() is True
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_transport_fails_fast_while_open():
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        return httpx.Response(503)
+
+    transport = BreakerTransport(
+        httpx.MockTransport(_handler),
+        failure_threshold=2,
+        reset_timeout=60.0,
+    )
+
+    async def _run() -> None:
+        async with httpx.AsyncClient(base_url=BASE_URL, transport=transport) as c:
+            assert (await c.get("/user/v3")).status_code == 503
+            assert (await c.get("/user/v3")).status_code == 503
+            with pytest.raises(HingeUpstreamUnavailableError) as exc:
+                await c.get("/user/v3")
+            assert exc.value.host == _HOST
+            assert exc.value.retry_after > 0
+            # Other hosts trip independently.
+            assert (await c.get("https://sendbird.example/x")).status_code == 503
+
+    asyncio.run(_run())
+    assert calls == [_HOST, _HOST, "sendbird.example"]
+    assert transport.breaker(_HOST).state == "open"
+    assert transport.breaker("sendbird.example").state == "closed"
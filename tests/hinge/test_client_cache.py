@@ -0,0 +1,242 @@
+"""Tests for the HingeClient self-data TTL cache and conditional GETs."""
+
+import asyncio
+import json
+import os
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+
+from hinge.client import BASE_URL, HingeClient
+from hinge.models import ContentSettings
+from hinge.transport.conditional import ConditionalCache
+from hinge.transport.ttl_cache import TTLCache
+
+_LIKE_LIMIT = {"likesLeft": 8, "superlikesLeft": 1}
+_SETTINGS = {"isSmartPhotoOptIn": True, "isConvoStartersOptIn": False}
+
+
+@pytest.fixture
+def sessions_dir(tmp_path, monkeypatch):
+    """Keep HingeClient session files out of the working tree."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_ttl_cache_expiry_and_generation_fence():
+    now = [0.0]
+    cache = TTLCache(clock=lambda: now[0])
+    key = ("GET", "/likelimit", ())
+
+    cache.set(key, "a", 10)
+    assert cache.get(key) == "a"
+    now[0] = 10.0
+    assert cache.get(key) is None
+
+    generation = cache.generation("/likelimit")
+    cache.invalidate("/likelimit")
+    assert not cache.set(key, "stale", 10, generation=generation)
+    assert cache.get(key) is None
+
+
+def _client(handler) -> tuple[HingeClient, httpx.AsyncClient]:
+    http = httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler))
+    return HingeClient("+41000000000", client=http), http
+
+
+def test_cached_get_until_write_invalidates(sessions_dir):
+    hits: list[str] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        hits.append(f"{request.method} {request.url.path}")
+        if request.method == "PATCH":
+            return httpx.Response(200, json={})
+        return httpx.Response(200, json=_SETTINGS)
+
+    async def _run() -> None:
+        client, http = _client(_handler)
+        await client.get_content_settings()
+        await client.get_content_settings()
+        await client.update_content_settings(
+            ContentSettings.model_validate(_SETTINGS),
+        )
+        await client.get_content_settings()
+        await http.aclose()
+
+    asyncio.run(_run())
+    # The PATCH response is written through, so the last read is a hit.
+    assert hits == ["GET /content/v1/settings", "PATCH /content/v1/settings"]
+
+
+def test_uncached_paths_and_unrelated_writes(sessions_dir):
+    hits: list[str] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        hits.append(f"{request.method} {request.url.path}")
+        return httpx.Response(200, json=_LIKE_LIMIT)
+
+    async def _run() -> None:
+        client, http = _client(_handler)
+        await client.get_like_limit()
+        await client.get_like_limit()
+        await client.get_profile_state()
+        await client.get_profile_state()
+        await client.put_photos([])
+        await client.get_like_limit()
+        await http.aclose()
+
+    asyncio.run(_run())
+    assert hits == [
+        "GET /likelimit",
+        "GET /profilestate/profile",
+        "GET /profilestate/profile",
+        "PUT /content/v1/photos",
+    ]
+
+
+def test_session_switch_clears_cache(sessions_dir):
+    hits: list[str] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.url.path)
+        return httpx.Response(200, json=_LIKE_LIMIT)
+
+    async def _run() -> None:
+        client, http = _client(_handler)
+        await client.get_like_limit()
+        client.switch_session("+41000000001")
+        await client.get_like_limit()
+        await http.aclose()
+
+    asyncio.run(_run())
+    assert hits == ["/likelimit", "/likelimit"]
+
+
+def test_invalidate_like_limit_forces_refetch(sessions_dir):
+    hits: list[str] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.url.path)
+        return httpx.Response(200, json=_LIKE_LIMIT)
+
+    async def _run() -> None:
+        client, http = _client(_handler)
+        await client.get_like_limit()
+        await client.get_like_limit()
+        client.invalidate_like_limit()
+        await client.get_like_limit()
+        await http.aclose()
+
+    asyncio.run(_run())
+    assert hits == ["/likelimit", "/likelimit"]
+
+
+def test_token_refresh_for_new_identity_clears_cache(sessions_dir):
+    hits: list[str] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.url.path)
+        if request.url.path == "/auth/refresh":
+            expires = datetime.now(UTC) + timedelta(days=90)
+            return httpx.Response(
+                201,
+                json={
+                    "token": "t2",
+                    "identityId": "other",
+                    "expires": expires.isoformat(),
+                },
+            )
+        return httpx.Response(200, json=_LIKE_LIMIT)
+
+    async def _run() -> None:
+        client, http = _client(_handler)
+        client.hinge_token = "t1"
+        client.identity_id = "me"
+        client.auth_state = HingeClient.AUTH_AUTHENTICATED
+        client.hinge_token_expires = datetime.now(UTC) + timedelta(days=1)
+        await client.get_like_limit()
+        await client.ensure_fresh_token()
+        await client.get_like_limit()
+        await http.aclose()
+
+    asyncio.run(_run())
+    assert hits == ["/likelimit", "/auth/refresh", "/likelimit"]
+
+
+def test_conditional_get_returns_cached_model_on_304(sessions_dir):
+    seen: list[str | None] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"enums": {}}, headers={"ETag": '"v1"'})
+
+    async def _run() -> list[object]:
+        client, http = _client(_handler)
+        first = await client._get_model("/config/v3")
+        second = await client._get_model("/config/v3")
+        await http.aclose()
+        return [first, second]
+
+    first, second = asyncio.run(_run())
+    assert seen == [None, '"v1"']
+    assert second is first
+
+
+def test_conditional_cache_is_bounded_and_persists(tmp_path):
+    path = str(tmp_path / "validators")
+    cache = ConditionalCache(max_entries=2, persist_path=path)
+    for i in range(3):
+        cache.store(("GET", f"/p{i}", ()), {"ETag": f'"{i}"'}, b"%d" % i, int, i)
+    cache.store(("GET", "/plain", ()), {}, b"{}", json.loads, None)
+
+    assert len(cache) == 2
+    assert cache.get(("GET", "/p0", ())) is None
+
+    reloaded = ConditionalCache(max_entries=2, persist_path=path)
+    entry = reloaded.get(("GET", "/p2", ()))
+    assert entry is not None
+    assert entry.validators() == {"If-None-Match": '"2"'}
+    assert entry.parsed(int) == 2
+
+
+def test_conditional_cache_batches_saves_off_the_loop(tmp_path):
+    path = str(tmp_path / "validators")
+    cache = ConditionalCache(persist_path=path, save_delay=0.01)
+
+    async def _run() -> bool:
+        for i in range(10):
+            cache.store(("GET", f"/p{i}", ()), {"ETag": f'"{i}"'}, b"1", int, 1)
+        written_inline = os.path.exists(path)
+        await asyncio.sleep(0.1)
+        return written_inline
+
+    assert asyncio.run(_run()) is False
+    assert len(ConditionalCache(persist_path=path)) == 10
+
+
+def test_conditional_entries_are_per_parser_and_allowlisted(sessions_dir):
+    hits: list[str] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.headers.get("If-None-Match") or request.url.path)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"enums": {}}, headers={"ETag": '"v1"'})
+
+    async def _run() -> tuple[object, object]:
+        client, http = _client(_handler)
+        await client._get_model("/user/v2/public", params={"ids": "a"})
+        raw = await client._get_model("/config/v3", lambda body: body)
+        decoded = await client._get_model("/config/v3")
+        await http.aclose()
+        assert len(client._conditional) == 1
+        return raw, decoded
+
+    raw, decoded = asyncio.run(_run())
+    # The one-off batch lookup is never stored or revalidated.
+    assert hits == ["/user/v2/public", "/config/v3", '"v1"']
+    assert isinstance(raw, bytes)
+    assert decoded == {"enums": {}}
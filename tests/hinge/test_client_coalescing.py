@@ -0,0 +1,80 @@
+"""Tests for single-flight coalescing of HingeClient GETs."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from hinge.client import BASE_URL, HingeClient
+from hinge.transport.singleflight import SingleFlight
+
+_LIKE_LIMIT = {"likesLeft": 8, "superlikesLeft": 1}
+
+
+@pytest.fixture
+def sessions_dir(tmp_path, monkeypatch):
+    """Keep HingeClient session files out of the working tree."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_singleflight_shares_result_and_forgets_after():
+    calls = 0
+
+    async def _fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    async def _run() -> tuple[list[int], int, int]:
+        flight = SingleFlight()
+        first = await asyncio.gather(*(flight.do("k", _fetch) for _ in range(5)))
+        again = await flight.do("k", _fetch)
+        return list(first), again, flight.in_flight()
+
+    first, again, in_flight = asyncio.run(_run())
+    assert first == [1] * 5
+    assert again == 2
+    assert in_flight == 0
+
+
+def test_singleflight_propagates_errors_to_all_waiters():
+    async def _fail() -> int:
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    async def _run() -> list[object]:
+        flight = SingleFlight()
+        return await asyncio.gather(
+            flight.do("k", _fail),
+            flight.do("k", _fail),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(_run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_client_coalesces_identical_gets(sessions_dir):
+    hits: list[str] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        hits.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=_LIKE_LIMIT)
+
+    async def _run() -> list[object]:
+        http = httpx.AsyncClient(
+            base_url=BASE_URL,
+            transport=httpx.MockTransport(_handler),
+        )
+        client = HingeClient("+41000000000", client=http, cache_ttls={})
+        results = await asyncio.gather(*(client.get_like_limit() for _ in range(4)))
+        await client.get_like_limit()
+        await http.aclose()
+        return list(results)
+
+    results = asyncio.run(_run())
+    assert len(hits) == 2
+    assert all(r is results[0] for r in results)
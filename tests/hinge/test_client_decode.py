@@ -0,0 +1,29 @@
+"""Tests for the validate-from-bytes response parsers."""
+
+import json
+
+from hinge.client import _json_as, _type_adapter
+from hinge.models import RecommendationsResponse, UserProfileV2
+
+
+def test_type_adapters_are_cached_per_type():
+    assert _type_adapter(list[UserProfileV2]) is _type_adapter(list[UserProfileV2])
+
+
+def test_recommendations_parse_stamps_feed_origin():
+    raw = json.dumps(
+        {
+            "feeds": [
+                {
+                    "origin": "compatibles",
+                    "subjects": [
+                        {"subjectId": "s1", "ratingToken": "t1"},
+                        {"subjectId": "s2", "ratingToken": "t2", "origin": "x"},
+                    ],
+                },
+            ],
+        },
+    ).encode()
+
+    recs = _json_as(RecommendationsResponse)(raw)
+    assert [s.origin for s in recs.feeds[0].subjects] == ["compatibles", "x"]
@@ -0,0 +1,53 @@
+"""Tests for the route fan-out helpers."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from hinge.api.fanout import optional, optional_user_location
+
+
+async def _slow(value: int, delay: float) -> int:
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _boom() -> int:
+    raise RuntimeError("upstream 500")
+
+
+def test_optional_returns_value_default_on_timeout_and_error():
+    async def _run() -> list[int]:
+        return list(
+            await asyncio.gather(
+                optional(_slow(1, 0), default=0, name="ok"),
+                optional(_slow(2, 1), default=-1, name="slow", timeout=0.05),
+                optional(_boom(), default=-2, name="boom"),
+            ),
+        )
+
+    assert asyncio.run(_run()) == [1, -1, -2]
+
+
+def test_optional_calls_run_concurrently():
+    async def _run() -> float:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(
+            *(optional(_slow(i, 0.1), default=0, name="c") for i in range(3)),
+        )
+        return loop.time() - start
+
+    assert asyncio.run(_run()) < 0.25
+
+
+def test_optional_user_location():
+    container = MagicMock()
+    location = SimpleNamespace(latitude=47.37, longitude=8.54)
+    container._client.get_self_profile = AsyncMock(
+        return_value=SimpleNamespace(profile=SimpleNamespace(location=location)),
+    )
+    assert asyncio.run(optional_user_location(container)) == (47.37, 8.54)
+
+    container._client.get_self_profile = AsyncMock(side_effect=RuntimeError)
+    assert asyncio.run(optional_user_location(container)) == (None, None)
@@ -0,0 +1,68 @@
+"""Tests for latency tracking and hedged requests."""
+
+import asyncio
+
+from hinge.transport.hedge import LatencyTracker, hedged
+
+
+def test_latency_tracker_needs_min_samples():
+    tracker = LatencyTracker(window=100, min_samples=10)
+    for i in range(9):
+        tracker.observe("/content/v2/public", i / 100)
+    assert tracker.quantile("/content/v2/public") is None
+
+    for i in range(9, 100):
+        tracker.observe("/content/v2/public", i / 100)
+    assert tracker.quantile("/content/v2/public") == 0.94
+    assert tracker.quantile("/other") is None
+
+
+def test_hedge_fires_after_delay_and_first_copy_wins():
+    calls = 0
+    hedges = 0
+
+    async def _fetch() -> int:
+        nonlocal calls
+        calls += 1
+        attempt = calls
+        # The first copy stalls; the hedge answers quickly.
+        await asyncio.sleep(5 if attempt == 1 else 0.01)
+        return attempt
+
+    def _on_hedge() -> None:
+        nonlocal hedges
+        hedges += 1
+
+    result = asyncio.run(hedged(_fetch, 0.02, on_hedge=_on_hedge))
+
+    assert result == 2
+    assert calls == 2 and hedges == 1
+
+
+def test_no_hedge_without_baseline_or_when_fast():
+    calls = 0
+
+    async def _fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    assert asyncio.run(hedged(_fetch, None)) == "ok"
+    assert asyncio.run(hedged(_fetch, 1.0)) == "ok"
+    assert calls == 2
+
+
+def test_failed_copy_falls_back_to_the_other():
+    calls = 0
+
+    async def _fetch() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.03)
+            raise RuntimeError("upstream 502")
+        await asyncio.sleep(0.05)
+        return "hedge"
+
+    assert asyncio.run(hedged(_fetch, 0.01)) == "hedge"
@@ -0,0 +1,53 @@
+"""Tests for per-host connection pools."""
+
+import asyncio
+
+import httpx
+
+from hinge.transport.pools import PoolConfig, PooledTransport, http2_available
+
+
+def test_pool_config_maps_to_httpx():
+    cfg = PoolConfig(max_connections=7, max_keepalive=3, read_timeout=12.0)
+
+    assert cfg.limits().max_connections == 7
+    assert cfg.limits().max_keepalive_connections == 3
+    assert cfg.timeout().read == 12.0
+    assert cfg.timeout().connect == 5.0
+    # HTTP/2 is only negotiated when h2 is installed.
+    assert cfg.transport()._pool._http2 is http2_available()
+
+
+def test_pooled_transport_routes_by_host_with_host_timeouts():
+    seen: dict[str, dict] = {}
+
+    def _handler(name: str):
+        def _handle(request: httpx.Request) -> httpx.Response:
+            seen[name] = request.extensions["timeout"]
+            return httpx.Response(200)
+
+        return _handle
+
+    transport = PooledTransport(
+        {
+            "hinge.example": PoolConfig(read_timeout=30.0),
+            "sendbird.example": PoolConfig(read_timeout=15.0),
+        },
+    )
+    transport._pools = {
+        "hinge.example": httpx.MockTransport(_handler("hinge")),
+        "sendbird.example": httpx.MockTransport(_handler("sendbird")),
+    }
+    transport._default = httpx.MockTransport(_handler("default"))
+
+    async def _run() -> None:
+        async with httpx.AsyncClient(transport=transport, timeout=99.0) as c:
+            await c.get("https://hinge.example/user/v3")
+            await c.get("https://sendbird.example/v3/group_channels")
+            await c.get("https://other.example/")
+
+    asyncio.run(_run())
+
+    assert seen["hinge"]["read"] == 30.0
+    assert seen["sendbird"]["read"] == 15.0
+    assert seen["default"]["read"] == 99.0
@@ -0,0 +1,118 @@
+"""Tests for cross-caller batching of profile lookups."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from hinge.infrastructure.hinge.adapter import HingeApiAdapter
+from hinge.infrastructure.hinge.loader import BatchLoader
+from hinge.models import UserProfileV2
+from hinge.transport.governor import background_lane, current_lane
+
+
+def _recording_fetch(batches: list[list[str]]):
+    async def _fetch(keys: list[str]) -> dict[str, str]:
+        batches.append(keys)
+        await asyncio.sleep(0)
+        return {k: k.upper() for k in keys if k != "gone"}
+
+    return _fetch
+
+
+def test_concurrent_callers_share_deduplicated_batches():
+    batches: list[list[str]] = []
+    loader = BatchLoader(_recording_fetch(batches), max_batch=3, window=0.01)
+
+    async def _run() -> list[dict[str, str]]:
+        return await asyncio.gather(
+            loader.load_many(["a", "b"]),
+            loader.load_many(["b", "c", "d", "gone"]),
+            loader.load_many(["a"]),
+        )
+
+    first, second, third = asyncio.run(_run())
+
+    assert first == {"a": "A", "b": "B"}
+    assert second == {"b": "B", "c": "C", "d": "D"}
+    assert third == {"a": "A"}
+    # Five distinct keys → one full batch of three, then the remainder.
+    assert batches == [["a", "b", "c"], ["d", "gone"]]
+
+
+def test_failed_batch_raises_and_timeout_stops_waiting():
+    async def _fetch(keys: list[str]) -> dict[str, str]:
+        if "bad" in keys:
+            raise RuntimeError("upstream 500")
+        await asyncio.sleep(1)
+        return {k: k for k in keys}
+
+    loader = BatchLoader(_fetch, max_batch=1, window=0.0)
+
+    async def _run() -> dict[str, str]:
+        with pytest.raises(RuntimeError, match="upstream 500"):
+            await loader.load_many(["bad"])
+        return await loader.load_many(["slow"], timeout=0.01)
+
+    assert asyncio.run(_run()) == {}
+
+
+def test_batch_runs_in_interactive_lane_if_any_waiter_is_interactive():
+    lanes: dict[str, str] = {}
+
+    async def _fetch(keys: list[str]) -> dict[str, str]:
+        lanes[",".join(keys)] = current_lane()
+        return {k: k for k in keys}
+
+    loader = BatchLoader(_fetch, max_batch=10, window=0.01)
+
+    async def _background(keys: list[str]) -> dict[str, str]:
+        with background_lane():
+            return await loader.load_many(keys)
+
+    async def _run() -> None:
+        # The background caller arms the timer; an interactive caller joins.
+        first = asyncio.create_task(_background(["a"]))
+        await asyncio.sleep(0)
+        await asyncio.gather(first, loader.load_many(["b"]))
+        await _background(["c"])
+
+    asyncio.run(_run())
+
+    assert lanes == {"a,b": "interactive", "c": "background"}
+
+
+def test_get_profiles_quick_batches_overlapping_callers():
+    client = MagicMock()
+    client.fetch_prompts = AsyncMock(side_effect=RuntimeError("offline"))
+
+    async def _profiles_v2(ids: list[str]) -> list[UserProfileV2]:
+        return [
+            UserProfileV2.model_validate(
+                {
+                    "identityId": i,
+                    "profile": {
+                        "firstName": i.upper(),
+                        "age": 29,
+                        "location": {"name": "Zurich"},
+                    },
+                },
+            )
+            for i in ids
+        ]
+
+    client.get_profiles_v2 = AsyncMock(side_effect=_profiles_v2)
+    adapter = HingeApiAdapter(client)
+
+    async def _run():
+        return await asyncio.gather(
+            adapter.get_profiles_quick(["a", "b"]),
+            adapter.get_profiles_quick(["b", "c"]),
+        )
+
+    first, second = asyncio.run(_run())
+
+    client.get_profiles_v2.assert_awaited_once_with(["a", "b", "c"])
+    assert first["a"].first_name == "A"
+    assert second["c"].first_name == "C"
+    assert first["b"].first_name == second["b"].first_name == "B"
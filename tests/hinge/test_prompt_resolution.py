@@ -0,0 +1,97 @@
+"""Tests for incremental prompt-catalog resolution in the adapter."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from hinge.domain.models.profile import HingeProfile
+from hinge.infrastructure.hinge.adapter import HingeApiAdapter
+from hinge.models import ProfileContent, PromptsResponse
+
+
+def _content(user_id: str, *question_ids: str) -> ProfileContent:
+    return ProfileContent.model_validate(
+        {
+            "userId": user_id,
+            "content": {
+                "photos": [
+                    {"cdnId": "cdn", "contentId": f"p-{user_id}", "url": "u"},
+                ],
+                "answers": [
+                    {
+                        "contentId": f"{user_id}-{q}",
+                        "position": i,
+                        "questionId": q,
+                        "response": "answer",
+                        "transcriptionMetadata": {},
+                    }
+                    for i, q in enumerate(question_ids)
+                ],
+            },
+        },
+    )
+
+
+def _catalog(**texts: str) -> PromptsResponse:
+    return PromptsResponse.model_validate(
+        {
+            "prompts": [
+                {"id": pid, "prompt": text, "isSelectable": True, "isNew": True}
+                for pid, text in texts.items()
+            ],
+            "categories": [],
+        },
+    )
+
+
+def _adapter(client: MagicMock) -> HingeApiAdapter:
+    adapter = HingeApiAdapter(client, batch_concurrency=2)
+    adapter._prompt_lookup = {"q1": "Known prompt"}
+    return adapter
+
+
+def test_unknown_prompts_patched_with_one_shared_refresh():
+    client = MagicMock()
+    client.fetch_prompts = AsyncMock(
+        return_value=_catalog(q1="Known prompt", q2="New prompt"),
+    )
+    client.get_profile_content = AsyncMock(
+        side_effect=lambda ids: [_content(i, "q1", "q2") for i in ids],
+    )
+    adapter = _adapter(client)
+    profiles = [HingeProfile(subject_id=s, first_name=s) for s in "abcd"]
+
+    async def _run() -> None:
+        await asyncio.gather(
+            adapter.hydrate_profiles(profiles[:2], batch_size=1, force=True),
+            adapter.hydrate_profiles(profiles[2:], batch_size=1, force=True),
+        )
+
+    asyncio.run(_run())
+
+    client.fetch_prompts.assert_awaited_once()
+    assert client.get_profile_content.await_count == 4
+    for profile in profiles:
+        assert [p.question_text for p in profile.prompts] == [
+            "Known prompt",
+            "New prompt",
+        ]
+    assert adapter.unresolved_prompts == set()
+
+
+def test_refresh_is_throttled_and_ids_stay_tracked():
+    client = MagicMock()
+    client.fetch_prompts = AsyncMock(return_value=_catalog(q1="Known prompt"))
+    client.get_profile_content = AsyncMock(
+        side_effect=lambda ids: [_content(i, "q9") for i in ids],
+    )
+    adapter = _adapter(client)
+
+    a = HingeProfile(subject_id="a", first_name="A")
+    b = HingeProfile(subject_id="b", first_name="B")
+    asyncio.run(adapter.hydrate_profiles([a], force=True))
+    asyncio.run(adapter.hydrate_profiles([b], force=True))
+
+    # Still unknown after one refresh; the second batch doesn't refetch.
+    client.fetch_prompts.assert_awaited_once()
+    assert adapter.unresolved_prompts == {"q9"}
+    assert b.prompts[0].question_text == "Unknown Question"
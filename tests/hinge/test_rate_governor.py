@@ -0,0 +1,141 @@
+"""Tests for the adaptive upstream rate governor and its transport."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+
+from hinge.transport.governor import (
+    RateGovernor,
+    background_lane,
+    current_lane,
+    parse_retry_after,
+)
+from hinge.transport.http import GovernedTransport
+
+
+def test_parse_retry_after_seconds_and_date():
+    assert parse_retry_after("30") == 30.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    future = format_datetime(datetime.now(UTC) + timedelta(seconds=60), usegmt=True)
+    assert 55 <= parse_retry_after(future) <= 60
+
+
+def test_success_increases_rate_additively():
+    gov = RateGovernor(initial_rate=1.0, increase_step=0.1, max_rate=1.25)
+    gov.record(200)
+    assert gov.rate == 1.1
+    gov.record(200)
+    gov.record(200)
+    assert gov.rate == 1.25  # capped at max_rate
+
+
+def test_throttle_halves_rate_and_learns_ceiling():
+    gov = RateGovernor(initial_rate=2.0, decrease_factor=0.5)
+    gov.record(429, "10")
+    assert gov.rate == 1.0
+    assert gov.ceiling == 2.0
+    assert gov.throttled_count == 1
+    assert 9 < gov.cooldown_remaining() <= 10
+
+
+def test_probing_slows_near_learned_ceiling():
+    gov = RateGovernor(initial_rate=2.0, increase_step=0.5)
+    gov.record(429, "0")
+    gov.rate = 1.9  # within 10% of the 2.0 ceiling
+    gov.record(200)
+    assert round(gov.rate, 3) == 1.95
+
+
+def test_server_errors_do_not_move_rate():
+    gov = RateGovernor(initial_rate=1.0)
+    gov.record(503)
+    assert gov.rate == 1.0
+
+
+def test_acquire_spends_burst_then_waits():
+    async def _run() -> float:
+        gov = RateGovernor(initial_rate=5.0, max_rate=5.0, burst=2.0)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(3):
+            await gov.acquire()
+        return loop.time() - start
+
+    elapsed = asyncio.run(_run())
+    # Two tokens from the bucket, the third refills at 5/s (~0.2 s).
+    assert 0.15 <= elapsed < 0.5
+
+
+def test_transport_governs_only_hinge_host():
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        if request.url.host == "prod-api.hingeaws.net":
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200)
+
+    async def _run(gov: RateGovernor) -> None:
+        transport = GovernedTransport(
+            gov,
+            hosts={"prod-api.hingeaws.net"},
+            transport=httpx.MockTransport(_handler),
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://api-x.sendbird.com/v3/ping")
+            await client.get("https://prod-api.hingeaws.net/rec/v2")
+
+    gov = RateGovernor()
+    asyncio.run(_run(gov))
+    assert calls == ["api-x.sendbird.com", "prod-api.hingeaws.net"]
+    assert gov.throttled_count == 1
+
+
+def test_background_lane_is_context_scoped():
+    assert current_lane() == "interactive"
+    with background_lane():
+        assert current_lane() == "background"
+    assert current_lane() == "interactive"
+
+
+def test_background_keeps_reserve_for_interactive():
+    async def _run() -> tuple[bool, float]:
+        gov = RateGovernor(initial_rate=0.1, min_rate=0.1, burst=2.0)
+        loop = asyncio.get_running_loop()
+        with background_lane():
+            await gov.acquire()
+            # One token left — it is the interactive reserve.
+            try:
+                await asyncio.wait_for(gov.acquire(), timeout=0.1)
+                background_got_reserve = True
+            except TimeoutError:
+                background_got_reserve = False
+        start = loop.time()
+        await gov.acquire()
+        return background_got_reserve, loop.time() - start
+
+    background_got_reserve, interactive_wait = asyncio.run(_run())
+    assert background_got_reserve is False
+    assert interactive_wait < 0.05
+
+
+def test_background_yields_to_waiting_interactive():
+    order: list[str] = []
+
+    async def _take(gov: RateGovernor, lane: str) -> None:
+        await gov.acquire(lane)
+        order.append(lane)
+
+    async def _run() -> None:
+        gov = RateGovernor(initial_rate=20.0, burst=1.0, background_reserve=0.0)
+        await gov.acquire()  # drain the bucket
+        background = asyncio.create_task(_take(gov, "background"))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(_take(gov, "interactive"))
+        await asyncio.gather(background, interactive)
+
+    asyncio.run(_run())
+    assert order == ["interactive", "background"]
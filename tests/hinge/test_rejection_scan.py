@@ -0,0 +1,77 @@
+"""Tests for batched rejection classification."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from hinge.application.services.rejection_scan import (
+    _classify_rejections,
+    exhaust_feed,
+    scan_state,
+)
+from hinge.infrastructure.hinge.adapter import HingeApiAdapter
+
+
+def test_classify_uses_full_batches_and_maps_missing_to_gone():
+    ids = {f"s{i:02d}" for i in range(45)}
+    calls: list[list[str]] = []
+
+    async def _active(chunk: list[str]) -> set[str]:
+        calls.append(chunk)
+        if "s40" in chunk:
+            raise RuntimeError("upstream 500")
+        # Every third subject has deleted their account.
+        return {sid for sid in chunk if int(sid[1:]) % 3}
+
+    container = MagicMock()
+    container.hinge_api.get_active_subject_ids = AsyncMock(side_effect=_active)
+
+    result = asyncio.run(_classify_rejections(container, ids))
+
+    assert [len(c) for c in calls] == [20, 20, 5]
+    assert result["s01"] == "passed"
+    assert result["s03"] == "gone"
+    # The failed batch stays unclassified, to be retried after the next scan.
+    assert result.keys() == ids - {f"s{i}" for i in range(40, 45)}
+
+
+def test_active_subject_ids_reuses_adapter_id_matching():
+    client = MagicMock()
+    # identity ids differ from the requested subject ids; counts agree.
+    client.get_profiles_v2 = AsyncMock(
+        return_value=[
+            SimpleNamespace(identity_id="x-a"),
+            SimpleNamespace(identity_id="x-b"),
+        ],
+    )
+    adapter = HingeApiAdapter(client)
+
+    assert asyncio.run(adapter.get_active_subject_ids(["a", "b"])) == {"a", "b"}
+
+
+def test_scan_skips_classification_while_previous_job_runs():
+    container = MagicMock()
+    container.hinge_api.get_recommendations = AsyncMock(return_value=[])
+    container.hinge_api.repeat_profiles = AsyncMock(return_value=None)
+    container.hinge_api.get_active_subject_ids = AsyncMock(return_value=set())
+    uow = container.uow.__enter__.return_value
+    uow.profiles.get_untyped_rejections.return_value = {"s1"}
+
+    async def _run() -> None:
+        previous = asyncio.create_task(asyncio.sleep(10))
+        scan_state.classification = previous
+        await exhaust_feed(container)
+        assert scan_state.classification is previous
+        previous.cancel()
+        await asyncio.gather(previous, return_exceptions=True)
+
+        await exhaust_feed(container)
+        assert scan_state.classification is not previous
+        await scan_state.classification
+
+    try:
+        asyncio.run(_run())
+    finally:
+        scan_state.classification = None
+
+    container.hinge_api.get_active_subject_ids.assert_awaited_once_with(["s1"])
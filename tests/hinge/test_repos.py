@@ -1,4 +1,4 @@
-"""Unit tests for the four SQL repositories: profile, decision, session, prompts."""
+"""Unit tests for the SQL repositories: profile, decision, session, prompts, tokens."""
 
 from datetime import UTC, datetime, timedelta
 
@@ -7,8 +7,17 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from hinge.domain.models.decision import HingeDecision
-from hinge.domain.models.profile import HingeProfile
+from hinge.domain.models.profile import (
+    HingeProfile,
+    ProfileDateIdea,
+    ProfilePhoto,
+    ProfilePoll,
+    ProfilePrompt,
+    ProfileVideoDetail,
+    ProfileVideoPrompt,
+)
 from hinge.domain.models.prompt import HingePrompt
+from hinge.domain.models.rating_token import HingeRatingToken
 from hinge.domain.models.swipe_session import HingeSwipeSession
 from hinge.infrastructure.db.mappers import start_hinge_mappers
 from hinge.infrastructure.db.metadata import metadata
@@ -162,6 +171,66 @@ def test_profile_untyped_rejections(uow_factory):
         assert uow.profiles.get_untyped_rejections() == {"b"}
 
 
+def test_profile_content_save_and_bulk_load(uow_factory):
+    """save_content round-trips through the child tables; load_content attaches."""
+    profile = HingeProfile(
+        subject_id="c1",
+        first_name="C",
+        photos=[
+            ProfilePhoto(
+                content_id="p1",
+                cdn_id="cdn1",
+                url="https://img/1.jpg",
+                videos=[ProfileVideoDetail(url="https://v/1.mp4", quality="hd")],
+            ),
+            ProfilePhoto(content_id="p2", cdn_id="cdn2", url="https://img/2.jpg"),
+        ],
+        prompts=[ProfilePrompt(question_id="q1", question_text="Q", response="A")],
+        polls=[
+            ProfilePoll(
+                content_id="pl",
+                question_id="q2",
+                question_text="P",
+                options=["x", "y"],
+            ),
+        ],
+        video_prompt=ProfileVideoPrompt(content_id="vp", video_url="https://v/2"),
+        date_ideas=[ProfileDateIdea(content_id="d1", options=["picnic"])],
+    )
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        uow.profiles.add(profile)
+        uow.profiles.add(HingeProfile(subject_id="c2", first_name="Empty"))
+        uow.profiles.save_content([profile])
+        uow.commit()
+
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        loaded = uow.profiles.get_undecided()
+        uow.profiles.load_content(loaded)
+
+    by_id = {p.subject_id: p for p in loaded}
+    c1 = by_id["c1"]
+    assert [p.content_id for p in c1.photos] == ["p1", "p2"]
+    assert c1.photos[0].videos == [
+        ProfileVideoDetail(url="https://v/1.mp4", quality="hd"),
+    ]
+    assert c1.prompts == profile.prompts
+    assert c1.polls[0].options == ["x", "y"]
+    assert c1.video_prompt == profile.video_prompt
+    assert c1.date_ideas == profile.date_ideas
+    assert by_id["c2"].photos == []
+    assert by_id["c2"].video_prompt is None
+
+    # Saving again replaces rather than appends.
+    profile.photos = profile.photos[:1]
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        uow.profiles.save_content([profile])
+        uow.commit()
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        reloaded = [uow.profiles.get("c1")]
+        uow.profiles.load_content(reloaded)
+    assert len(reloaded[0].photos) == 1
+
+
 # ---------------------------------------------------------------------------
 # HingeDecisionRepo
 # ---------------------------------------------------------------------------
@@ -308,3 +377,40 @@ def test_prompts_bulk_upsert_empty_is_noop(uow_factory):
     with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
         assert uow.prompts.bulk_upsert([]) == 0
         assert uow.prompts.count() == 0
+
+
+# ---------------------------------------------------------------------------
+# HingeRatingTokenRepo
+# ---------------------------------------------------------------------------
+
+
+def test_rating_tokens_upsert_lookup_and_expiry(uow_factory):
+    """Latest token wins; expired tokens are invisible and purgeable."""
+    past = datetime.now(UTC) - timedelta(hours=1)
+    future = datetime.now(UTC) + timedelta(hours=1)
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        n = uow.tokens.upsert_many(
+            [
+                HingeRatingToken("s1", "old"),
+                HingeRatingToken("s1", "new"),
+                HingeRatingToken("s2", "t2", "standouts", expires_at=future),
+                HingeRatingToken("s3", "t3", "standouts", expires_at=past),
+                HingeRatingToken("s4", ""),
+            ],
+        )
+        uow.commit()
+        assert n == 3
+
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        s1 = uow.tokens.get("s1")
+        assert s1 is not None
+        assert (s1.rating_token, s1.origin) == ("new", "discover")
+        assert uow.tokens.get("s3") is None
+        assert set(uow.tokens.get_many(["s1", "s2", "s3", "s4"])) == {"s1", "s2"}
+        assert uow.tokens.purge_expired() == 1
+        uow.tokens.delete("s1")
+        uow.commit()
+
+    with HingeSqlAlchemyUnitOfWork(uow_factory) as uow:
+        assert uow.tokens.get("s1") is None
+        assert uow.tokens.get_many([]) == {}
@@ -0,0 +1,153 @@
+"""Tests for the declarative retry policy and RetryTransport."""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from hinge.client import BASE_URL, HingeClient
+from hinge.transport import retry
+from hinge.transport.governor import RateGovernor
+from hinge.transport.retry import NO_RETRY, RetryPolicy, RetryTransport
+
+_HOST = httpx.URL(BASE_URL).host
+
+
+@pytest.fixture
+def sessions_dir(tmp_path, monkeypatch):
+    """Keep HingeClient session files out of the working tree."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _response(status: int, **headers: str) -> httpx.Response:
+    return httpx.Response(status, headers=headers)
+
+
+def test_policy_delay_rules():
+    policy = RetryPolicy(max_attempts=3, base_delay=1.0, max_retry_after=10.0)
+
+    assert 0 <= policy.delay(1, _response(503)) <= 1.0
+    assert 0 <= policy.delay(2, None) <= 2.0
+    assert policy.delay(1, _response(429, **{"Retry-After": "4"})) == 4.0
+    assert policy.delay(1, _response(429, **{"Retry-After": "60"})) is None
+    assert policy.delay(1, _response(404)) is None
+    assert policy.delay(3, _response(503)) is None
+    assert NO_RETRY.delay(1, _response(503)) is None
+
+
+def _transport(
+    statuses: list[int],
+    policy: RetryPolicy,
+) -> tuple[RetryTransport, list[str]]:
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(statuses[min(len(calls), len(statuses)) - 1])
+
+    transport = RetryTransport(
+        httpx.MockTransport(_handler),
+        policy_for=lambda _request: policy,
+        hosts={_HOST},
+    )
+    return transport, calls
+
+
+def test_transport_absorbs_transient_errors():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.001)
+    transport, calls = _transport([502, 503, 200], policy)
+
+    async def _run() -> int:
+        async with httpx.AsyncClient(base_url=BASE_URL, transport=transport) as c:
+            return (await c.get("/likelimit")).status_code
+
+    assert asyncio.run(_run()) == 200
+    assert len(calls) == 3
+
+
+def test_transport_gives_up_after_max_attempts():
+    transport, calls = _transport([500], RetryPolicy(max_attempts=2, base_delay=0))
+
+    async def _run() -> int:
+        async with httpx.AsyncClient(base_url=BASE_URL, transport=transport) as c:
+            return (await c.get("/likelimit")).status_code
+
+    assert asyncio.run(_run()) == 500
+    assert len(calls) == 2
+
+
+def test_client_policy_lookup(sessions_dir):
+    client = HingeClient("+41000000000", retry_policy=RetryPolicy(max_attempts=4))
+
+    def _policy(method: str, path: str) -> RetryPolicy:
+        return client.retry_policy_for(httpx.Request(method, BASE_URL + path))
+
+    assert _policy("GET", "/user/v3").max_attempts == 4
+    assert _policy("POST", "/rec/v2").max_attempts == 4
+    assert _policy("POST", "/rate/v2/initiate") is NO_RETRY
+    assert 401 in _policy("GET", "/likelimit").retry_statuses
+    asyncio.run(client.client.aclose())
+
+
+@pytest.mark.parametrize("failure", ["503", "connect"])
+def test_auth_refresh_is_attempted_once(sessions_dir, failure):
+    client = HingeClient("+41000000000", retry_policy=RetryPolicy(max_attempts=4))
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if failure == "connect":
+            raise httpx.ConnectError("connection reset", request=request)
+        return httpx.Response(503)
+
+    transport = RetryTransport(
+        httpx.MockTransport(_handler),
+        policy_for=client.retry_policy_for,
+        hosts={_HOST},
+    )
+
+    async def _run() -> None:
+        async with httpx.AsyncClient(base_url=BASE_URL, transport=transport) as c:
+            if failure == "connect":
+                with pytest.raises(httpx.ConnectError):
+                    await c.get("/auth/refresh")
+            else:
+                assert (await c.get("/auth/refresh")).status_code == 503
+        await client.client.aclose()
+
+    asyncio.run(_run())
+    assert calls == ["/auth/refresh"]
+
+
+def test_429_without_retry_after_waits_out_default_cooldown(monkeypatch):
+    governor = RateGovernor()
+    policy = RetryPolicy()
+    waits: list[float] = []
+
+    async def _sleep(seconds: float) -> None:
+        waits.append(seconds)
+
+    monkeypatch.setattr(retry, "asyncio", SimpleNamespace(sleep=_sleep))
+    statuses = [429, 200]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        governor.record(status)
+        return httpx.Response(status)
+
+    transport = RetryTransport(
+        httpx.MockTransport(_handler),
+        policy_for=lambda _request: policy,
+        hosts={_HOST},
+        governor=governor,
+    )
+
+    async def _run() -> int:
+        async with httpx.AsyncClient(base_url=BASE_URL, transport=transport) as c:
+            return (await c.get("/rec/v2")).status_code
+
+    assert asyncio.run(_run()) == 200
+    assert len(waits) == 1
+    assert governor.default_cooldown - 1 < waits[0] <= policy.max_retry_after
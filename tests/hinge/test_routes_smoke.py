@@ -18,19 +18,24 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from hinge.api.deps import (
+    STALE_HEADER,
     get_hinge_container,
     require_hinge_auth,
     set_hinge_container,
 )
 from hinge.api.error_handlers import register_hinge_error_handlers
+from hinge.api.recommendations import reset_account_states
 from hinge.api.router import router as hinge_router
 from hinge.bootstrap import HingeContainer
 from hinge.client import HingeClient
 from hinge.domain.models.like_limit import HingeLikeLimit
 from hinge.domain.models.profile import HingeProfile
+from hinge.domain.models.rating_token import HingeRatingToken
+from hinge.error import HingeUpstreamUnavailableError
 from hinge.infrastructure.db.mappers import start_hinge_mappers
 from hinge.infrastructure.db.metadata import metadata
 from hinge.infrastructure.db.unit_of_work import HingeSqlAlchemyUnitOfWork
+from hinge.transport.governor import RateGovernor
 
 
 # ---------------------------------------------------------------------------
@@ -60,12 +65,14 @@ def _make_container() -> HingeContainer:
     fake_client.identity_id = "id-1"
     fake_client.sendbird_jwt = "sb-jwt"
     fake_client.phone_number = "+41760000000"
-    fake_client.recommendations = {}
     fake_client.feed_exhausted = False
+    fake_client.governor = RateGovernor()
     fake_client._pending_email_2fa = None
     fake_client.ensure_fresh_token = AsyncMock(return_value=None)
     fake_client.check_session_health = AsyncMock(return_value=None)
     fake_client.list_sessions = MagicMock(return_value=[])
+    fake_client.upstream_degraded = MagicMock(return_value=False)
+    fake_client.breaker_snapshots = MagicMock(return_value={})
 
     fake_adapter = AsyncMock()
     fake_scorer = MagicMock()
@@ -241,6 +248,7 @@ def test_analytics_rejection_scan_status(client: TestClient) -> None:
     assert r.status_code == 200
     body = r.json()
     assert isinstance(body, dict)
+    assert body["rate_governor"]["throttled_count"] == 0
 
 
 def test_analytics_decisions_lists_with_profiles(
@@ -286,6 +294,102 @@ def test_get_recommendations_passthrough(
     assert r.status_code in {200, 503}
 
 
+def test_get_recommendations_stale_ok_serves_from_db(
+    client: TestClient,
+    container: HingeContainer,
+) -> None:
+    """?stale_ok=true renders the stored queue and flags revalidation."""
+    with container.uow as uow:
+        uow.profiles.add(HingeProfile(subject_id="s1", first_name="Stale"))
+        uow.commit()
+    container.hinge_api.refresh_and_hydrate = AsyncMock(return_value=[])
+    r = client.get("/api/v1/hinge/recommendations/?stale_ok=true")
+    assert r.status_code == 200
+    body = r.json()
+    assert body["revalidating"] is True
+    assert [e["subject_id"] for e in body["encounters"]] == ["s1"]
+
+
+def test_get_recommendations_degraded_skips_upstream(
+    client: TestClient,
+    container: HingeContainer,
+) -> None:
+    """An open Hinge breaker serves the DB queue flagged stale, no upstream."""
+    with container.uow as uow:
+        uow.profiles.add(HingeProfile(subject_id="s1", first_name="Stale"))
+        uow.commit()
+    container._client.upstream_degraded = MagicMock(return_value=True)
+    container.hinge_api.refresh_and_hydrate = AsyncMock(return_value=[])
+    r = client.get("/api/v1/hinge/recommendations/?refresh=true")
+    assert r.status_code == 200
+    assert r.headers[STALE_HEADER] == "true"
+    body = r.json()
+    assert body["revalidating"] is False
+    assert [e["subject_id"] for e in body["encounters"]] == ["s1"]
+    container.hinge_api.get_recommendations.assert_not_called()
+    container.hinge_api.refresh_and_hydrate.assert_not_called()
+
+
+def test_get_recommendations_breaker_trip_mid_revalidation_flags_stale(
+    client: TestClient,
+    container: HingeContainer,
+) -> None:
+    """A breaker opening during revalidation serves the DB queue flagged stale."""
+    with container.uow as uow:
+        uow.profiles.add(HingeProfile(subject_id="s1", first_name="Stale"))
+        uow.commit()
+    container.hinge_api.refresh_and_hydrate = AsyncMock(
+        side_effect=HingeUpstreamUnavailableError("prod-api.hingeaws.net", 30.0),
+    )
+    r = client.get("/api/v1/hinge/recommendations/")
+    assert r.status_code == 200
+    assert r.headers[STALE_HEADER] == "true"
+    assert [e["subject_id"] for e in r.json()["encounters"]] == ["s1"]
+
+
+def test_stale_recommendations_do_not_leak_across_accounts(
+    client: TestClient,
+    container: HingeContainer,
+) -> None:
+    """Limits remembered for one account are not served after a switch."""
+    reset_account_states()
+    container._client.get_standouts_v3 = AsyncMock(return_value=None)
+    container.hinge_api.refresh_and_hydrate = AsyncMock(return_value=[])
+    container.hinge_api.get_like_limit = AsyncMock(
+        return_value=HingeLikeLimit(likes_left=5, superlikes_left=1),
+    )
+    assert client.get("/api/v1/hinge/recommendations/").json()["likes_left"] == 5
+
+    container._client.identity_id = "id-2"
+    r = client.post(
+        "/api/v1/hinge/auth/sessions/switch",
+        json={"phone_number": "+41760000001"},
+    )
+    assert r.status_code == 200
+    container.hinge_api.get_like_limit = AsyncMock(side_effect=RuntimeError("x"))
+    r = client.get("/api/v1/hinge/recommendations/?stale_ok=true")
+    assert r.json()["likes_left"] is None
+
+
+def test_skip_resolves_token_from_store(
+    client: TestClient,
+    container: HingeContainer,
+) -> None:
+    """POST /recommendations/{id}/skip spends the stored rating token."""
+    with container.uow as uow:
+        uow.tokens.upsert_many([HingeRatingToken("s1", "tok-1", "discover")])
+        uow.commit()
+    container.hinge_api.skip = AsyncMock(return_value=None)
+
+    r = client.post("/api/v1/hinge/recommendations/s1/skip")
+    assert r.status_code == 200
+    assert r.json()["success"] is True
+    container.hinge_api.skip.assert_awaited_once_with("s1", "tok-1", "discover")
+
+    r = client.post("/api/v1/hinge/recommendations/unknown/skip")
+    assert r.json()["success"] is False
+
+
 def test_recommendations_recycle(
     client: TestClient,
     container: HingeContainer,